@@ -0,0 +1,50 @@
+import os
+import pandas as pd
+from utils.dataframe_utils import prepare_dataframe
+
+DEFAULT_CHUNK_SIZE = 50000  # Filas por bloque en la lectura por bloques
+
+
+class CsvChunkReader:
+    """
+    Lee un archivo CSV en bloques de tamaño fijo para que el consumo de memoria dependa
+    del tamaño del bloque y no del tamaño del archivo.
+    """
+
+    def __init__(self, file_name, delimiter, chunk_size=DEFAULT_CHUNK_SIZE, encoding="utf-8"):
+        """
+        Inicializa el lector por bloques.
+        :param file_name: Ruta del archivo CSV.
+        :param delimiter: Delimitador detectado del CSV.
+        :param chunk_size: Cantidad de filas por bloque.
+        :param encoding: Codificación del archivo.
+        """
+        self.file_name = file_name
+        self.delimiter = delimiter
+        self.chunk_size = chunk_size
+        self.encoding = encoding
+        self.total_bytes = os.path.getsize(file_name)
+
+    def read_preview(self):
+        """
+        Lee solo el primer bloque del archivo, usado para mostrar columnas y validar en la vista.
+        :return: DataFrame normalizado con las primeras filas.
+        """
+        preview = pd.read_csv(
+            self.file_name, delimiter=self.delimiter, encoding=self.encoding, nrows=self.chunk_size
+        )
+        return prepare_dataframe(preview)
+
+    def __iter__(self):
+        """
+        Recorre el archivo bloque a bloque. El siguiente bloque no se lee hasta que el consumidor
+        termina de procesar el actual.
+        :return: Generador de tuplas (DataFrame normalizado del bloque, bytes leídos hasta el momento).
+        """
+        # Se abre en modo binario para que `tell()` informe los bytes consumidos por el parser
+        with open(self.file_name, "rb") as handle:
+            reader = pd.read_csv(
+                handle, delimiter=self.delimiter, encoding=self.encoding, chunksize=self.chunk_size
+            )
+            for chunk in reader:
+                yield prepare_dataframe(chunk), min(handle.tell(), self.total_bytes)
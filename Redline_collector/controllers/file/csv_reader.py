@@ -0,0 +1,108 @@
+import os
+import time
+
+import pandas as pd
+
+from utils.module_utils import is_available
+
+ARROW_MIN_BYTES = 8 * 1024 * 1024  # Desde este tamaño se usa pyarrow.csv, si está instalado
+
+ENGINE_PANDAS = "pandas"    # Parser C de pandas (un solo hilo)
+ENGINE_PYARROW = "pyarrow"  # pyarrow.csv sobre el archivo mapeado en memoria, en paralelo
+
+
+class CsvReader:
+    """
+    Lee un archivo CSV completo con el dialecto detectado por `csv.Sniffer`.
+    Los archivos grandes se leen con pyarrow.csv si está instalado: el archivo se mapea en memoria y
+    los bloques se interpretan en paralelo en todos los núcleos; las columnas quedan respaldadas por
+    Arrow (`pd.ArrowDtype`). Los archivos chicos, o si pyarrow no está disponible o no puede
+    interpretar el archivo, se leen con el parser de pandas.
+    Cada lectura registra el tiempo de sus etapas en `timings`.
+    """
+
+    def __init__(self, file_name, dialect, encoding="utf-8", engine=None):
+        """
+        Inicializa el lector.
+        :param file_name: Ruta del archivo CSV.
+        :param dialect: Dialecto detectado con `csv.Sniffer` (se usa su delimitador).
+        :param encoding: Codificación del archivo.
+        :param engine: Motor a usar; por defecto se elige con `choose_engine`.
+        """
+        self.file_name = file_name
+        self.dialect = dialect
+        self.encoding = encoding
+        self.file_size = os.path.getsize(file_name)
+        self.engine = engine or self.choose_engine(self.file_size)
+        self.timings = {}  # Etapa -> segundos de la última lectura
+
+    @staticmethod
+    def choose_engine(file_size):
+        """
+        Elige el motor de lectura según el tamaño del archivo y los motores instalados.
+        :param file_size: Tamaño del archivo en bytes.
+        :return: Nombre del motor.
+        """
+        if file_size >= ARROW_MIN_BYTES and is_available("pyarrow"):
+            return ENGINE_PYARROW
+        return ENGINE_PANDAS
+
+    def read(self):
+        """
+        Lee el archivo completo.
+        :return: DataFrame con los datos del archivo.
+        """
+        if self.engine == ENGINE_PYARROW:
+            try:
+                return self._read_pyarrow()
+            except Exception as e:
+                # Por ejemplo, una columna cuyo tipo inferido en el primer bloque no sirve para los siguientes
+                print(f"No se pudo leer {self.file_name} con pyarrow, se usa pandas: {e}")
+                self.engine = ENGINE_PANDAS
+
+        start = time.perf_counter()
+        dataframe = pd.read_csv(self.file_name, delimiter=self.dialect.delimiter, encoding=self.encoding)
+        self.timings["parse"] = time.perf_counter() - start
+        return dataframe
+
+    def _read_pyarrow(self):
+        """
+        Lee el archivo con pyarrow.csv en varios hilos, sobre el archivo mapeado en memoria.
+        Las columnas con aspecto de fecha u hora se leen como texto, igual que con pandas, para
+        que la validación y la importación reciban el valor escrito en el archivo.
+        :return: DataFrame con columnas `pd.ArrowDtype`.
+        """
+        import pyarrow as pa
+        from pyarrow import csv
+
+        read_options = csv.ReadOptions(use_threads=True, encoding=self.encoding)
+        parse_options = csv.ParseOptions(delimiter=self.dialect.delimiter)
+
+        start = time.perf_counter()
+        with pa.memory_map(self.file_name, "r") as source:
+            # El esquema inferido en el primer bloque indica qué columnas se leerían como fechas
+            schema_options = csv.ReadOptions(use_threads=False, encoding=self.encoding)
+            schema = csv.open_csv(source, read_options=schema_options, parse_options=parse_options).schema
+        if len(set(schema.names)) != len(schema.names):
+            # pandas renombra los encabezados repetidos ("A", "A.1"); pyarrow los conservaría iguales
+            raise ValueError("El archivo tiene encabezados repetidos.")
+        text_types = {field.name: pa.string() for field in schema if pa.types.is_temporal(field.type)}
+        convert_options = csv.ConvertOptions(column_types=text_types, strings_can_be_null=True)
+
+        opened = time.perf_counter()
+        with pa.memory_map(self.file_name, "r") as source:
+            table = csv.read_csv(source, read_options=read_options, parse_options=parse_options,
+                                 convert_options=convert_options)
+        parsed = time.perf_counter()
+        dataframe = table.to_pandas(types_mapper=pd.ArrowDtype)
+        self.timings["schema"] = opened - start
+        self.timings["parse"] = parsed - opened
+        self.timings["frame"] = time.perf_counter() - parsed
+        return dataframe
+
+    def timings_text(self):
+        """
+        Resume el motor y los tiempos por etapa de la última lectura.
+        """
+        stages = ", ".join(f"{stage}={seconds:.2f}s" for stage, seconds in self.timings.items())
+        return f"{os.path.basename(self.file_name)} ({self.file_size / 1024 / 1024:.1f} MB) motor={self.engine}: {stages}"
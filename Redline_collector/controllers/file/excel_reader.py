@@ -0,0 +1,123 @@
+import os
+import time
+
+import pandas as pd
+
+from utils.module_utils import is_available
+
+SMALL_FILE_BYTES = 2 * 1024 * 1024  # Hasta este tamaño se usa openpyxl completo (más compatible)
+
+ENGINE_OPENPYXL = "openpyxl"                    # openpyxl en modo DOM a través de pandas
+ENGINE_OPENPYXL_READ_ONLY = "openpyxl_read_only"  # openpyxl en modo de solo lectura, fila a fila
+ENGINE_CALAMINE = "calamine"                    # Motor nativo (python-calamine) a través de pandas
+
+
+class ExcelReader:
+    """
+    Lee libros .xlsx con el motor más rápido disponible según el tamaño del archivo:
+    los archivos chicos se leen con openpyxl completo; los grandes, con calamine si está instalado
+    o, si no, con openpyxl en modo de solo lectura, que recorre las filas sin armar el árbol del libro.
+    Cada lectura registra el tiempo de sus etapas en `timings` para comparar los motores.
+    """
+
+    def __init__(self, file_name, engine=None):
+        """
+        Inicializa el lector.
+        :param file_name: Ruta del archivo .xlsx.
+        :param engine: Motor a usar; por defecto se elige con `choose_engine`.
+        """
+        self.file_name = file_name
+        self.file_size = os.path.getsize(file_name)
+        self.engine = engine or self.choose_engine(self.file_size)
+        self.timings = {}  # Etapa -> segundos de la última operación
+
+    @staticmethod
+    def choose_engine(file_size):
+        """
+        Elige el motor de lectura según el tamaño del archivo y los motores instalados.
+        :param file_size: Tamaño del archivo en bytes.
+        :return: Nombre del motor.
+        """
+        if file_size <= SMALL_FILE_BYTES:
+            return ENGINE_OPENPYXL
+        if is_available("python_calamine"):
+            return ENGINE_CALAMINE
+        return ENGINE_OPENPYXL_READ_ONLY
+
+    def read_sheet(self, sheet_name=0):
+        """
+        Lee una hoja completa usando la primera fila como encabezado.
+        :param sheet_name: Nombre o posición de la hoja.
+        :return: DataFrame con los datos de la hoja.
+        """
+        if self.engine == ENGINE_OPENPYXL_READ_ONLY:
+            return self._read_sheet_read_only(sheet_name)
+
+        start = time.perf_counter()
+        with pd.ExcelFile(self.file_name, engine=self.engine) as excel_file:
+            opened = time.perf_counter()
+            dataframe = pd.read_excel(excel_file, sheet_name=sheet_name)
+        self.timings["open"] = opened - start
+        self.timings["parse"] = time.perf_counter() - opened
+        return dataframe
+
+    def _open_read_only(self):
+        """
+        Abre el libro con openpyxl en modo de solo lectura y con los valores calculados de las fórmulas.
+        """
+        from openpyxl import load_workbook
+        return load_workbook(self.file_name, read_only=True, data_only=True)
+
+    def _read_sheet_read_only(self, sheet_name):
+        """
+        Lee una hoja fila a fila con openpyxl en modo de solo lectura.
+        :param sheet_name: Nombre o posición de la hoja.
+        :return: DataFrame con los datos de la hoja.
+        """
+        start = time.perf_counter()
+        workbook = self._open_read_only()
+        try:
+            opened = time.perf_counter()
+            worksheet = workbook.worksheets[sheet_name] if isinstance(sheet_name, int) else workbook[sheet_name]
+            rows = worksheet.iter_rows(values_only=True)
+            header = next(rows, ())
+            records = list(rows)
+            parsed = time.perf_counter()
+        finally:
+            workbook.close()
+
+        width = max([len(header)] + [len(record) for record in records])
+        dataframe = pd.DataFrame.from_records(records, columns=self.header_names(header, width))
+        self.timings["open"] = opened - start
+        self.timings["parse"] = parsed - opened
+        self.timings["frame"] = time.perf_counter() - parsed
+        return dataframe
+
+    @staticmethod
+    def header_names(header, width):
+        """
+        Arma los nombres de las columnas como `pd.read_excel`: las celdas vacías se nombran
+        "Unnamed: n" y los nombres repetidos reciben el sufijo ".1", ".2", etc.
+        :param header: Valores de la primera fila.
+        :param width: Cantidad de columnas de la hoja.
+        :return: Lista de nombres de columnas.
+        """
+        names = []
+        seen = {}
+        for position in range(width):
+            value = header[position] if position < len(header) else None
+            name = f"Unnamed: {position}" if value is None or value == "" else value
+            if name in seen:
+                seen[name] += 1
+                name = f"{name}.{seen[name]}"
+            else:
+                seen[name] = 0
+            names.append(name)
+        return names
+
+    def timings_text(self):
+        """
+        Resume el motor y los tiempos por etapa de la última lectura.
+        """
+        stages = ", ".join(f"{stage}={seconds:.2f}s" for stage, seconds in self.timings.items())
+        return f"{os.path.basename(self.file_name)} ({self.file_size / 1024 / 1024:.1f} MB) motor={self.engine}: {stages}"
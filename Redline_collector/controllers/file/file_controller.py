@@ -1,5 +1,14 @@
+import os
+import time
+
 import pandas as pd
 from csv import Sniffer
+from controllers.file.csv_chunk_reader import CsvChunkReader
+from controllers.file.csv_reader import CsvReader
+from controllers.file.excel_reader import ExcelReader
+from controllers.file.sheet_cache import SheetCache
+from controllers.file.workbook_inspector import WorkbookInspector
+from utils.dataframe_utils import compact_dataframe, memory_usage
 from PyQt5.QtCore import pyqtSignal, QObject
 from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel, QComboBox, QPushButton
 
@@ -13,46 +22,94 @@ class FileController(QObject):
     def __init__(self):
         super().__init__()
         self.dataframe = None  # Inicialmente no hay `DataFrame`
+        self.chunk_reader = None  # Lector por bloques cuando el CSV se carga en modo streaming
+        self.prepared_dirty = True  # Indica que `dataframe` cambió y hay que volver a compactarlo
+        self.memory_report = None  # (bytes como se leyó, bytes compactos) del `DataFrame` cargado
+        self.last_timings = {}  # Motor (o "cache") y segundos por etapa de la última lectura de Excel o CSV
 
-    def load_file(self, file_name, selected_sheet=None):
+    def load_file(self, file_name, selected_sheet=None, streaming=False):
+        """
+        Carga un archivo .xls, .xlsx o .csv.
+        :param file_name: Ruta del archivo.
+        :param selected_sheet: Hoja a cargar en archivos con varias hojas.
+        :param streaming: Si es True y el archivo es CSV, no se carga completo: se conserva solo el
+                          primer bloque como vista previa y la importación lee el resto por bloques.
+        """
+        self.chunk_reader = None
+        # La normalización (nulos, filas vacías, tipos compactos) se hace una sola vez en `get_dataframe`
+        self.prepared_dirty = True
         try:
             # Intentar cargar el archivo según su extensión
-            if file_name.endswith(".xls"):
-                self.dataframe = pd.read_excel(file_name, engine="xlrd")  # `.xls` requiere `xlrd`
-            elif file_name.endswith(".xlsx"):
-                with pd.ExcelFile(file_name, engine="openpyxl") as excel_file:
-                    if len(excel_file.sheet_names) > 1 and selected_sheet is None:
-                        self.show_sheet_selector_dialog(file_name, excel_file.sheet_names)
-                        return
-                    sheet_to_load = selected_sheet if selected_sheet else excel_file.sheet_names[0]
-                    self.dataframe = pd.read_excel(excel_file, sheet_name=sheet_to_load)
-                    self.file_path_updated.emit(f"{file_name} ({sheet_to_load})")
+            if file_name.endswith((".xls", ".xlsx")) and selected_sheet is None:
+                # Solo se lee el manifiesto del libro; la hoja elegida se lee una única vez
+                sheets = WorkbookInspector(file_name).inspect()
+                if len(sheets) > 1:
+                    self.show_sheet_selector_dialog(file_name, sheets)
+                    return
+                selected_sheet = sheets[0]["name"] if sheets else 0
+
+            if file_name.endswith((".xls", ".xlsx")):
+                self.dataframe = self.read_excel_sheet(file_name, selected_sheet)
+                self.file_path_updated.emit(f"{file_name} ({selected_sheet})")
+            elif file_name.endswith(".csv") and streaming:
+                # Solo se lee el primer bloque; el resto se procesa durante la importación
+                dialect = self.sniff_csv_dialect(file_name)
+                self.chunk_reader = CsvChunkReader(file_name, dialect.delimiter)
+                self.dataframe = self.chunk_reader.read_preview()
+                self.file_path_updated.emit(f"{file_name} (lectura por bloques)")
             elif file_name.endswith(".csv"):
-                # Detectar automáticamente el delimitador del CSV
-                with open(file_name, "r", encoding="utf-8") as file:
-                    sample = file.read(2048)  # Leer una muestra del archivo
-                    dialect = Sniffer().sniff(sample)  # Detectar el delimitador
-                    file.seek(0)  # Volver al inicio del archivo
-                    self.dataframe = pd.read_csv(file, delimiter=dialect.delimiter)
+                # Detectar automáticamente el delimitador del CSV; los archivos grandes se leen en paralelo con pyarrow
+                csv_reader = CsvReader(file_name, self.sniff_csv_dialect(file_name))
+                self.dataframe = csv_reader.read()
+                self.last_timings = dict(csv_reader.timings, engine=csv_reader.engine)
+                print(f"Lectura de CSV: {csv_reader.timings_text()}")
                 self.file_path_updated.emit(file_name)
             else:
                 raise ValueError("Formato de archivo no soportado. Use .xls, .xlsx o .csv.")
 
-            # Reemplazar NaN por None
-            self.dataframe = self.dataframe.where(pd.notnull(self.dataframe), None)
-
             if self.dataframe.empty:
                 raise ValueError("El archivo cargado no contiene datos.")
 
             self.dataframe_loaded.emit(True)
         except Exception as e:
             self.dataframe = None
+            self.chunk_reader = None
+            self.prepared_dirty = True
             self.error_occurred.emit(f"Error al cargar el archivo: {str(e)}")
             self.dataframe_loaded.emit(False)
 
-    def show_sheet_selector_dialog(self, file_name, sheet_names):
+    def read_excel_sheet(self, file_name, sheet_name):
+        """
+        Lee una hoja de un .xls o .xlsx, reutilizando la copia en la caché de hojas si el archivo no cambió.
+        :param file_name: Ruta del archivo.
+        :param sheet_name: Nombre o posición de la hoja.
+        :return: DataFrame con los datos de la hoja.
+        """
+        start = time.perf_counter()
+        sheet_cache = SheetCache()
+        cache_key = sheet_cache.key(file_name, sheet_name)
+        dataframe = sheet_cache.get(cache_key)
+        if dataframe is not None:
+            self.last_timings = {"engine": "cache", "cache": time.perf_counter() - start}
+            print(f"Lectura de Excel: {os.path.basename(file_name)} desde la caché en {self.last_timings['cache']:.2f}s")
+            return dataframe
+
+        if file_name.endswith(".xls"):
+            dataframe = pd.read_excel(file_name, sheet_name=sheet_name, engine="xlrd")  # `.xls` requiere `xlrd`
+            self.last_timings = {"engine": "xlrd", "parse": time.perf_counter() - start}
+        else:
+            # El motor (openpyxl, openpyxl de solo lectura o calamine) se elige según el tamaño
+            excel_reader = ExcelReader(file_name)
+            dataframe = excel_reader.read_sheet(sheet_name)
+            self.last_timings = dict(excel_reader.timings, engine=excel_reader.engine)
+            print(f"Lectura de Excel: {excel_reader.timings_text()}")
+        sheet_cache.put(cache_key, dataframe)
+        return dataframe
+
+    def show_sheet_selector_dialog(self, file_name, sheets):
         """
         Muestra un cuadro de diálogo para que el usuario seleccione una hoja del archivo.
+        :param sheets: Hojas de `WorkbookInspector.inspect`, con su rango usado y filas estimadas.
         """
         dialog = QDialog()
         dialog.setWindowTitle("Seleccionar Hoja")
@@ -62,7 +119,8 @@ class FileController(QObject):
         layout.addWidget(label)
 
         sheet_selector = QComboBox(dialog)
-        sheet_selector.addItems(sheet_names)
+        for sheet in sheets:
+            sheet_selector.addItem(WorkbookInspector.describe(sheet), sheet["name"])
         layout.addWidget(sheet_selector)
 
         accept_button = QPushButton("Aceptar", dialog)
@@ -82,24 +140,54 @@ class FileController(QObject):
         """
         Carga la hoja seleccionada por el usuario y cierra el cuadro de diálogo.
         """
-        selected_sheet = sheet_selector.currentText()
+        selected_sheet = sheet_selector.currentData()
         dialog.accept()
         self.load_file(file_name, selected_sheet)
 
     def get_dataframe(self):
         """
-        Retorna el `DataFrame` cargado.
+        Retorna el `DataFrame` cargado, normalizado y compactado con `compact_dataframe`.
+        La normalización se ejecuta una sola vez por carga y el resultado se comparte entre todas
+        las vistas (estado del botón, FileContentView e ImportView), que no deben modificarlo.
+        El `DataFrame` leído se reemplaza por el compacto, para no mantener ambos en memoria;
+        la memoria de uno y otro queda en `memory_report`.
         """
-        if self.dataframe is not None:
-            self.dataframe = self.dataframe.where(pd.notnull(self.dataframe), None)
-            self.dataframe = self.dataframe.dropna(how="all")
-            self.dataframe = self.dataframe.astype(object)
+        if self.prepared_dirty:
+            self.memory_report = None
+            if self.dataframe is not None:
+                loaded = memory_usage(self.dataframe)
+                self.dataframe = compact_dataframe(self.dataframe)
+                self.memory_report = (loaded, memory_usage(self.dataframe))
+            self.prepared_dirty = False
 
         return self.dataframe
 
+    def has_data(self):
+        """
+        Indica si hay un `DataFrame` cargado con al menos una fila con datos.
+        """
+        dataframe = self.get_dataframe()
+        return dataframe is not None and not dataframe.empty
+
+    def get_chunk_reader(self):
+        """
+        Retorna el lector por bloques del CSV cargado en modo streaming, o None.
+        """
+        return self.chunk_reader
+
+    @staticmethod
+    def sniff_csv_dialect(file_name):
+        """
+        Detecta el dialecto (delimitador) de un CSV a partir de una muestra inicial.
+        """
+        with open(file_name, "r", encoding="utf-8") as file:
+            return Sniffer().sniff(file.read(2048))
+
     def clean_up_on_error(self):
         """
         Limpia el estado del controlador en caso de error.
         """
         self.dataframe = None
+        self.chunk_reader = None
+        self.prepared_dirty = True
         self.dataframe_loaded.emit(False)
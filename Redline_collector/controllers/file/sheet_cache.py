@@ -0,0 +1,165 @@
+import hashlib
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from utils.module_utils import is_available
+
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024 * 1024  # Tamaño máximo total de la caché en disco
+HASH_BLOCK_BYTES = 1024 * 1024  # Tamaño de los bloques leídos para calcular el hash del archivo
+SAFE_OBJECT_KINDS = ("string", "floating", "empty")  # Columnas object que Arrow devuelve sin cambios
+
+
+class SheetCache:
+    """
+    Caché en disco de hojas de Excel ya leídas, en formato columnar Arrow IPC.
+    Cada hoja se guarda con una clave formada por la ruta, el tamaño, la fecha de modificación y el
+    hash del contenido del archivo, más el nombre de la hoja; al volver a cargar un archivo sin cambios
+    el DataFrame se reconstruye desde el archivo Arrow mapeado en memoria, sin leer el libro y sin
+    copiar las columnas numéricas sin nulos ni los textos, que siguen respaldados por el archivo mapeado.
+    Cuando se supera `max_bytes` se eliminan los archivos usados hace más tiempo (LRU).
+    Si pyarrow no está instalado la caché queda deshabilitada.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Inicializa la caché.
+        :param max_bytes: Tamaño máximo total de los archivos de la caché.
+        """
+        self.max_bytes = max_bytes
+        self.directory = self.get_cache_directory()
+        self.enabled = is_available("pyarrow")
+
+    @staticmethod
+    def get_cache_directory():
+        """
+        Devuelve el directorio de la caché según el entorno (desarrollo o ejecutable).
+        """
+        if getattr(sys, 'frozen', False):  # Si está en un ejecutable
+            base_path = os.path.dirname(os.path.abspath(sys.executable))
+        else:  # Si está en desarrollo
+            base_path = os.path.abspath(".")
+        return os.path.join(base_path, "cache", "sheets")
+
+    def key(self, file_name, sheet_name):
+        """
+        Calcula la clave de una hoja de un archivo.
+        :param file_name: Ruta del archivo.
+        :param sheet_name: Nombre o posición de la hoja.
+        :return: Texto hexadecimal, o None si la caché está deshabilitada.
+        """
+        if not self.enabled:
+            return None
+        stat = os.stat(file_name)
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(f"{os.path.abspath(file_name)}|{stat.st_size}|{stat.st_mtime_ns}|{sheet_name}|".encode("utf-8"))
+        with open(file_name, "rb") as file:
+            for block in iter(lambda: file.read(HASH_BLOCK_BYTES), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def get_path(self, key):
+        """
+        Devuelve la ruta del archivo Arrow de una clave.
+        """
+        return os.path.join(self.directory, f"{key}.arrow")
+
+    def get(self, key):
+        """
+        Obtiene una hoja de la caché.
+        Cada columna queda en su propio bloque (`split_blocks`), de modo que las numéricas sin nulos son
+        vistas del archivo mapeado en lugar de copiarse a un bloque común, y los textos quedan como
+        cadenas Arrow (el tipo `str` de pandas) sobre los mismos buffers. `self_destruct` libera cada
+        columna de la tabla Arrow en cuanto se convierte, para no tener la tabla y el DataFrame a la vez.
+        :param key: Clave de `key`.
+        :return: DataFrame de la hoja, o None si no está en la caché o no se puede leer.
+        """
+        if key is None:
+            return None
+        path = self.get_path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            import pyarrow as pa
+            text_dtype = pd.StringDtype("pyarrow", na_value=np.nan)
+            text_types = {pa.string(): text_dtype, pa.large_string(): text_dtype}
+            with pa.memory_map(path, "r") as source:
+                table = pa.ipc.open_file(source).read_all()
+                dataframe = table.to_pandas(split_blocks=True, self_destruct=True, types_mapper=text_types.get)
+                del table  # Con `self_destruct` la tabla ya no se puede usar
+            os.utime(path)  # La fecha de modificación marca el último uso para el LRU
+            return dataframe
+        except Exception as e:
+            print(f"Error al leer la caché de hojas {path}: {e}")
+            return None
+
+    def put(self, key, dataframe):
+        """
+        Almacena una hoja en la caché y elimina las más antiguas si se supera el tamaño máximo.
+        Las hojas con columnas que mezclan tipos (por ejemplo números y textos) no se almacenan,
+        porque Arrow exige un tipo por columna y convertirlas cambiaría los valores validados.
+        :param key: Clave de `key`.
+        :param dataframe: DataFrame leído del archivo.
+        """
+        if key is None or not all(isinstance(column, str) for column in dataframe.columns):
+            return
+        if not all(self.is_cacheable(column) for _, column in dataframe.items()):
+            return
+        import pyarrow as pa
+        path = self.get_path(key)
+        temp_path = f"{path}.tmp"
+        try:
+            table = pa.Table.from_pandas(dataframe, preserve_index=False)
+            os.makedirs(self.directory, exist_ok=True)
+            with pa.OSFile(temp_path, "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(temp_path, path)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return
+        except Exception as e:
+            print(f"Error al guardar la caché de hojas {path}: {e}")
+            return
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        self.evict()
+
+    @staticmethod
+    def is_cacheable(column):
+        """
+        Indica si una columna vuelve de Arrow con los mismos valores. Arrow convierte las columnas
+        object a un único tipo: los enteros mezclados con decimales pasan a decimales (1 vuelve como 1.0),
+        los enteros con nulos también, y las fechas pasan a `pd.Timestamp`.
+        :param column: Serie del DataFrame leído.
+        :return: True si la columna se puede almacenar sin cambiar sus valores.
+        """
+        if column.dtype != object:
+            return True
+        kind = pd.api.types.infer_dtype(column, skipna=True)
+        if kind in SAFE_OBJECT_KINDS:
+            return True
+        return kind in ("integer", "boolean") and not column.isna().any()
+
+    def evict(self):
+        """
+        Elimina los archivos usados hace más tiempo hasta que el total no supere `max_bytes`.
+        Los archivos que no se pueden eliminar (en Windows, los que siguen mapeados por una hoja
+        cargada desde la caché) se conservan y se sigue con los siguientes.
+        """
+        try:
+            entries = [entry for entry in os.scandir(self.directory) if entry.name.endswith(".arrow")]
+            files = sorted((entry.stat().st_mtime, entry.stat().st_size, entry.path) for entry in entries)
+            total = sum(size for _, size, _ in files)
+            for _, size, path in files:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+        except Exception as e:
+            print(f"Error al depurar la caché de hojas {self.directory}: {e}")
@@ -0,0 +1,129 @@
+import posixpath
+import re
+import zipfile
+import xml.etree.ElementTree as ElementTree
+
+
+class WorkbookInspector:
+    """
+    Obtiene la lista de hojas de un libro de Excel sin leer sus datos, para mostrar el selector
+    de hojas antes de la única lectura de la hoja elegida.
+    En .xlsx solo se leen el manifiesto del libro (`xl/workbook.xml` y sus relaciones) y el
+    elemento `<dimension>` del comienzo de cada hoja; en .xls se abre el libro con `on_demand`.
+    """
+
+    DIMENSION_PATTERN = re.compile(r"^\$?([A-Z]+)\$?(\d+)(?::\$?([A-Z]+)\$?(\d+))?$")
+
+    def __init__(self, file_name):
+        """
+        Inicializa el inspector.
+        :param file_name: Ruta del archivo .xlsx o .xls.
+        """
+        self.file_name = file_name
+
+    def inspect(self):
+        """
+        Obtiene la descripción de las hojas del libro, en el orden del libro.
+        :return: Lista de diccionarios con "name", "dimension" (rango usado o None) y "rows"
+                 (filas de datos estimadas sin el encabezado, o None si no se conocen).
+        """
+        if self.file_name.endswith(".xls"):
+            return self._inspect_xls()
+        return self._inspect_xlsx()
+
+    def _inspect_xls(self):
+        """
+        Lista las hojas de un .xls sin cargar su contenido (`on_demand`).
+        """
+        import xlrd
+        workbook = xlrd.open_workbook(self.file_name, on_demand=True)
+        try:
+            return [{"name": name, "dimension": None, "rows": None} for name in workbook.sheet_names()]
+        finally:
+            workbook.release_resources()
+
+    def _inspect_xlsx(self):
+        """
+        Lista las hojas de un .xlsx leyendo el manifiesto del libro y la dimensión de cada hoja.
+        """
+        with zipfile.ZipFile(self.file_name) as archive:
+            targets = self._relationship_targets(archive)
+            workbook = ElementTree.fromstring(archive.read("xl/workbook.xml"))
+
+            sheets = []
+            for element in workbook.iter():
+                if self.local_name(element.tag) != "sheet":
+                    continue
+                relationship_id = next(
+                    (value for key, value in element.attrib.items() if self.local_name(key) == "id"), None
+                )
+                dimension = None
+                target = targets.get(relationship_id)
+                if target is not None and target in archive.namelist():
+                    dimension = self._read_dimension(archive, target)
+                sheets.append({
+                    "name": element.attrib.get("name"),
+                    "dimension": dimension,
+                    "rows": self.estimate_rows(dimension),
+                })
+            return sheets
+
+    def _relationship_targets(self, archive):
+        """
+        Obtiene la ruta dentro del archivo de cada relación del libro.
+        :return: Diccionario {id de relación: ruta de la parte}.
+        """
+        relationships = ElementTree.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+        targets = {}
+        for element in relationships:
+            target = element.attrib.get("Target", "")
+            if target.startswith("/"):
+                path = target.lstrip("/")
+            else:
+                path = posixpath.normpath(posixpath.join("xl", target))
+            targets[element.attrib.get("Id")] = path
+        return targets
+
+    def _read_dimension(self, archive, part_name):
+        """
+        Lee el rango usado de una hoja deteniéndose antes de sus datos (`<dimension>` precede a `<sheetData>`).
+        :return: Rango (por ejemplo "A1:F1000") o None si la hoja no lo declara.
+        """
+        with archive.open(part_name) as stream:
+            for _, element in ElementTree.iterparse(stream, events=("start",)):
+                name = self.local_name(element.tag)
+                if name == "dimension":
+                    return element.attrib.get("ref")
+                if name == "sheetData":
+                    return None
+        return None
+
+    @classmethod
+    def estimate_rows(cls, dimension):
+        """
+        Estima las filas de datos de una hoja a partir de su rango usado, descontando el encabezado.
+        :param dimension: Rango de la hoja (por ejemplo "A1:F1000").
+        :return: Cantidad estimada de filas o None si no se puede estimar.
+        """
+        match = cls.DIMENSION_PATTERN.match(dimension or "")
+        if match is None:
+            return None
+        first_row = int(match.group(2))
+        last_row = int(match.group(4) or first_row)
+        return max(0, last_row - first_row)
+
+    @staticmethod
+    def local_name(tag):
+        """
+        Devuelve el nombre de un elemento o atributo XML sin su espacio de nombres.
+        """
+        return tag.rsplit("}", 1)[-1]
+
+    @staticmethod
+    def describe(sheet):
+        """
+        Texto de una hoja para el selector: nombre, rango usado y filas estimadas, si se conocen.
+        """
+        if sheet["rows"] is None:
+            return sheet["name"]
+        return f"{sheet['name']} ({sheet['dimension']}, ~{sheet['rows']} filas)"
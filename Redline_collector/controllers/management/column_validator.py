@@ -0,0 +1,568 @@
+import datetime
+import math
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.api import guess_datetime_format
+
+
+class ColumnValidator:
+    """
+    Validaciones por columna completa contra la estructura de la tabla destino.
+    Cada validador devuelve una máscara booleana con una posición por valor de la columna
+    (True = el valor no cumple la regla), calculada con operaciones de NumPy/pandas.
+    """
+
+    KIND_NONE = 0
+    KIND_INT = 1
+    KIND_FLOAT = 2
+    KIND_STR = 3
+    KIND_OTHER = 4
+
+    # Margen relativo para recomprobar con aritmética exacta los valores cercanos al límite de precisión.
+    BOUNDARY_TOLERANCE = 1e-12
+
+    UTF8_THRESHOLDS = (0x80, 0x800, 0x10000)
+    UTF8_MAX_BYTES = 4
+    UTF16_THRESHOLDS = (0x10000,)
+    UTF16_MAX_UNITS = 2
+    ENCODE_BLOCK_CODE_POINTS = 4_000_000  # Puntos de código por bloque al medir textos codificados (16 MB)
+
+    INTEGER_PRECISION = 38
+
+    # Abreviaturas de meses en español (formato de fecha de Oracle en una sesión en español) que difieren del inglés.
+    SPANISH_MONTHS = {"ENE": "JAN", "ABR": "APR", "AGO": "AUG", "DIC": "DEC"}
+    SPANISH_MONTHS_PATTERN = r"(?i)(?<![A-Za-z])(?:ENE|ABR|AGO|DIC)(?![A-Za-z])"
+    YEAR_FIRST_PATTERN = r"\d{4}[-/.]"
+    # Zona horaria al final de una hora ("10:00:00+03:00", "10:00Z"); el grupo 1 es el texto sin ella
+    TZ_SUFFIX_PATTERN = r"(?i)^(.*\d{1,2}:\d{2}(?::\d{2}(?:[.,]\d+)?)?)\s*(?:Z|UTC|GMT|[+-]\d{2}(?::?\d{2})?)$"
+
+    # Resultados de infer_dtype en los que todos los valores no nulos son del mismo tipo.
+    HOMOGENEOUS_KINDS = ("string", "integer", "floating", "boolean", "decimal", "datetime", "date", "empty")
+
+    @staticmethod
+    def _kind(value):
+        if value is None:
+            return ColumnValidator.KIND_NONE
+        if isinstance(value, int):
+            return ColumnValidator.KIND_INT
+        if isinstance(value, float):
+            return ColumnValidator.KIND_FLOAT
+        if isinstance(value, str):
+            return ColumnValidator.KIND_STR
+        return ColumnValidator.KIND_OTHER
+
+    @staticmethod
+    def to_values(column_data):
+        """
+        Obtiene los valores de la columna como arreglo de NumPy sin perder el tipo de cada celda.
+        :param column_data: Serie de pandas, arreglo o lista con los valores de la columna.
+        :return: Arreglo de NumPy (numérico si la columna lo es, object en otro caso).
+        """
+        if isinstance(column_data, pd.Series):
+            dtype = column_data.dtype
+            if isinstance(dtype, pd.ArrowDtype) and dtype.kind in "iuf" and not column_data.hasnans:
+                # Números Arrow sin nulos (`CsvReader`): se validan como la columna NumPy equivalente
+                return ColumnValidator.to_values(pd.Series(column_data.to_numpy(dtype=dtype.numpy_dtype)))
+            if not isinstance(dtype, np.dtype):
+                # Categorías, enteros con nulos o columnas Arrow (`compact_dataframe`): objetos de Python con None
+                return column_data.to_numpy(dtype=object, na_value=None)
+            if dtype.kind == "i":
+                return column_data.to_numpy(dtype=np.int64)
+            if dtype.kind == "u":
+                # uint64 no cabe en int64: los valores mayores que 2**63 cambiarían de signo
+                return column_data.to_numpy(dtype=np.uint64)
+            if dtype.kind == "f":
+                return column_data.to_numpy(dtype=np.float64)
+            if dtype.kind == "b":
+                return column_data.to_numpy()
+            values = column_data.to_numpy(dtype=object)
+            if dtype.kind in "mM":
+                # Fechas que `compact_dataframe` deja como datetime64: NaT es un nulo (None)
+                values[column_data.isna().to_numpy()] = None
+            return values
+        values = np.asarray(column_data)
+        if values.dtype.kind in "biuf":
+            return values
+        return np.asarray(column_data, dtype=object)
+
+    @classmethod
+    def classify(cls, values):
+        """
+        Clasifica cada valor según el tipo de Python que determina la regla a aplicar.
+        :param values: Arreglo de NumPy de `to_values`.
+        :return: Arreglo de enteros con un código KIND_* por valor.
+        """
+        if values.dtype.kind in "biu":
+            return np.full(len(values), cls.KIND_INT, dtype=np.int8)
+        if values.dtype.kind == "f":
+            return np.full(len(values), cls.KIND_FLOAT, dtype=np.int8)
+        if len(values) == 0:
+            return np.empty(0, dtype=np.int8)
+        return np.frompyfunc(cls._kind, 1, 1)(values).astype(np.int8)
+
+    @staticmethod
+    def _exceeds_precision(magnitudes, precision, exact_values=None):
+        """
+        Marca los valores cuya parte entera tiene más de `precision` dígitos.
+        :param magnitudes: Valores absolutos en float64.
+        :param precision: Cantidad máxima de dígitos enteros.
+        :param exact_values: Valores originales para recomprobar con enteros de Python los cercanos al límite.
+        :return: Máscara booleana.
+        """
+        if precision <= 0:
+            # len(str(int(abs(valor)))) siempre es al menos 1.
+            return np.ones(len(magnitudes), dtype=bool)
+
+        limit = 10 ** precision
+        float_limit = float(limit)
+        exceeds = magnitudes >= float_limit
+        if exact_values is not None:
+            near = np.flatnonzero(np.abs(magnitudes - float_limit) <= float_limit * ColumnValidator.BOUNDARY_TOLERANCE)
+            for position in near:
+                exceeds[position] = int(abs(float(exact_values[position]))) >= limit
+        return exceeds
+
+    @staticmethod
+    def _fraction_digits(values):
+        """
+        Cuenta los dígitos después del punto en la representación `str` de cada float.
+        :param values: Arreglo float64.
+        :return: Arreglo de enteros con la cantidad de dígitos decimales.
+        """
+        text = values.astype(str)
+        dot = np.char.find(text, ".")
+        return np.where(dot >= 0, np.char.str_len(text) - dot - 1, 0)
+
+    @classmethod
+    def _int_errors(cls, values, precision):
+        if precision is None:
+            return np.zeros(len(values), dtype=bool)
+        if precision <= 0:
+            # len(str(int(abs(valor)))) siempre es al menos 1.
+            return np.ones(len(values), dtype=bool)
+
+        if values.dtype.kind in "biu":
+            integers = values.astype(np.int64) if values.dtype.kind == "b" else values
+        else:
+            try:
+                integers = np.asarray(values, dtype=np.int64)
+            except OverflowError:
+                # Enteros fuera del rango de int64: se cuentan los dígitos con aritmética de Python.
+                return np.fromiter((len(str(abs(int(value)))) > precision for value in values),
+                                   dtype=bool, count=len(values))
+
+        limit = 10 ** precision
+        if limit > np.iinfo(integers.dtype).max:
+            return np.zeros(len(integers), dtype=bool)
+        if integers.dtype.kind == "u":
+            return integers >= limit
+        return (integers >= limit) | (integers <= -limit)
+
+    @classmethod
+    def _float_errors(cls, values, precision, scale):
+        values = np.asarray(values, dtype=np.float64)
+        errors = np.zeros(len(values), dtype=bool)
+        if scale > 0:
+            errors |= cls._fraction_digits(values) > scale
+        if precision is not None:
+            finite = np.isfinite(values)
+            errors |= ~finite
+            magnitudes = np.abs(np.where(finite, values, 0.0))
+            errors |= finite & cls._exceeds_precision(magnitudes, precision, values)
+        return errors
+
+    @classmethod
+    def _parsed_errors(cls, parsed, parse_failed, precision, exact_values):
+        """
+        Regla para valores convertidos con `float()`: error si no se pudieron convertir
+        o si la parte entera excede la precisión (sin comprobar escala).
+        """
+        errors = parse_failed.copy()
+        if precision is not None:
+            finite = np.isfinite(parsed) & ~parse_failed
+            errors |= ~finite
+            magnitudes = np.abs(np.where(finite, parsed, 0.0))
+            errors |= finite & cls._exceeds_precision(magnitudes, precision, exact_values)
+        return errors
+
+    @staticmethod
+    def _python_float(value):
+        try:
+            return float(value), False
+        except (ValueError, TypeError):
+            return np.nan, True
+
+    @classmethod
+    def _str_errors(cls, values, precision):
+        parsed = pd.to_numeric(pd.Series(values, dtype=object), errors="coerce")
+        parsed = parsed.to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+        parse_failed = np.zeros(len(values), dtype=bool)
+
+        # Lo que pandas no convierte se reintenta con float() para respetar su sintaxis ("1_000", "nan", ...).
+        for position in np.flatnonzero(np.isnan(parsed)):
+            parsed[position], parse_failed[position] = cls._python_float(values[position])
+
+        return cls._parsed_errors(parsed, parse_failed, precision, values)
+
+    @classmethod
+    def _other_errors(cls, values, precision):
+        converted = [cls._python_float(value) for value in values]
+        parsed = np.fromiter((value for value, _ in converted), dtype=np.float64, count=len(values))
+        parse_failed = np.fromiter((failed for _, failed in converted), dtype=bool, count=len(values))
+        return cls._parsed_errors(parsed, parse_failed, precision, values)
+
+    @classmethod
+    def number_errors(cls, column_data, precision, scale):
+        """
+        Valida una columna NUMBER(p,s) completa.
+        Reglas: los enteros y floats se comprueban por escala (dígitos decimales de su `str`) y por
+        dígitos enteros; el resto se convierte con `float()` y solo se comprueba la precisión.
+        Los valores nulos (None), no convertibles o infinitos con precisión definida son errores.
+        :param column_data: Serie, arreglo o lista con los valores de la columna.
+        :param precision: Precisión de la columna (None si no está definida).
+        :param scale: Escala de la columna (None equivale a 0).
+        :return: Máscara booleana con True en las posiciones con error.
+        """
+        scale = scale or 0
+        values = cls.to_values(column_data)
+        kinds = cls.classify(values)
+        errors = np.zeros(len(values), dtype=bool)
+
+        errors[kinds == cls.KIND_NONE] = True
+
+        for kind in (cls.KIND_INT, cls.KIND_FLOAT, cls.KIND_STR, cls.KIND_OTHER):
+            positions = np.flatnonzero(kinds == kind)
+            if len(positions) == 0:
+                continue
+            subset = values[positions]
+            if kind == cls.KIND_INT:
+                errors[positions] = cls._int_errors(subset, precision)
+            elif kind == cls.KIND_FLOAT:
+                errors[positions] = cls._float_errors(subset, precision, scale)
+            elif kind == cls.KIND_STR:
+                errors[positions] = cls._str_errors(subset, precision)
+            else:
+                errors[positions] = cls._other_errors(subset, precision)
+
+        return errors
+
+    @staticmethod
+    def null_mask(values):
+        """
+        Marca los valores nulos (None, NaN, NaT, pd.NA), que Oracle guarda como NULL.
+        :param values: Arreglo de NumPy de `to_values`.
+        :return: Máscara booleana.
+        """
+        return np.asarray(pd.isna(values), dtype=bool)
+
+    @staticmethod
+    def to_text(values):
+        """
+        Convierte los valores a texto tal como se enviarían a una columna de caracteres.
+        :param values: Arreglo de NumPy sin nulos.
+        :return: Serie de pandas con el `str` de cada valor.
+        """
+        return pd.Series(values, dtype=object).astype(str)
+
+    @classmethod
+    def encoded_lengths(cls, text, char_lengths, thresholds):
+        """
+        Calcula la longitud codificada de cada texto a partir de sus puntos de código: cada carácter
+        ocupa una unidad más una por cada umbral de `thresholds` que alcanza.
+        Se procesa por bloques para acotar la memoria del arreglo de ancho fijo.
+        :param text: Serie de textos.
+        :param char_lengths: Arreglo con la cantidad de caracteres de cada texto.
+        :param thresholds: Umbrales de punto de código (UTF8_THRESHOLDS o UTF16_THRESHOLDS).
+        :return: Arreglo de enteros con las unidades de cada texto (bytes en UTF-8, unidades de 16 bits en UTF-16).
+        """
+        lengths = np.asarray(char_lengths, dtype=np.int64).copy()
+        if len(text) == 0:
+            return lengths
+
+        values = text.to_numpy(dtype=object)
+        width = max(int(lengths.max()), 1)
+        rows_per_block = max(1, cls.ENCODE_BLOCK_CODE_POINTS // width)
+        for start in range(0, len(values), rows_per_block):
+            block = np.array(values[start:start + rows_per_block], dtype=f"<U{width}")
+            code_points = block.view(np.uint32).reshape(len(block), width)
+            for threshold in thresholds:
+                lengths[start:start + len(block)] += (code_points >= threshold).sum(axis=1)
+        return lengths
+
+    @classmethod
+    def _measure_text(cls, column_data):
+        """
+        Obtiene el texto de los valores no nulos de una columna y su cantidad de caracteres.
+        :return: Tupla (cantidad de valores, posiciones no nulas, textos, cantidad de caracteres).
+        """
+        values = cls.to_values(column_data)
+        positions = np.flatnonzero(~cls.null_mask(values))
+        text = cls.to_text(values[positions])
+        char_lengths = text.str.len().to_numpy(dtype=np.int64)
+        return len(values), positions, text, char_lengths
+
+    @classmethod
+    def _length_errors(cls, column_data, char_limit, unit_limit, thresholds, max_units):
+        """
+        Marca los textos que superan el límite de caracteres o el de unidades codificadas.
+        Solo se codifican los textos que podrían superar `unit_limit` (hasta `max_units` por carácter).
+        """
+        size, positions, text, char_lengths = cls._measure_text(column_data)
+        errors = np.zeros(size, dtype=bool)
+
+        failed = np.zeros(len(positions), dtype=bool)
+        if char_limit is not None:
+            failed |= char_lengths > char_limit
+        if unit_limit is not None:
+            failed |= char_lengths > unit_limit
+            undecided = np.flatnonzero(~failed & (char_lengths * max_units > unit_limit))
+            if len(undecided):
+                unit_lengths = cls.encoded_lengths(text.iloc[undecided], char_lengths[undecided], thresholds)
+                failed[undecided] = unit_lengths > unit_limit
+
+        errors[positions] = failed
+        return errors
+
+    @classmethod
+    def varchar_errors(cls, column_data, length, char_used=None, byte_length=None):
+        """
+        Valida una columna VARCHAR2 según su semántica de longitud.
+        Con CHAR_USED = 'C' se limita la cantidad de caracteres a `length`; en todos los casos la
+        longitud codificada en UTF-8 no puede superar el máximo en bytes de la columna.
+        Los valores nulos no se validan.
+        :param column_data: Serie, arreglo o lista con los valores de la columna.
+        :param length: Longitud de la columna en caracteres (CHAR_LENGTH).
+        :param char_used: 'B' (bytes) o 'C' (caracteres).
+        :param byte_length: Longitud máxima en bytes (DATA_LENGTH).
+        :return: Máscara booleana con True en las posiciones con error.
+        """
+        if length is None and byte_length is None:
+            return np.zeros(len(cls.to_values(column_data)), dtype=bool)
+
+        char_limit = length if char_used == "C" else None
+        byte_limit = byte_length if byte_length else (length if char_used != "C" else None)
+        return cls._length_errors(column_data, char_limit, byte_limit, cls.UTF8_THRESHOLDS, cls.UTF8_MAX_BYTES)
+
+    @classmethod
+    def char_errors(cls, column_data, length, char_used=None, byte_length=None):
+        """
+        Valida una columna CHAR. Oracle completa con blancos los valores más cortos, por lo que solo
+        se rechazan los que exceden la longitud; los blancos finales del archivo cuentan como caracteres.
+        :return: Máscara booleana con True en las posiciones con error.
+        """
+        return cls.varchar_errors(column_data, length, char_used, byte_length)
+
+    @classmethod
+    def national_errors(cls, column_data, length):
+        """
+        Valida una columna NVARCHAR2 o NCHAR. La longitud se expresa en caracteres del juego nacional
+        (AL16UTF16), donde los caracteres fuera del plano básico ocupan dos unidades.
+        :param column_data: Serie, arreglo o lista con los valores de la columna.
+        :param length: Longitud de la columna en caracteres (CHAR_LENGTH).
+        :return: Máscara booleana con True en las posiciones con error.
+        """
+        if length is None:
+            return np.zeros(len(cls.to_values(column_data)), dtype=bool)
+        return cls._length_errors(column_data, None, length, cls.UTF16_THRESHOLDS, cls.UTF16_MAX_UNITS)
+
+    @classmethod
+    def integer_errors(cls, column_data):
+        """
+        Valida una columna INTEGER (NUMBER(*,0)): valores numéricos de hasta 38 dígitos enteros.
+        Oracle redondea los decimales, por lo que no se rechazan.
+        :return: Máscara booleana con True en las posiciones con error.
+        """
+        return cls.number_errors(column_data, cls.INTEGER_PRECISION, None)
+
+    @staticmethod
+    def _is_datetime(value):
+        return isinstance(value, (datetime.date, np.datetime64))
+
+    @classmethod
+    def _spanish_months(cls, text):
+        """
+        Reemplaza las abreviaturas de meses en español que difieren del inglés (por ejemplo, "31-ENE-24",
+        el formato de fecha de una sesión Oracle en español) para que pandas pueda interpretarlas.
+        """
+        return text.str.replace(cls.SPANISH_MONTHS_PATTERN, lambda match: cls.SPANISH_MONTHS[match.group(0).upper()],
+                                regex=True)
+
+    @classmethod
+    def parse_datetimes(cls, column_data):
+        """
+        Interpreta una columna DATE o TIMESTAMP. Las fechas ya tipadas son válidas; los textos se
+        interpretan en bloque con el formato inferido del primer valor y, los que no coinciden,
+        con interpretación mixta (año-mes-día si empiezan por el año, día primero en otro caso).
+        Si el texto indica una zona horaria, se descarta y se conserva la hora tal como está escrita
+        (Oracle DATE y TIMESTAMP no guardan zona): "2024-01-05T10:00:00+03:00" es las 10:00.
+        Los demás valores son errores.
+        La validación y el enlace de los valores en la importación usan este mismo resultado.
+        :param column_data: Serie, arreglo o lista con los valores de la columna.
+        :return: Tupla (arreglo object con la fecha interpretada de cada texto válido y el valor original
+                 en las demás posiciones, máscara booleana con True en las posiciones con error).
+        """
+        if isinstance(column_data, pd.Series) and column_data.dtype.kind == "M":
+            return cls.to_values(column_data), np.zeros(len(column_data), dtype=bool)
+
+        values = cls.to_values(column_data)
+        errors = np.zeros(len(values), dtype=bool)
+        if values.dtype.kind in "biuf" or len(values) == 0:
+            errors[~cls.null_mask(values)] = True
+            return values.astype(object), errors
+
+        parsed_values = values.copy()
+        candidates = np.flatnonzero(~cls.null_mask(values))
+        is_datetime = np.frompyfunc(cls._is_datetime, 1, 1)(values[candidates]).astype(bool)
+        candidates = candidates[~is_datetime]
+        if len(candidates) == 0:
+            return parsed_values, errors
+
+        subset = values[candidates]
+        is_text = np.frompyfunc(lambda value: isinstance(value, str), 1, 1)(subset).astype(bool)
+        errors[candidates[~is_text]] = True
+
+        text_positions = candidates[is_text]
+        text = pd.Series(subset[is_text], dtype=object).str.strip()
+        filled = (text != "").to_numpy()
+        text_positions, text = text_positions[filled], text[filled]
+        if len(text) == 0:
+            return parsed_values, errors
+        text = cls._spanish_months(text).str.replace(cls.TZ_SUFFIX_PATTERN, r"\1", regex=True)
+
+        # Los textos que empiezan por el año (ISO, "2024-01-05") son año-mes-día; el resto, día primero
+        year_first = text.str.match(cls.YEAR_FIRST_PATTERN).to_numpy(dtype=bool)
+        # En microsegundos (la precisión de datetime) para admitir todo el rango de años de Oracle
+        parsed = pd.Series(pd.NaT, index=text.index, dtype="datetime64[us]")
+        date_format = guess_datetime_format(text.iloc[0], dayfirst=not year_first[0])
+        if date_format:
+            parsed = pd.to_datetime(text, format=date_format, errors="coerce").dt.as_unit("us")
+
+        pending = parsed.isna().to_numpy(copy=True)
+        for group, dayfirst in ((year_first, False), (~year_first, True)):
+            retry = pending & group
+            if retry.any():
+                retried = pd.to_datetime(text[retry], format="mixed", dayfirst=dayfirst,
+                                         errors="coerce").dt.as_unit("us")
+                parsed[retry] = retried
+                pending[retry] = retried.isna().to_numpy()
+
+        errors[text_positions[pending]] = True
+        valid = ~pending
+        parsed_values[text_positions[valid]] = parsed[valid].dt.to_pydatetime()
+        return parsed_values, errors
+
+    @classmethod
+    def datetime_errors(cls, column_data):
+        """
+        Valida una columna DATE o TIMESTAMP con las reglas de `parse_datetimes`.
+        :param column_data: Serie, arreglo o lista con los valores de la columna.
+        :return: Máscara booleana con True en las posiciones con error.
+        """
+        return cls.parse_datetimes(column_data)[1]
+
+    @staticmethod
+    def is_datetime_column(column):
+        """
+        Indica si una columna de `get_table_structure_for_validation` es DATE o TIMESTAMP.
+        """
+        return column["data_type"] == "DATE" or column["data_type"].startswith("TIMESTAMP")
+
+    @classmethod
+    def column_errors(cls, column_data, column):
+        """
+        Valida una columna según su tipo de dato Oracle.
+        :param column_data: Serie, arreglo o lista con los valores de la columna.
+        :param column: Diccionario de `get_table_structure_for_validation`.
+        :return: Máscara booleana con True en las posiciones con error, o None si el tipo no se valida.
+        """
+        data_type = column["data_type"]
+        if data_type == "NUMBER":
+            if column.get("precision") is None and column.get("scale") == 0:
+                return cls.integer_errors(column_data)
+            return cls.number_errors(column_data, column.get("precision"), column.get("scale"))
+        if data_type == "INTEGER":
+            return cls.integer_errors(column_data)
+        if data_type == "VARCHAR2":
+            return cls.varchar_errors(column_data, column.get("length"), column.get("char_used"),
+                                      column.get("byte_length"))
+        if data_type == "CHAR":
+            return cls.char_errors(column_data, column.get("length"), column.get("char_used"),
+                                   column.get("byte_length"))
+        if data_type in ("NVARCHAR2", "NCHAR"):
+            return cls.national_errors(column_data, column.get("length"))
+        if cls.is_datetime_column(column):
+            return cls.datetime_errors(column_data)
+        if data_type in ("CLOB", "NCLOB"):
+            return np.zeros(len(cls.to_values(column_data)), dtype=bool)
+        return None
+
+    @staticmethod
+    def _is_negative_zero(value):
+        return isinstance(value, float) and math.copysign(1.0, value) < 0
+
+    @classmethod
+    def factorize(cls, column_data):
+        """
+        Agrupa los valores iguales de una columna. Los valores se distinguen también por tipo
+        (1, 1.0 y "1" son distintos) y los nulos por su clase (None, NaN, NaT), porque las reglas
+        de validación dependen del tipo.
+        :param column_data: Serie, arreglo o lista con los valores de la columna.
+        :return: Tupla (arreglo de valores, códigos por fila, posición del primer valor de cada código).
+        """
+        values = cls.to_values(column_data)
+        if values.dtype.kind == "f":
+            # Por bits: distingue 0.0 de -0.0, que se validan distinto como texto.
+            value_codes = pd.factorize(values.astype(np.float64).view(np.int64))[0] + 1
+            type_codes = np.zeros(len(values), dtype=np.int64)
+        elif values.dtype.kind in "biu":
+            value_codes = pd.factorize(values)[0] + 1
+            type_codes = np.zeros(len(values), dtype=np.int64)
+        else:
+            value_codes, uniques = pd.factorize(values, use_na_sentinel=True)
+            value_codes = value_codes + 1  # 0 = nulo
+            if pd.api.types.infer_dtype(values, skipna=True) in cls.HOMOGENEOUS_KINDS:
+                type_codes = np.zeros(len(values), dtype=np.int64)
+                null_positions = np.flatnonzero(value_codes == 0)
+                if len(null_positions):
+                    null_types = np.frompyfunc(type, 1, 1)(values[null_positions])
+                    type_codes[null_positions] = pd.factorize(null_types)[0]
+            else:
+                type_codes = pd.factorize(np.frompyfunc(type, 1, 1)(values))[0]
+
+            # 0.0 y -0.0 son iguales para el hash; se separan porque su texto difiere.
+            zero_codes = np.flatnonzero(np.asarray(uniques, dtype=object) == 0) + 1
+            zero_positions = np.flatnonzero(np.isin(value_codes, zero_codes))
+            if len(zero_positions):
+                negative = np.frompyfunc(cls._is_negative_zero, 1, 1)(values[zero_positions]).astype(bool)
+                type_codes[zero_positions[negative]] = type_codes.max() + 1
+
+        combined = type_codes.astype(np.int64) * (int(value_codes.max(initial=0)) + 1) + value_codes
+        codes = pd.factorize(combined)[0]
+        # pd.factorize numera por orden de aparición: la primera aparición de cada código queda en orden.
+        first_positions = pd.Series(codes).drop_duplicates().index.to_numpy()
+        return values, codes, first_positions
+
+    @classmethod
+    def distinct_errors(cls, column_data, column):
+        """
+        Valida una columna evaluando una sola vez cada valor distinto y propagando el resultado
+        a todas las filas mediante los códigos de `factorize`.
+        :param column_data: Serie, arreglo o lista con los valores de la columna.
+        :param column: Diccionario de `get_table_structure_for_validation`.
+        :return: Máscara booleana por fila con True en las posiciones con error, o None si el tipo no se valida.
+        """
+        values, codes, first_positions = cls.factorize(column_data)
+        unique_errors = cls.column_errors(values[first_positions], column)
+        if unique_errors is None:
+            return None
+        return unique_errors[codes]
+
+    @staticmethod
+    def error_positions(errors):
+        """
+        Convierte una máscara de errores en posiciones de fila 1-based.
+        :param errors: Máscara booleana de un validador.
+        :return: Arreglo de enteros con las posiciones (1 = primer valor).
+        """
+        return np.flatnonzero(errors) + 1
@@ -0,0 +1,119 @@
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from controllers.management.column_validator import ColumnValidator
+from controllers.management.primary_key_checker import PrimaryKeyChecker
+from core.db_connection import DatabaseConnection
+
+
+class ConstraintChecker:
+    """
+    Prevalidación de restricciones NOT NULL y de claves foráneas antes de importar.
+    Los nulos se detectan con máscaras por columna y las claves foráneas se comparan contra el
+    conjunto de claves de la tabla padre, que se lee una sola vez y se comparte por conexión.
+    """
+
+    PARENT_KEYS_TTL = 300  # Segundos durante los cuales se reutiliza el conjunto de claves de una tabla padre
+
+    _parent_keys = {}  # (conexión, dueño.tabla, columnas) -> (momento de lectura, conjunto de claves)
+    _parent_keys_lock = threading.Lock()
+
+    def __init__(self, table_controller):
+        """
+        Inicializa el verificador.
+        :param table_controller: TableController con conexión activa.
+        """
+        self.table_controller = table_controller
+
+    @staticmethod
+    def null_mask(column_data):
+        """
+        Marca las filas que Oracle guardaría como NULL: valores nulos y cadenas vacías.
+        :param column_data: Serie con los valores de la columna.
+        :return: Máscara booleana.
+        """
+        values = ColumnValidator.to_values(column_data)
+        mask = ColumnValidator.null_mask(values)
+        if values.dtype == object:
+            mask |= (pd.Series(values, dtype=object) == "").to_numpy()
+        return mask
+
+    def not_null_failures(self, frame, table_structure):
+        """
+        Busca valores nulos en las columnas NOT NULL presentes en el DataFrame.
+        :param frame: DataFrame a validar.
+        :param table_structure: Estructura de la tabla de `get_table_structure_for_validation`.
+        :return: Lista de tuplas (columna, posiciones 0-based con valor nulo).
+        """
+        failures = []
+        for column in table_structure:
+            column_name = column["column_name"]
+            if column.get("nullable", True) or column_name not in frame.columns:
+                continue
+            positions = np.flatnonzero(self.null_mask(frame[column_name]))
+            if len(positions):
+                failures.append((column_name, positions))
+        return failures
+
+    def foreign_key_failures(self, frame, table_name, table_structure):
+        """
+        Busca valores de claves foráneas que no existen en la tabla padre. Las filas con alguna
+        columna de la clave nula no se verifican, igual que en Oracle.
+        :param frame: DataFrame a validar.
+        :param table_name: Nombre de la tabla destino.
+        :param table_structure: Estructura de la tabla de `get_table_structure_for_validation`.
+        :return: Lista de tuplas (clave foránea, posiciones 0-based sin registro padre).
+        """
+        structure = {col["column_name"]: col for col in table_structure}
+        failures = []
+        for foreign_key in self.table_controller.get_foreign_keys(table_name) or []:
+            columns = foreign_key["columns"]
+            if any(col not in frame.columns for col in columns):
+                continue
+
+            key_structure = [structure.get(col, {"column_name": col}) for col in columns]
+            arrays = [PrimaryKeyChecker.normalize_column(frame[col], column)
+                      for col, column in zip(columns, key_structure)]
+            complete = np.logical_and.reduce([~pd.isna(array) for array in arrays])
+            positions = np.flatnonzero(complete)
+            if len(positions) == 0:
+                continue
+
+            parent_keys = self.get_parent_keys(foreign_key, key_structure)
+            key_frame = pd.DataFrame({position: array[complete] for position, array in enumerate(arrays)},
+                                     dtype=object)
+            found = np.zeros(len(positions), dtype=bool)
+            if parent_keys:
+                found = pd.MultiIndex.from_frame(key_frame).isin(list(parent_keys))
+            missing = positions[~found]
+            if len(missing):
+                failures.append((foreign_key, missing))
+        return failures
+
+    def get_parent_keys(self, foreign_key, key_structure):
+        """
+        Obtiene el conjunto normalizado de claves de la tabla padre, leyéndolo de la base de datos
+        solo si no está en la caché de la conexión activa o si venció.
+        :param foreign_key: Clave foránea de `get_foreign_keys`.
+        :param key_structure: Estructura de las columnas hijas, usada para normalizar los valores.
+        :return: Conjunto de tuplas normalizadas.
+        """
+        parent = f"{foreign_key['parent_owner']}.{foreign_key['parent_table']}"
+        cache_key = (DatabaseConnection.get_active_connection_name(), parent, tuple(foreign_key["parent_columns"]))
+
+        with self._parent_keys_lock:
+            cached = self._parent_keys.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < self.PARENT_KEYS_TTL:
+            return cached[1]
+
+        rows = self.table_controller.fetch_all_keys(parent, foreign_key["parent_columns"])
+        keys = {
+            tuple(PrimaryKeyChecker.normalize_value(value, column) for value, column in zip(row, key_structure))
+            for row in rows
+        }
+        with self._parent_keys_lock:
+            self._parent_keys[cache_key] = (time.monotonic(), keys)
+        return keys
@@ -1,117 +1,465 @@
+import numpy as np
+import pandas as pd
+
+from controllers.management.column_validator import ColumnValidator
+from controllers.management.constraint_checker import ConstraintChecker
+from controllers.management.primary_key_checker import PrimaryKeyChecker
+from controllers.management.row_failures import RowFailures
+from controllers.management.transaction_policy import TransactionPolicy
+from controllers.management.validation_cache import ValidationCache
+from core.db_connection import DatabaseConnection
+from models.table.insert_statement import InsertStatement
+
+DEFAULT_BATCH_SIZE = 500  # Filas enviadas por cada `executemany`
+FILE_ROW_OFFSET = 2  # Etiqueta del índice + 2 = número de fila en el archivo (encabezado y base 1)
+
+
 class ImportController:
-    def __init__(self, table_controller, dataframe):
+    def __init__(self, table_controller, dataframe, chunk_reader=None):
         """
         Inicializa el controlador de importación.
         :param table_controller: Instancia de TableController con conexión activa.
-        :param dataframe: DataFrame con los datos cargados del archivo.
+        :param dataframe: DataFrame con los datos cargados del archivo (vista previa si se lee por bloques).
+        :param chunk_reader: CsvChunkReader opcional; si se indica, la importación recorre el archivo por bloques.
         """
         self.table_controller = table_controller
         self.dataframe = dataframe
+        self.chunk_reader = chunk_reader
         self.is_cancelled = False
+        self.row_failures = None  # RowFailures de la última validación de columnas
         # Verificar que la conexión esté activa antes de continuar
         self.table_controller.ensure_connection_active()
 
     def cancel(self):
         """
-        Cancela el proceso de importación estableciendo el flag `is_cancelled`.
+        Cancela la importación o la validación de columnas en curso estableciendo el flag `is_cancelled`.
         """
         self.is_cancelled = True
 
-    def import_data(self, table_name, columns_to_insert, on_omitted_callback=None, progress_callback=None):
+    def import_data(self, table_name, columns_to_insert, on_omitted_callback=None, progress_callback=None,
+                    batch_size=DEFAULT_BATCH_SIZE, transaction_policy=None, bytes_callback=None, row_failures=None):
         """
         Controla el proceso de importación de los datos desde el dataframe a la base de datos.
-        Procesa los registros uno a uno para manejar los errores en tiempo real.
+        Envía los registros en lotes de `batch_size` filas (un `executemany` por lote) y
+        reporta las filas rechazadas de cada lote de forma individual.
+        Si hay un lector por bloques, cada bloque se valida e inserta antes de leer el siguiente.
         :param table_name: Nombre de la tabla en la base de datos.
         :param columns_to_insert: Lista de las columnas que serán insertadas en la tabla.
         :param on_omitted_callback: Función que será llamada cuando un registro sea omitido.
-        :param progress_callback: Función que será llamada para actualizar el progreso.
+        :param progress_callback: Función llamada con (procesados, total, confirmados) para actualizar el progreso.
+                                  En la lectura por bloques el total es 0 porque no se conoce de antemano.
+        :param batch_size: Cantidad de filas enviadas por lote.
+        :param transaction_policy: TransactionPolicy que define cuándo confirmar; por defecto cada
+                                   `TransactionPolicy.DEFAULT_ROWS` filas.
+        :param bytes_callback: Función llamada con (bytes leídos, bytes totales) tras cada bloque leído.
+        :param row_failures: RowFailures de la validación previa; esas filas se omiten con su motivo sin
+                             enviarse a la base de datos. Se ignora en la lectura por bloques, donde cada
+                             bloque se valida al leerse.
         :return: Resumen del proceso de importación.
         """
-        if self.dataframe.empty:
+        if self.chunk_reader is None and self.dataframe.empty:
             raise ValueError("El DataFrame está vacío. No hay datos para importar.")
 
-        omitted_records = []  # Registros omitidos con detalles de errores
-        inserted_count = 0    # Contador de registros insertados correctamente
-        total_records = len(self.dataframe)
+        policy = transaction_policy or TransactionPolicy()
+        policy.start()
+
+        state = {
+            "inserted": 0,          # Contador de registros insertados correctamente
+            "omitted": [],          # Registros omitidos con detalles de errores
+            "total": 0,             # Total de registros (0 si se desconoce)
+            "on_omitted": on_omitted_callback,
+            "on_progress": progress_callback,
+        }
+
+        try:
+            if self.chunk_reader is not None:
+                table_structure = self.load_table_structure(table_name) or []
+                for chunk, bytes_read in self.chunk_reader:
+                    if self.is_cancelled:
+                        break
+                    columns = [col for col in columns_to_insert if col in chunk.columns]
+                    invalid_rows = self.find_invalid_rows(chunk, table_structure, table_name)
+                    bind_frame = self.get_bind_frame(chunk, columns, table_structure)
+                    self._import_frame(chunk, table_name, columns, batch_size, policy, state, invalid_rows,
+                                       bind_frame)
+                    if bytes_callback:
+                        bytes_callback(bytes_read, self.chunk_reader.total_bytes)
+            else:
+                state["total"] = len(self.dataframe)
+                columns = [col for col in columns_to_insert if col in self.dataframe.columns]
+                invalid_rows = None
+                if row_failures is not None and len(row_failures) == len(self.dataframe):
+                    invalid_rows = row_failures.to_invalid_rows()
+                table_structure = self.load_table_structure(table_name) or []
+                bind_frame = self.get_bind_frame(self.dataframe, columns, table_structure)
+                self._import_frame(self.dataframe, table_name, columns, batch_size, policy, state, invalid_rows,
+                                   bind_frame)
+
+            # Confirmar las filas pendientes (también si el usuario canceló) antes de liberar la sesión
+            if policy.pending_rows:
+                self.table_controller.commit()
+                policy.mark_committed()
+                self._report_progress(state, policy)
+        except Exception:
+            # Deshacer las filas no confirmadas para no devolver al pool una transacción abierta
+            self.table_controller.rollback()
+            raise
+        finally:
+            # Liberar los cursores de las sentencias preparadas y la sesión de la importación
+            self.table_controller.close_insert_statements()
 
-        for idx, row in self.dataframe.iterrows():
+        # Retornar un resumen del proceso
+        return {
+            "inserted": state["inserted"],
+            "committed": policy.committed_rows,
+            "errors": len(state["omitted"]),
+            "details": state["omitted"],
+            "cancelled": self.is_cancelled
+        }
+
+    def _import_frame(self, frame, table_name, columns, batch_size, policy, state, invalid_rows=None,
+                      bind_frame=None):
+        """
+        Inserta un DataFrame (completo o un bloque del archivo) en lotes de `batch_size` filas.
+        :param frame: DataFrame a insertar.
+        :param table_name: Nombre de la tabla.
+        :param columns: Columnas a insertar presentes en el DataFrame.
+        :param batch_size: Cantidad de filas enviadas por lote.
+        :param policy: TransactionPolicy en curso.
+        :param state: Diccionario con los contadores y callbacks de la importación.
+        :param invalid_rows: Diccionario opcional {posición en `frame`: motivo} de filas que no se envían.
+        :param bind_frame: DataFrame opcional de `get_bind_frame` con los valores a enlazar; por defecto
+                           se enlazan las columnas de `frame`. Los registros omitidos conservan los de `frame`.
+        """
+        batch_size = max(1, int(batch_size))
+        invalid_rows = invalid_rows or {}
+        if bind_frame is None:
+            bind_frame = frame[columns]
+
+        for start in range(0, len(frame), batch_size):
             if self.is_cancelled:
-                # Detener el proceso si el usuario lo cancela
+                # Detener el proceso si el usuario lo cancela (se verifica entre lotes)
                 break
 
-            try:
-                # Extraer solo las columnas relevantes para la inserción
-                row_data = {col: row[col] for col in columns_to_insert if col in row}
+            batch = frame.iloc[start:start + batch_size]
+            failed_offsets = {
+                offset: invalid_rows[start + offset] for offset in range(len(batch))
+                if start + offset in invalid_rows
+            }
+            valid_offsets = [offset for offset in range(len(batch)) if offset not in failed_offsets]
 
-                # Intentar insertar la fila en la base de datos usando el controlador de tablas
-                self.table_controller.insert_row(table_name, row_data)
-                inserted_count += 1
-            except Exception as e:
-                # En caso de error, agregar el registro omitido y su error
-                omitted_record = row.to_dict()
-                omitted_record["Errores"] = str(e)
-                omitted_records.append(omitted_record)
+            if valid_offsets:
+                # Extraer solo las columnas relevantes para la inserción, en el orden de la sentencia
+                bind_batch = bind_frame.iloc[start:start + batch_size]
+                rows = list(bind_batch.iloc[valid_offsets].itertuples(index=False, name=None))
+                # Insertar el lote completo usando el controlador de tablas (protegido por un savepoint).
+                # Si el driver rechaza el lote completo, el modelo lo divide para informar solo las filas con
+                # error; una excepción aquí (por ejemplo, sesión perdida) interrumpe la importación
+                batch_errors = self.table_controller.insert_batch(table_name, rows, columns, commit=False)
+                for offset, message in batch_errors:
+                    failed_offsets[valid_offsets[offset]] = message
+
+            for offset in sorted(failed_offsets):
+                # Agregar el registro omitido y su error
+                # Valores de Python (None para los nulos), también desde columnas compactas
+                omitted_record = {name: InsertStatement._to_bind_value(value)
+                                  for name, value in batch.iloc[offset].items()}
+                omitted_record["Errores"] = failed_offsets[offset]
+                state["omitted"].append(omitted_record)
 
                 # Llamar al callback para notificar a la vista
-                if on_omitted_callback:
-                    on_omitted_callback(omitted_record)
+                if state["on_omitted"]:
+                    state["on_omitted"](omitted_record)
 
-            # Llamar al callback para actualizar el progreso
-            if progress_callback:
-                progress_callback(inserted_count + len(omitted_records), total_records)
+            inserted = len(batch) - len(failed_offsets)
+            state["inserted"] += inserted
 
-        # Retornar un resumen del proceso
+            # Confirmar la transacción según la política elegida
+            policy.register(inserted)
+            if policy.should_commit():
+                self.table_controller.commit()
+                policy.mark_committed()
+
+            self._report_progress(state, policy)
+
+    @staticmethod
+    def get_bind_frame(frame, columns, table_structure):
+        """
+        Obtiene las columnas a insertar con las fechas de las columnas DATE y TIMESTAMP ya interpretadas
+        por `ColumnValidator.parse_datetimes`, la misma interpretación de la validación. Así Oracle recibe
+        la fecha validada y no un texto que convertiría con el NLS_DATE_FORMAT de la sesión.
+        :param frame: DataFrame (completo o un bloque del archivo).
+        :param columns: Columnas a insertar presentes en el DataFrame, en el orden de la sentencia.
+        :param table_structure: Lista de columnas de `get_table_structure_for_validation`.
+        :return: DataFrame con las columnas `columns` listo para enlazar.
+        """
+        bind_frame = frame[columns]
+        date_columns = [column["column_name"] for column in table_structure
+                        if column["column_name"] in columns and ColumnValidator.is_datetime_column(column)]
+        if not date_columns:
+            return bind_frame
+        bind_frame = bind_frame.copy()
+        for name in date_columns:
+            parsed_values, _ = ColumnValidator.parse_datetimes(bind_frame[name])
+            bind_frame[name] = pd.Series(parsed_values, index=bind_frame.index, dtype=object)
+        return bind_frame
+
+    @staticmethod
+    def _report_progress(state, policy):
+        """
+        Llama al callback de progreso con (procesados, total, confirmados).
+        """
+        if state["on_progress"]:
+            processed = state["inserted"] + len(state["omitted"])
+            state["on_progress"](processed, state["total"], policy.committed_rows)
+
+    def find_invalid_rows(self, frame, table_structure, table_name=None):
+        """
+        Valida un DataFrame fila a fila con las reglas de `validate_columns` y, si se indica la tabla,
+        con las restricciones NOT NULL y de claves foráneas.
+        :param frame: DataFrame a validar (por ejemplo, un bloque del archivo).
+        :param table_structure: Estructura de la tabla de `get_table_structure_for_validation`.
+        :param table_name: Nombre de la tabla destino para verificar las restricciones (opcional).
+        :return: Diccionario {posición en `frame`: motivo} con las filas que no superan la validación.
+        """
+        failures = RowFailures(len(frame))
+        for column in table_structure:
+            column_name = column["column_name"]
+            if column_name not in frame.columns:
+                continue
+
+            error, error_rows = self.validate_column(frame[column_name], column)
+            if error is None:
+                failures.add(self.validation_reason(column), self.skip_positions(frame[column_name], error_rows))
+
+        if table_name is not None:
+            self.add_constraint_failures(failures, frame, table_name, table_structure)
+
+        return failures.to_invalid_rows()
+
+    def add_constraint_failures(self, failures, frame, table_name, table_structure):
+        """
+        Agrega a `failures` las filas que violan restricciones NOT NULL o de claves foráneas.
+        :param failures: RowFailures del DataFrame.
+        :param frame: DataFrame a validar.
+        :param table_name: Nombre de la tabla destino.
+        :param table_structure: Estructura de la tabla de `get_table_structure_for_validation`.
+        :return: Diccionario con las posiciones 0-based por columna NOT NULL ("not_null") y por
+                 clave foránea ("foreign_keys").
+        """
+        checker = ConstraintChecker(self.table_controller)
+        found = {"not_null": {}, "foreign_keys": {}}
+
+        for column_name, positions in checker.not_null_failures(frame, table_structure):
+            failures.add(f"Valor nulo en columna obligatoria: {column_name}", positions)
+            found["not_null"][column_name] = positions
+
+        try:
+            foreign_key_failures = checker.foreign_key_failures(frame, table_name, table_structure)
+        except Exception as e:
+            print(f"Error al verificar las claves foráneas de la tabla {table_name}: {e}")
+            foreign_key_failures = []
+        for foreign_key, positions in foreign_key_failures:
+            columns_text = ", ".join(foreign_key["columns"])
+            failures.add(f"Sin registro padre en {foreign_key['parent_table']} ({columns_text})", positions)
+            found["foreign_keys"][f"{foreign_key['parent_table']} ({columns_text})"] = positions
+
+        return found
+
+    def check_constraints(self, table_name):
+        """
+        Prevalida las restricciones NOT NULL y de claves foráneas sobre el DataFrame cargado.
+        Las filas que las violan se agregan a `self.row_failures` para omitirlas en `import_data`.
+        En la lectura por bloques cada bloque se verifica al leerse.
+        :param table_name: Nombre de la tabla destino.
+        :return: Diccionario con los números de fila del archivo por columna NOT NULL ("not_null") y por
+                 clave foránea ("foreign_keys"); None si no se pudo verificar.
+        """
+        if self.chunk_reader is not None or self.dataframe is None or self.dataframe.empty:
+            return None
+
+        table_structure = self.load_table_structure(table_name) or []
+        if self.row_failures is None or len(self.row_failures) != len(self.dataframe):
+            self.row_failures = RowFailures(len(self.dataframe))
+        found = self.add_constraint_failures(self.row_failures, self.dataframe, table_name, table_structure)
+
+        row_data = self.dataframe.iloc[:, 0]
         return {
-            "inserted": inserted_count,
-            "errors": len(omitted_records),
-            "details": omitted_records,
-            "cancelled": self.is_cancelled
+            group: {name: self.to_file_rows(row_data, positions + 1) for name, positions in items.items()}
+            for group, items in found.items()
         }
 
-    def validate_columns(self, visible_columns, table_name):
+    @staticmethod
+    def skip_positions(column_data, error_rows):
+        """
+        Obtiene las filas que no se envían a la base de datos por un error de validación de la columna.
+        Los nulos quedan afuera aunque la regla los informe (por ejemplo, las de NUMBER): Oracle los guarda
+        como NULL y, si la columna es obligatoria, los rechaza la verificación NOT NULL.
+        :param column_data: Datos de la columna.
+        :param error_rows: Posiciones 1-based con error de `validate_column`.
+        :return: Posiciones 0-based de las filas que se omiten.
         """
-        Valida las columnas visibles que coinciden entre la tabla y el dataframe.
-        :param visible_columns: Lista de diccionarios con nombre y datos únicos de las columnas coincidentes.
+        positions = np.asarray(error_rows, dtype=np.int64) - 1
+        if len(positions) == 0:
+            return positions
+        nulls = ColumnValidator.null_mask(ColumnValidator.to_values(column_data))
+        return positions[~nulls[positions]]
+
+    @staticmethod
+    def validation_reason(column):
+        """
+        Texto con el que se informa en la grilla de omitidos una fila que no supera la validación.
+        :param column: Diccionario de `get_table_structure_for_validation`.
+        """
+        return f"Validación: {column['column_name']} ({column['data_type_formatted']})"
+
+    def validate_columns(self, visible_columns, table_name, on_column_validated=None):
+        """
+        Valida las columnas visibles que coinciden entre la tabla y el dataframe, una a una.
+        Las columnas no se validan en paralelo: el costo está en operaciones que retienen el GIL
+        (conversión de decimales a texto, factorización de objetos, interpretación de fechas), de modo
+        que varios hilos no lo reducen. La cancelación (`cancel`) se verifica entre columnas.
+        Las filas que fallan quedan en `self.row_failures` (RowFailures) para omitirlas en `import_data`.
+        Los resultados se guardan en una ValidationCache por tabla: al reabrir la importación solo se
+        revalidan las columnas cuyos datos o cuyo `last_ddl_time` cambiaron.
+        :param visible_columns: Lista de diccionarios con nombre y datos (Serie completa) de las columnas coincidentes.
         :param table_name: Nombre de la tabla.
-        :return: Lista con los resultados de validación por columna, incluyendo las filas con errores.
+        :param on_column_validated: Callback opcional que recibe el resultado de cada columna al terminar.
+        :return: Lista con los resultados de validación por columna, incluyendo los números de fila del archivo
+                 con errores, o None si la validación se canceló.
         """
-        validation_results = []
-        table_structure = self.table_controller.get_table_structure_for_validation(table_name)
+        # La caché consulta el `last_ddl_time` actual antes de leer la estructura: si la definición cambió,
+        # la estructura almacenada en la caché de metadatos se descarta y se vuelve a leer
+        cache = self.get_validation_cache(table_name)
+        table_structure = self.table_controller.get_table_structure_for_validation(table_name) or []
+        data_by_column = {col["column_name"]: col["data"] for col in visible_columns}
+        results = {}
+        row_failures = RowFailures(len(visible_columns[0]["data"]) if visible_columns else 0)
 
         for column in table_structure:
+            if self.is_cancelled:
+                # Las columnas ya validadas quedan en la caché; `row_failures` no se reemplaza por uno incompleto
+                if cache is not None:
+                    cache.save()
+                return None
             column_name = column["column_name"]
-            column_type = column["data_type"]
-            precision = column.get("precision")
-            scale = column.get("scale")
-            length = column.get("length")
-
-            column_data = next(
-                (col["data"] for col in visible_columns if col["column_name"] == column_name),
-                None
-            )
-
-            if column_data is not None:
-                if column_type == "NUMBER":
-                    error, error_rows = self.validate_number_column(column_data, precision, scale)
-                elif column_type == "VARCHAR2":
-                    error, error_rows = self.validate_varchar_column(column_data, length)
-                else:
-                    error = f"Tipo de dato {column_type} no soportado."
-                    error_rows = []
-
-                validation_results.append({
-                    "column_name": column_name,
-                    "status": "Correcto" if not error_rows else "Incorrecto",
-                    "errores": ', '.join(map(str, error_rows)) if error_rows else "Ningún error"
-                })
-            else:
-                validation_results.append({
+            if column_name not in data_by_column:
+                results[column_name] = {
                     "column_name": column_name,
                     "status": "No disponible en el dataframe",
                     "errores": "Ningún error"
-                })
+                }
+                if on_column_validated:
+                    on_column_validated(results[column_name])
+                continue
+
+            column, error, error_rows, result = self.validate_column_result(data_by_column[column_name], column, cache)
+            results[column_name] = result
+            if error is None:
+                row_failures.add(self.validation_reason(column),
+                                 self.skip_positions(data_by_column[column_name], error_rows))
+            if on_column_validated:
+                on_column_validated(result)
+
+        if cache is not None:
+            cache.save()
+        self.row_failures = row_failures
+        return [results[column["column_name"]] for column in table_structure]
+
+    def get_validation_cache(self, table_name):
+        """
+        Obtiene la caché de validación de la tabla para la conexión activa.
+        El `last_ddl_time` se consulta en la base de datos y no en la caché de metadatos, que puede
+        tener hasta una hora: un resultado no debe reutilizarse si la tabla cambió en ese lapso.
+        :param table_name: Nombre de la tabla.
+        :return: ValidationCache, o None si no se conoce el `last_ddl_time` de la tabla.
+        """
+        ddl_time = self.table_controller.get_ddl_time(table_name, fresh=True)
+        if ddl_time is None:
+            return None
+        return ValidationCache(DatabaseConnection.get_active_connection_name(), table_name, ddl_time)
+
+    def check_primary_keys(self, table_name):
+        """
+        Busca claves primarias repetidas en el archivo o ya existentes en la tabla antes de importar.
+        Las repeticiones (desde la segunda aparición) y las claves existentes se agregan a
+        `self.row_failures` para omitirlas en `import_data`. En la lectura por bloques no se verifica,
+        porque solo se dispone de la vista previa del archivo.
+        :param table_name: Nombre de la tabla destino.
+        :return: Diccionario con las columnas de la clave y los números de fila del archivo repetidos
+                 ("in_file") y existentes ("in_table"); None si no se pudo verificar.
+        """
+        if self.chunk_reader is not None or self.dataframe is None or self.dataframe.empty:
+            return None
 
-        return validation_results
+        try:
+            result = PrimaryKeyChecker(self.table_controller).check(self.dataframe, table_name)
+        except Exception as e:
+            print(f"Error al verificar la clave primaria de la tabla {table_name}: {e}")
+            return None
+        if result is None:
+            return None
+
+        if self.row_failures is None or len(self.row_failures) != len(self.dataframe):
+            self.row_failures = RowFailures(len(self.dataframe))
+        key_text = ", ".join(result["key_columns"])
+        self.row_failures.add(f"Clave primaria repetida en el archivo ({key_text})", result["repeated"])
+        self.row_failures.add(f"Clave primaria existente en la tabla ({key_text})", result["in_table"])
+
+        key_data = self.dataframe[result["key_columns"][0]]
+        return {
+            "key_columns": result["key_columns"],
+            "in_file": self.to_file_rows(key_data, result["in_file"] + 1),
+            "in_table": self.to_file_rows(key_data, result["in_table"] + 1),
+        }
+
+    def validate_column_result(self, column_data, column, cache=None):
+        """
+        Valida una columna y arma el resultado que se muestra en la grilla de validación.
+        Si la caché tiene un resultado para los mismos datos y la misma definición de la tabla, se reutiliza.
+        :param column_data: Datos de la columna.
+        :param column: Diccionario de `get_table_structure_for_validation`.
+        :param cache: ValidationCache opcional de la tabla.
+        :return: Tupla (columna, mensaje de error o None, posiciones 1-based con error,
+                 diccionario con el nombre de la columna, el estado y las filas del archivo con errores).
+        """
+        key = None
+        cached = None
+        if cache is not None:
+            try:
+                key = cache.column_key(column_data)
+            except Exception as e:
+                print(f"Error al calcular el hash de la columna {column['column_name']}: {e}")
+            cached = cache.get(column["column_name"], key) if key is not None else None
+
+        if cached is not None:
+            error, error_rows = cached["error"], cached["error_rows"]
+        else:
+            error, error_rows = self.validate_column(column_data, column)
+            if key is not None:
+                cache.put(column["column_name"], key, error, error_rows)
+        file_rows = self.to_file_rows(column_data, error_rows)
+        result = {
+            "column_name": column["column_name"],
+            "status": "Correcto" if len(file_rows) == 0 else "Incorrecto",
+            "errores": ', '.join(map(str, file_rows)) if len(file_rows) > 0 else "Ningún error"
+        }
+        return column, error, error_rows, result
+
+    @staticmethod
+    def to_file_rows(column_data, positions):
+        """
+        Convierte posiciones 1-based de una columna en números de fila del archivo.
+        Con índice entero, la fila es la etiqueta del índice + 2 (encabezado y numeración desde 1),
+        de modo que no se ve afectada por las filas vacías descartadas.
+        :param column_data: Serie validada.
+        :param positions: Arreglo con las posiciones 1-based de las filas con error.
+        :return: Arreglo con los números de fila del archivo.
+        """
+        index = getattr(column_data, "index", None)
+        if index is None or index.dtype.kind not in "iu" or len(positions) == 0:
+            return positions
+        return index.to_numpy()[positions - 1] + FILE_ROW_OFFSET
 
     def get_table_columns(self, table_name):
         """
@@ -128,37 +476,33 @@ class ImportController:
         columns = self.table_controller.get_table_structure_for_validation(table_name)
         return columns
 
+    def validate_column(self, column_data, column):
+        """
+        Valida una columna con el validador correspondiente a su tipo de dato Oracle,
+        evaluando cada valor distinto una sola vez.
+        :param column_data: Datos de la columna.
+        :param column: Diccionario de `get_table_structure_for_validation`.
+        :return: Tupla (mensaje de error o None, arreglo con las posiciones 1-based de las filas con error).
+        """
+        errors = ColumnValidator.distinct_errors(column_data, column)
+        if errors is None:
+            return f"Tipo de dato {column['data_type']} no soportado.", []
+        return None, ColumnValidator.error_positions(errors)
+
     def validate_number_column(self, column_data, precision, scale):
         """
         Valida una columna de tipo NUMBER, considerando precisión y escala.
+        La validación se calcula sobre la columna completa con `ColumnValidator`.
+        :return: Tupla (None, arreglo con las posiciones 1-based de las filas con error).
         """
-        scale = scale or 0
-        error_rows = []
+        errors = ColumnValidator.number_errors(column_data, precision, scale)
+        return None, ColumnValidator.error_positions(errors)
 
-        for idx, value in enumerate(column_data):
-            try:
-                if isinstance(value, (int, float)):
-                    if scale > 0 and '.' in str(value) and len(str(value).split('.')[1]) > scale:
-                        error_rows.append(idx + 1)
-                    if precision is not None and len(str(int(abs(value)))) > precision:
-                        error_rows.append(idx + 1)
-                else:
-                    float_value = float(value)
-                    if precision is not None and len(str(int(abs(float_value)))) > precision:
-                        error_rows.append(idx + 1)
-            except (ValueError, TypeError):
-                error_rows.append(idx + 1)
-
-        return None, error_rows
-
-    def validate_varchar_column(self, column_data, length):
+    def validate_varchar_column(self, column_data, length, char_used=None, byte_length=None):
         """
-        Valida una columna de tipo VARCHAR2 según su longitud máxima permitida.
+        Valida una columna de tipo VARCHAR2 según su longitud máxima permitida,
+        en caracteres o en bytes UTF-8 según CHAR_USED.
+        :return: Tupla (None, arreglo con las posiciones 1-based de las filas con error).
         """
-        error_rows = []
-
-        for idx, value in enumerate(column_data):
-            if len(str(value)) > length:
-                error_rows.append(idx + 1)
-
-        return None, error_rows
+        errors = ColumnValidator.varchar_errors(column_data, length, char_used, byte_length)
+        return None, ColumnValidator.error_positions(errors)
@@ -0,0 +1,51 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+
+
+class ImportWorker(QObject):
+    """
+    Ejecuta ImportController.import_data en un hilo secundario (QThread).
+    El avance, los registros omitidos y el resultado se envían a la vista mediante señales,
+    que Qt encola hacia el hilo de la interfaz.
+    """
+    progress = pyqtSignal(int, int, int)  # Procesados, total, confirmados
+    bytes_read = pyqtSignal(object, object)  # Bytes leídos y bytes totales (lectura por bloques)
+    omitted = pyqtSignal(dict)            # Registro omitido con su error
+    completed = pyqtSignal(dict)          # Resumen de la importación
+    failed = pyqtSignal(str)              # Error que interrumpió la importación
+
+    def __init__(self, import_controller, table_name, columns_to_insert, **import_options):
+        """
+        Inicializa el worker de importación.
+        :param import_controller: ImportController que realiza la importación.
+        :param table_name: Nombre de la tabla destino.
+        :param columns_to_insert: Columnas que serán insertadas.
+        :param import_options: Parámetros adicionales para `import_data` (batch_size, transaction_policy, ...).
+        """
+        super().__init__()
+        self.import_controller = import_controller
+        self.table_name = table_name
+        self.columns_to_insert = columns_to_insert
+        self.import_options = import_options
+
+    def run(self):
+        """
+        Ejecuta la importación. Se conecta a la señal `started` del QThread.
+        """
+        try:
+            result = self.import_controller.import_data(
+                self.table_name,
+                self.columns_to_insert,
+                on_omitted_callback=self.omitted.emit,
+                progress_callback=self.progress.emit,
+                bytes_callback=self.bytes_read.emit,
+                **self.import_options
+            )
+            self.completed.emit(result)
+        except Exception as e:
+            self.failed.emit(str(e))
+
+    def cancel(self):
+        """
+        Solicita la cancelación; se hace efectiva en el próximo límite de lote.
+        """
+        self.import_controller.cancel()
@@ -0,0 +1,137 @@
+import datetime
+from decimal import Decimal, InvalidOperation
+
+import numpy as np
+import pandas as pd
+
+from controllers.management.column_validator import ColumnValidator
+from models.table.insert_statement import NUMBER_TYPES
+
+
+class PrimaryKeyChecker:
+    """
+    Detecta claves primarias duplicadas antes de importar: repetidas dentro del archivo y ya
+    existentes en la tabla destino. Los valores de la clave se normalizan según el tipo de cada
+    columna (por ejemplo, "001", 1 y 1.0 son la misma clave NUMBER) y se comparan por hash.
+    """
+
+    # Se lee la tabla completa si tiene menos de SCAN_RATIO filas por cada clave distinta del archivo;
+    # si no, se sondean solo las claves del archivo con consultas IN.
+    SCAN_RATIO = 10
+
+    def __init__(self, table_controller):
+        """
+        Inicializa el verificador.
+        :param table_controller: TableController con conexión activa.
+        """
+        self.table_controller = table_controller
+
+    @staticmethod
+    def normalize_value(value, column):
+        """
+        Normaliza un valor de la clave para compararlo con los de la base de datos.
+        :param value: Valor del archivo o de la base de datos.
+        :param column: Diccionario de `get_table_structure_for_validation`.
+        :return: Valor normalizado, o None si es nulo o no se puede convertir al tipo de la columna.
+        """
+        if isinstance(value, np.generic):
+            value = value.item()
+        if value is None or (not isinstance(value, (str, Decimal)) and pd.isna(value)):
+            return None
+
+        data_type = column.get("data_type", "")
+        if data_type in NUMBER_TYPES:
+            try:
+                number = Decimal(value.strip() if isinstance(value, str) else
+                                 repr(value) if isinstance(value, float) else value)
+            except (InvalidOperation, TypeError, ValueError):
+                return None
+            return number if number.is_finite() else None
+        if data_type in ("CHAR", "NCHAR"):
+            # Oracle completa los CHAR con blancos: la clave se compara sin ellos
+            return str(value).rstrip(" ")
+        if ColumnValidator.is_datetime_column(column):
+            if isinstance(value, str):
+                try:
+                    return datetime.datetime.fromisoformat(value.strip())
+                except ValueError:
+                    pass
+            timestamp = pd.to_datetime(value, dayfirst=True, errors="coerce")
+            return None if pd.isna(timestamp) else timestamp.to_pydatetime()
+        return value if isinstance(value, str) else str(value)
+
+    @classmethod
+    def normalize_column(cls, column_data, column):
+        """
+        Normaliza una columna de la clave evaluando una sola vez cada valor distinto.
+        :param column_data: Serie con los valores de la columna.
+        :param column: Diccionario de `get_table_structure_for_validation`.
+        :return: Arreglo object con el valor normalizado de cada fila.
+        """
+        if ColumnValidator.is_datetime_column(column):
+            # Las fechas se comparan con la misma interpretación que se valida y se enlaza al insertar
+            parsed_values, errors = ColumnValidator.parse_datetimes(column_data)
+            parsed_values[errors] = None
+            column_data = pd.Series(parsed_values, index=getattr(column_data, "index", None), dtype=object)
+        values, codes, first_positions = ColumnValidator.factorize(column_data)
+        normalized = np.empty(len(first_positions), dtype=object)
+        normalized[:] = [cls.normalize_value(value, column) for value in values[first_positions]]
+        return normalized[codes]
+
+    def check(self, frame, table_name):
+        """
+        Busca claves primarias repetidas en el archivo y claves que ya existen en la tabla.
+        Las filas con algún valor de la clave nulo o inválido no se comparan (las informa la validación).
+        :param frame: DataFrame a importar.
+        :param table_name: Nombre de la tabla destino.
+        :return: Diccionario con "key_columns", "in_file" (posiciones de todas las filas con clave repetida),
+                 "repeated" (posiciones de las repeticiones después de la primera aparición) e "in_table"
+                 (posiciones cuya clave ya existe); None si la tabla no tiene clave primaria o el archivo
+                 no contiene todas sus columnas.
+        """
+        key_columns = self.table_controller.get_primary_key_columns(table_name)
+        if not key_columns or any(col not in frame.columns for col in key_columns):
+            return None
+
+        structure = {col["column_name"]: col for col in
+                     (self.table_controller.get_table_structure_for_validation(table_name) or [])}
+        key_structure = [structure.get(col, {"column_name": col}) for col in key_columns]
+
+        arrays = [self.normalize_column(frame[col], column) for col, column in zip(key_columns, key_structure)]
+        complete = np.logical_and.reduce([~pd.isna(array) for array in arrays])
+        positions = np.flatnonzero(complete)
+        key_frame = pd.DataFrame({position: array[complete] for position, array in enumerate(arrays)},
+                                 dtype=object)
+
+        in_file = positions[key_frame.duplicated(keep=False).to_numpy()]
+        repeated = positions[key_frame.duplicated(keep="first").to_numpy()]
+
+        unique_keys = list(key_frame.drop_duplicates().itertuples(index=False, name=None))
+        existing = self.fetch_existing(table_name, key_columns, key_structure, unique_keys)
+        in_table = np.empty(0, dtype=np.int64)
+        if existing:
+            in_table = positions[pd.MultiIndex.from_frame(key_frame).isin(list(existing))]
+
+        return {"key_columns": key_columns, "in_file": in_file, "repeated": repeated, "in_table": in_table}
+
+    def fetch_existing(self, table_name, key_columns, key_structure, unique_keys):
+        """
+        Obtiene de la tabla las claves que coinciden con las del archivo, leyendo la tabla completa
+        si es chica respecto del archivo o sondeando las claves en grupos en caso contrario.
+        :return: Conjunto de tuplas normalizadas.
+        """
+        if not unique_keys:
+            return set()
+
+        estimate = self.table_controller.get_row_estimate(table_name)
+        padded = any(column.get("data_type") in ("CHAR", "NCHAR") for column in key_structure)
+        if padded or (estimate is not None and estimate <= len(unique_keys) * self.SCAN_RATIO):
+            # Las columnas CHAR no se pueden sondear con valores sin relleno: se lee la tabla completa
+            rows = self.table_controller.fetch_all_keys(table_name, key_columns)
+        else:
+            rows = self.table_controller.fetch_existing_keys(table_name, key_columns, unique_keys)
+
+        return {
+            tuple(self.normalize_value(value, column) for value, column in zip(row, key_structure))
+            for row in rows
+        }
@@ -0,0 +1,51 @@
+import numpy as np
+
+
+class RowFailures:
+    """
+    Mapa por fila de los registros que no superan la validación previa a la importación.
+    Guarda un bitmap con una posición por fila del DataFrame y, por cada motivo, las posiciones
+    afectadas, de modo que la importación pueda omitir esas filas sin enviarlas a la base de datos.
+    """
+
+    def __init__(self, row_count):
+        """
+        Inicializa el mapa de fallas.
+        :param row_count: Cantidad de filas del DataFrame validado.
+        """
+        self.row_count = row_count
+        self.bitmap = np.zeros(row_count, dtype=bool)
+        self.reasons = []  # (motivo, posiciones 0-based)
+
+    def __len__(self):
+        return self.row_count
+
+    def add(self, reason, positions):
+        """
+        Registra las filas que fallan por un motivo.
+        :param reason: Texto del motivo, por ejemplo "Validación: COLUMNA (NUMBER (10))".
+        :param positions: Posiciones 0-based de las filas que fallan.
+        """
+        positions = np.asarray(positions, dtype=np.int64)
+        if len(positions) == 0:
+            return
+        self.bitmap[positions] = True
+        self.reasons.append((reason, positions))
+
+    @property
+    def failed_count(self):
+        """
+        Cantidad de filas con al menos una falla.
+        """
+        return int(np.count_nonzero(self.bitmap))
+
+    def to_invalid_rows(self):
+        """
+        Convierte el mapa en el formato que usa la importación para omitir filas.
+        :return: Diccionario {posición: motivos separados por "; "}.
+        """
+        invalid_rows = {}
+        for reason, positions in self.reasons:
+            for position in positions.tolist():
+                invalid_rows[position] = f"{invalid_rows[position]}; {reason}" if position in invalid_rows else reason
+        return invalid_rows
@@ -0,0 +1,71 @@
+import time
+
+
+class TransactionPolicy:
+    """
+    Define cuándo se confirma (commit) la transacción durante una importación:
+    cada N filas, cada T segundos o una sola vez al finalizar.
+    """
+
+    EVERY_ROWS = "rows"
+    EVERY_SECONDS = "seconds"
+    AT_END = "end"
+
+    # Descripciones mostradas en la vista de importación
+    MODES = {
+        EVERY_ROWS: "Cada N filas",
+        EVERY_SECONDS: "Cada T segundos",
+        AT_END: "Al finalizar",
+    }
+
+    DEFAULT_ROWS = 5000
+    DEFAULT_SECONDS = 30
+
+    def __init__(self, mode=EVERY_ROWS, interval=DEFAULT_ROWS):
+        """
+        Inicializa la política de transacciones.
+        :param mode: Uno de EVERY_ROWS, EVERY_SECONDS o AT_END.
+        :param interval: Cantidad de filas o segundos entre confirmaciones (ignorado en AT_END).
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Modo de transacción no soportado: {mode}")
+        self.mode = mode
+        self.interval = max(1, int(interval or 1))
+        self.pending_rows = 0     # Filas insertadas aún no confirmadas
+        self.committed_rows = 0   # Filas confirmadas en la base de datos
+        self.last_commit = time.monotonic()
+
+    def start(self):
+        """
+        Reinicia los contadores al comenzar una importación.
+        """
+        self.pending_rows = 0
+        self.committed_rows = 0
+        self.last_commit = time.monotonic()
+
+    def register(self, inserted_rows):
+        """
+        Registra filas insertadas en la transacción en curso.
+        :param inserted_rows: Cantidad de filas insertadas correctamente.
+        """
+        self.pending_rows += inserted_rows
+
+    def should_commit(self):
+        """
+        Indica si corresponde confirmar la transacción en este punto.
+        """
+        if self.pending_rows == 0:
+            return False
+        if self.mode == self.EVERY_ROWS:
+            return self.pending_rows >= self.interval
+        if self.mode == self.EVERY_SECONDS:
+            return time.monotonic() - self.last_commit >= self.interval
+        return False
+
+    def mark_committed(self):
+        """
+        Actualiza los contadores luego de un commit exitoso.
+        """
+        self.committed_rows += self.pending_rows
+        self.pending_rows = 0
+        self.last_commit = time.monotonic()
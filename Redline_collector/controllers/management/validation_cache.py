@@ -0,0 +1,158 @@
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+
+import numpy as np
+import pandas as pd
+
+
+class ValidationCache:
+    """
+    Caché en disco de los resultados de validación por columna de una tabla.
+    Cada resultado se guarda con el hash de los datos de la columna y el `last_ddl_time` de la tabla,
+    de modo que al reabrir una importación solo se revalidan las columnas cuyos datos o cuya
+    definición en la tabla cambiaron. Las filas con error se guardan como rangos [inicio, fin]
+    de posiciones consecutivas, no como una lista con cada fila.
+    """
+
+    VERSION = 3  # Se incrementa cuando cambian las reglas de validación o la forma de los resultados
+
+    def __init__(self, connection_name, table_name, ddl_time):
+        """
+        Inicializa la caché de una tabla y carga su contenido persistido, si existe.
+        :param connection_name: Nombre de la conexión.
+        :param table_name: Nombre de la tabla.
+        :param ddl_time: `last_ddl_time` actual de la tabla.
+        """
+        self.table_name = table_name
+        self.ddl_time = ddl_time
+        self.file_path = self.get_cache_path(connection_name, table_name)
+        self._lock = threading.Lock()
+        self.columns = {}  # Columna -> {"key", "ddl_time", "error", "error_ranges"}
+        self.dirty = False
+        self.load()
+
+    @staticmethod
+    def get_cache_path(connection_name, table_name):
+        """
+        Devuelve la ruta del archivo de caché según el entorno (desarrollo o ejecutable).
+        """
+        if getattr(sys, 'frozen', False):  # Si está en un ejecutable
+            base_path = os.path.dirname(os.path.abspath(sys.executable))
+        else:  # Si está en desarrollo
+            base_path = os.path.abspath(".")
+        file_name = re.sub(r"[^A-Za-z0-9_.-]", "_", f"{connection_name}_{table_name}") + ".json"
+        return os.path.join(base_path, "cache", "validation", file_name)
+
+    @staticmethod
+    def column_key(column_data):
+        """
+        Calcula el hash del contenido de una columna, incluido su índice (del que salen los números
+        de fila informados) y el tipo de sus valores. En las columnas object se incluye el tipo de
+        cada valor, porque el hash de pandas no distingue 1 de "1" ni None de NaN y las reglas de
+        validación sí.
+        :param column_data: Serie con los datos de la columna.
+        :return: Texto hexadecimal que identifica los datos.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{len(column_data)}|{column_data.dtype}|".encode("utf-8"))
+        digest.update(pd.api.types.infer_dtype(column_data, skipna=False).encode("utf-8"))
+        digest.update(pd.util.hash_pandas_object(column_data, index=True).to_numpy().tobytes())
+        if column_data.dtype == object:
+            types = np.frompyfunc(lambda value: type(value).__qualname__, 1, 1)(column_data.to_numpy())
+            digest.update(pd.util.hash_array(types.astype(object)).tobytes())
+        return digest.hexdigest()
+
+    def get(self, column_name, key):
+        """
+        Obtiene el resultado almacenado de una columna si sus datos y la definición de la tabla no cambiaron.
+        :param column_name: Nombre de la columna.
+        :param key: Hash de los datos de `column_key`.
+        :return: Diccionario con "error" y "error_rows" (arreglo con las posiciones 1-based con error),
+                 o None si no hay un resultado vigente.
+        """
+        with self._lock:
+            entry = self.columns.get(column_name)
+        if entry is None or entry["key"] != key or entry["ddl_time"] != self.ddl_time:
+            return None
+        return {"error": entry["error"], "error_rows": self.from_ranges(entry["error_ranges"])}
+
+    def put(self, column_name, key, error, error_rows):
+        """
+        Almacena el resultado de una columna (se persiste con `save`).
+        :param column_name: Nombre de la columna.
+        :param key: Hash de los datos de `column_key`.
+        :param error: Mensaje de tipo no soportado o None.
+        :param error_rows: Posiciones 1-based de las filas con error.
+        """
+        with self._lock:
+            self.columns[column_name] = {
+                "key": key,
+                "ddl_time": self.ddl_time,
+                "error": error,
+                "error_ranges": self.to_ranges(error_rows),
+            }
+            self.dirty = True
+
+    @staticmethod
+    def to_ranges(positions):
+        """
+        Agrupa posiciones en rangos de valores consecutivos.
+        :param positions: Posiciones enteras (en cualquier orden, con o sin repetidos).
+        :return: Lista de pares [inicio, fin], ambos incluidos, en orden creciente.
+        """
+        positions = np.unique(np.asarray(positions, dtype=np.int64))
+        if len(positions) == 0:
+            return []
+        breaks = np.flatnonzero(np.diff(positions) != 1) + 1
+        starts = positions[np.r_[0, breaks]]
+        ends = positions[np.r_[breaks - 1, len(positions) - 1]]
+        return np.column_stack([starts, ends]).tolist()
+
+    @staticmethod
+    def from_ranges(ranges):
+        """
+        Expande los rangos de `to_ranges` en las posiciones que representan.
+        :param ranges: Lista de pares [inicio, fin].
+        :return: Arreglo con las posiciones, en orden creciente.
+        """
+        ranges = np.asarray(ranges, dtype=np.int64).reshape(-1, 2)
+        lengths = ranges[:, 1] - ranges[:, 0] + 1
+        offsets = np.repeat(ranges[:, 0] - (np.cumsum(lengths) - lengths), lengths)
+        return offsets + np.arange(int(lengths.sum()), dtype=np.int64)
+
+    def load(self):
+        """
+        Carga el contenido persistido en disco; si no existe o está dañado, la caché queda vacía.
+        """
+        try:
+            with open(self.file_path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            if data.get("version") != self.VERSION:
+                return
+            self.columns = data.get("columns", {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error al leer la caché de validación {self.file_path}: {e}")
+
+    def save(self):
+        """
+        Persiste la caché en disco si cambió (escritura atómica mediante un archivo temporal).
+        """
+        with self._lock:
+            if not self.dirty:
+                return
+            data = {"version": self.VERSION, "table_name": self.table_name, "columns": self.columns}
+            self.dirty = False
+        try:
+            os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+            temp_path = f"{self.file_path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(data, file)
+            os.replace(temp_path, self.file_path)
+        except Exception as e:
+            print(f"Error al guardar la caché de validación {self.file_path}: {e}")
@@ -0,0 +1,45 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+
+
+class ValidationWorker(QObject):
+    """
+    Ejecuta ImportController.validate_columns en un hilo secundario (QThread).
+    Cada columna validada se envía a la vista en cuanto termina, sin esperar al resto;
+    al final se verifican las claves primarias duplicadas y las restricciones NOT NULL y de claves foráneas.
+    Si se cancela (`ImportController.cancel`), termina al acabar la columna en curso sin emitir `completed`.
+    """
+    column_validated = pyqtSignal(dict)  # Resultado de una columna
+    keys_checked = pyqtSignal(object)    # Resumen de claves primarias duplicadas (o None)
+    constraints_checked = pyqtSignal(object)  # Resumen de nulos y claves foráneas sin padre (o None)
+    completed = pyqtSignal(list)         # Resultados de todas las columnas, en el orden de la tabla
+    failed = pyqtSignal(str)             # Error que interrumpió la validación
+
+    def __init__(self, import_controller, visible_columns, table_name):
+        """
+        Inicializa el worker de validación.
+        :param import_controller: ImportController que realiza la validación.
+        :param visible_columns: Columnas coincidentes con sus datos.
+        :param table_name: Nombre de la tabla destino.
+        """
+        super().__init__()
+        self.import_controller = import_controller
+        self.visible_columns = visible_columns
+        self.table_name = table_name
+
+    def run(self):
+        """
+        Ejecuta la validación. Se conecta a la señal `started` del QThread.
+        """
+        try:
+            results = self.import_controller.validate_columns(
+                self.visible_columns,
+                self.table_name,
+                on_column_validated=self.column_validated.emit
+            )
+            if results is None:
+                return
+            self.keys_checked.emit(self.import_controller.check_primary_keys(self.table_name))
+            self.constraints_checked.emit(self.import_controller.check_constraints(self.table_name))
+            self.completed.emit(results)
+        except Exception as e:
+            self.failed.emit(str(e))
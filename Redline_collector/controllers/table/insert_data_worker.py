@@ -0,0 +1,58 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+
+
+class InsertDataWorker(QObject):
+    """
+    Ejecuta TableModel.insert_data por lotes en un hilo secundario (QThread),
+    notificando el avance a la interfaz mediante señales.
+    """
+    progress = pyqtSignal(int)   # Registros procesados
+    completed = pyqtSignal(dict)  # Índices insertados y errores acumulados
+    failed = pyqtSignal(str)      # Error que interrumpió la inserción
+
+    def __init__(self, model, table_name, dataframe, columns_to_insert, batch_size=1):
+        """
+        Inicializa el worker de inserción.
+        :param model: TableModel que realiza la inserción.
+        :param table_name: Nombre de la tabla.
+        :param dataframe: DataFrame con los datos a insertar.
+        :param columns_to_insert: Columnas seleccionadas para la inserción.
+        :param batch_size: Tamaño del lote para la inserción.
+        """
+        super().__init__()
+        self.model = model
+        self.table_name = table_name
+        self.dataframe = dataframe
+        self.columns_to_insert = columns_to_insert
+        self.batch_size = max(1, batch_size)
+        self.is_cancelled = False
+
+    def run(self):
+        """
+        Inserta el DataFrame lote por lote. La cancelación se verifica entre lotes.
+        """
+        result = {"success": [], "errors": []}
+        try:
+            for i in range(0, len(self.dataframe), self.batch_size):
+                if self.is_cancelled:
+                    break
+
+                batch = self.dataframe.iloc[i:i + self.batch_size]
+                batch_result = self.model.insert_data(self.table_name, batch, self.columns_to_insert, self.batch_size)
+
+                # Actualizar resultados acumulados
+                result["success"].extend(batch_result["success"])
+                result["errors"].extend(batch_result["errors"])
+                self.progress.emit(len(result["success"]) + len(result["errors"]))
+
+            self.completed.emit(result)
+        except Exception as e:
+            self.failed.emit(str(e))
+        finally:
+            self.model.close_insert_statements()
+
+    def cancel(self):
+        """
+        Solicita la cancelación de la inserción.
+        """
+        self.is_cancelled = True
@@ -1,6 +1,8 @@
+import threading
 from models.table.table_model import TableModel
 from core.db_connection import DatabaseConnection
-from PyQt5.QtCore import QCoreApplication
+from controllers.table.insert_data_worker import InsertDataWorker
+from PyQt5.QtCore import QEventLoop, QThread, Qt
 from views.dialogs.progress_dialog import ProgressDialog
 
 class TableController:
@@ -28,10 +30,34 @@ class TableController:
             # Poblar el combo box con las tablas cargadas
             self.view.populate_combo_box(self.all_tables)
             self.view.enable_table_controls(bool(self.all_tables))
+
+            # Precargar en segundo plano la estructura de todas las tablas
+            threading.Thread(target=self.prefetch_table_structures, daemon=True).start()
         except Exception as e:
             print(f"Error al conectar y cargar las tablas: {e}")
             self.view.enable_table_controls(False)
 
+    def prefetch_table_structures(self):
+        """
+        Carga en la caché de metadatos la estructura de todas las tablas de la conexión activa.
+        """
+        try:
+            self.model.prefetch_table_structures()
+        except Exception as e:
+            print(f"Error al precargar la estructura de las tablas: {e}")
+
+    def refresh_tables(self):
+        """
+        Descarta la caché de metadatos de la conexión activa y vuelve a cargar las tablas.
+        """
+        try:
+            self.ensure_connection_active()
+            self.all_tables = self.model.refresh_metadata()
+            self.view.populate_combo_box(self.all_tables)
+            self.view.enable_table_controls(bool(self.all_tables))
+        except Exception as e:
+            print(f"Error al refrescar las tablas: {e}")
+
     def filter_tables(self, text):
         """
         Filtra las tablas localmente según el texto ingresado.
@@ -64,7 +90,6 @@ class TableController:
         """
         try:
             self.ensure_connection_active()
-            connection = DatabaseConnection.get_connection()
             return self.model.get_table_structure(table_name)
         except Exception as e:
             print(f"Error al obtener la estructura de la tabla {table_name}: {e}")
@@ -78,12 +103,87 @@ class TableController:
         """
         try:
             self.ensure_connection_active()
-            connection = DatabaseConnection.get_connection()
             return self.model.get_table_structure_for_validation(table_name)
         except Exception as e:
             print(f"Error al obtener la estructura para validación de la tabla {table_name}: {e}")
             return None
 
+    def get_ddl_time(self, table_name, fresh=False):
+        """
+        Obtiene la fecha de la última modificación de la definición de la tabla.
+        :param table_name: Nombre de la tabla.
+        :param fresh: Si es True, se consulta en la base de datos en lugar de usar la caché de metadatos.
+        :return: `last_ddl_time` como texto, o None si no se conoce o si ocurre un error.
+        """
+        try:
+            self.ensure_connection_active()
+            return self.model.get_ddl_time(table_name, fresh)
+        except Exception as e:
+            print(f"Error al obtener la fecha de modificación de la tabla {table_name}: {e}")
+            return None
+
+    def get_primary_key_columns(self, table_name):
+        """
+        Obtiene las columnas de la clave primaria de la tabla.
+        :param table_name: Nombre de la tabla.
+        :return: Lista de columnas, o None si ocurre un error.
+        """
+        try:
+            self.ensure_connection_active()
+            return self.model.get_primary_key_columns(table_name)
+        except Exception as e:
+            print(f"Error al obtener la clave primaria de la tabla {table_name}: {e}")
+            return None
+
+    def get_foreign_keys(self, table_name):
+        """
+        Obtiene las claves foráneas de la tabla.
+        :param table_name: Nombre de la tabla.
+        :return: Lista de claves foráneas, o None si ocurre un error.
+        """
+        try:
+            self.ensure_connection_active()
+            return self.model.get_foreign_keys(table_name)
+        except Exception as e:
+            print(f"Error al obtener las claves foráneas de la tabla {table_name}: {e}")
+            return None
+
+    def get_row_estimate(self, table_name):
+        """
+        Obtiene la cantidad de filas estimada de la tabla.
+        :param table_name: Nombre de la tabla.
+        :return: Cantidad de filas, o None si no hay estadísticas o si ocurre un error.
+        """
+        try:
+            self.ensure_connection_active()
+            return self.model.get_row_estimate(table_name)
+        except Exception as e:
+            print(f"Error al obtener la cantidad de filas de la tabla {table_name}: {e}")
+            return None
+
+    def fetch_all_keys(self, table_name, key_columns):
+        """
+        Trae todas las claves de la tabla.
+        :param table_name: Nombre de la tabla.
+        :param key_columns: Columnas de la clave.
+        :return: Lista de tuplas con las claves.
+        :raises: Excepción si falla la consulta.
+        """
+        self.ensure_connection_active()
+        return self.model.fetch_all_keys(table_name, key_columns)
+
+    def fetch_existing_keys(self, table_name, key_columns, keys):
+        """
+        Busca en la tabla las claves indicadas.
+        :param table_name: Nombre de la tabla.
+        :param key_columns: Columnas de la clave.
+        :param keys: Lista de tuplas con los valores a buscar.
+        :return: Lista de tuplas con las claves que existen en la tabla.
+        :raises: Excepción si falla la consulta.
+        """
+        self.ensure_connection_active()
+        return self.model.fetch_existing_keys(table_name, key_columns, keys)
+
     def insert_data_to_table(self, table_name, dataframe, columns_to_insert, batch_size=1):
         """
         Inserta datos en la tabla seleccionada utilizando el modelo.
@@ -95,7 +195,6 @@ class TableController:
         """
         try:
             self.ensure_connection_active()
-            connection = DatabaseConnection.get_connection()
             
             # Total de registros para la barra de progreso
             total_records = len(dataframe)
@@ -104,23 +203,34 @@ class TableController:
             progress_dialog = ProgressDialog(total_records)
             progress_dialog.show()
 
-            # Procesar la inserción a través del modelo
-            result = {"success": [], "errors": []}
-            for i in range(0, total_records, batch_size):
-                batch = dataframe.iloc[i:i + batch_size]
-                batch_result = self.model.insert_data(table_name, batch, columns_to_insert, batch_size)
-                
-                # Actualizar resultados acumulados
-                result["success"].extend(batch_result["success"])
-                result["errors"].extend(batch_result["errors"])
-                
-                # Actualizar barra de progreso
-                progress_dialog.update_progress(len(result["success"]) + len(result["errors"]))
-                QCoreApplication.processEvents()  # Permite refrescar la interfaz
+            # Procesar la inserción en un hilo secundario; la interfaz se actualiza por señales
+            worker = InsertDataWorker(self.model, table_name, dataframe, columns_to_insert, batch_size)
+            thread = QThread()
+            worker.moveToThread(thread)
+
+            outcome = {}
+            loop = QEventLoop()
+            thread.started.connect(worker.run)
+            worker.progress.connect(progress_dialog.update_progress, Qt.QueuedConnection)
+            worker.completed.connect(lambda result: outcome.update(result=result), Qt.QueuedConnection)
+            worker.failed.connect(lambda message: outcome.update(error=message), Qt.QueuedConnection)
+            worker.completed.connect(loop.quit, Qt.QueuedConnection)
+            worker.failed.connect(loop.quit, Qt.QueuedConnection)
+            # La cancelación solo levanta un flag, por lo que se ejecuta directamente
+            progress_dialog.cancel_signal.connect(worker.cancel, Qt.DirectConnection)
+
+            thread.start()
+            loop.exec_()  # Espera sin bloquear la interfaz hasta que el worker termine
+            thread.quit()
+            thread.wait()
 
             # Cerrar el diálogo al terminar
             progress_dialog.close_dialog()
 
+            if "error" in outcome:
+                raise RuntimeError(outcome["error"])
+            result = outcome["result"]
+
             # Retornar el resumen de resultados
             return {
                 "inserted": len(result["success"]),
@@ -144,21 +254,53 @@ class TableController:
         """
         try:
             self.ensure_connection_active()
-            connection = DatabaseConnection.get_connection()
             return self.model.get_table_columns(table_name)
         except Exception as e:
             print(f"Error al obtener las columnas de la tabla {table_name}: {e}")
             return []
 
-    def insert_row(self, table_name, row_data):
+    def insert_row(self, table_name, row_data, commit=True):
         """
         Inserta una sola fila en la tabla especificada.
         :param table_name: Nombre de la tabla.
         :param row_data: Diccionario con los datos de la fila a insertar.
+        :param commit: Si es False, la fila no se confirma hasta el próximo `commit`.
         :raises: Excepción si ocurre un error durante la inserción.
         """
         try:
-            self.model.insert_row(table_name, row_data)
+            self.model.insert_row(table_name, row_data, commit)
         except Exception as e:
             raise ValueError(f"Error al insertar fila en la tabla '{table_name}': {e}")
 
+    def insert_batch(self, table_name, rows, columns, commit=True):
+        """
+        Inserta un lote de filas en la tabla especificada en un solo viaje a la base de datos.
+        :param table_name: Nombre de la tabla.
+        :param rows: Lista de secuencias de valores en el orden de `columns`.
+        :param columns: Columnas a insertar.
+        :param commit: Si es False, el lote no se confirma hasta el próximo `commit`.
+        :return: Lista de tuplas (posición dentro del lote, mensaje de error) de las filas rechazadas.
+        :raises: Excepción si falla el lote completo.
+        """
+        try:
+            return self.model.insert_batch(table_name, rows, columns, commit)
+        except Exception as e:
+            raise ValueError(f"Error al insertar lote en la tabla '{table_name}': {e}")
+
+    def close_insert_statements(self):
+        """
+        Cierra las sentencias INSERT preparadas por el modelo.
+        """
+        self.model.close_insert_statements()
+
+    def commit(self):
+        """
+        Confirma la transacción en curso.
+        """
+        self.model.commit()
+
+    def rollback(self):
+        """
+        Deshace la transacción en curso.
+        """
+        self.model.rollback()
@@ -1,5 +1,6 @@
 from PyQt5.QtWidgets import QMessageBox
 from cryptography.fernet import Fernet
+from core.config_store import ConfigStore
 import json
 import os
 
@@ -17,19 +18,25 @@ class ConfigManager:
                 key_file.write(key)
 
     def load_key(self):
-        return open(self.key_path, 'rb').read()
+        return ConfigStore.get(self.key_path, ConfigStore.load_bytes)
 
     def encrypt_config(self, data):
         encrypted_data = self.cipher_suite.encrypt(json.dumps(data).encode())
         with open(self.config_path, 'wb') as config_file:
             config_file.write(encrypted_data)
+        ConfigStore.invalidate(self.config_path)
+
+    def _decrypt_file(self, config_path):
+        """Lee, desencripta e interpreta el archivo de configuración (lector para ConfigStore)."""
+        with open(config_path, 'rb') as config_file:
+            encrypted_data = config_file.read()
+        decrypted_data = self.cipher_suite.decrypt(encrypted_data)
+        return json.loads(decrypted_data.decode())
 
     def decrypt_config(self):
         try:
-            with open(self.config_path, 'rb') as config_file:
-                encrypted_data = config_file.read()
-            decrypted_data = self.cipher_suite.decrypt(encrypted_data)
-            return json.loads(decrypted_data.decode())
+            # Se desencripta una sola vez y se vuelve a leer solo si el archivo cambió
+            return ConfigStore.get(self.config_path, self._decrypt_file)
         except FileNotFoundError:
             QMessageBox.critical(None, "Error", f"No se encontró el archivo de configuración: {self.config_path}")
             return {}
@@ -0,0 +1,62 @@
+# core/config_store.py
+import copy
+import json
+import os
+import threading
+
+
+class ConfigStore:
+    """
+    Almacén de configuración en memoria compartido por todo el proceso.
+    Cada archivo se lee, interpreta (y desencripta) una sola vez; solo se vuelve a leer cuando
+    cambia su fecha de modificación o su tamaño.
+    """
+
+    _entries = {}  # Ruta absoluta -> ((mtime_ns, tamaño), contenido interpretado)
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get(path, loader):
+        """
+        Obtiene el contenido interpretado de un archivo.
+        :param path: Ruta del archivo.
+        :param loader: Función que recibe la ruta y devuelve el contenido interpretado.
+        :return: Copia del contenido, para que los llamadores puedan modificarla sin alterar el almacén.
+        :raises FileNotFoundError: Si el archivo no existe.
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with ConfigStore._lock:
+            entry = ConfigStore._entries.get(path)
+        if entry is None or entry[0] != signature:
+            entry = (signature, loader(path))
+            with ConfigStore._lock:
+                ConfigStore._entries[path] = entry
+
+        return copy.deepcopy(entry[1])
+
+    @staticmethod
+    def invalidate(path):
+        """
+        Descarta el contenido almacenado de un archivo (por ejemplo, después de escribirlo).
+        """
+        with ConfigStore._lock:
+            ConfigStore._entries.pop(os.path.abspath(path), None)
+
+    @staticmethod
+    def load_json(path):
+        """
+        Lector de archivos JSON para usar con `get`.
+        """
+        with open(path, "r") as file:
+            return json.load(file)
+
+    @staticmethod
+    def load_bytes(path):
+        """
+        Lector de archivos binarios para usar con `get`.
+        """
+        with open(path, "rb") as file:
+            return file.read()
@@ -0,0 +1,149 @@
+# core/connection_pool.py
+import threading
+import time
+import oracledb
+
+
+class ConnectionPool:
+    """
+    Pool de sesiones de base de datos para una conexión configurada.
+    Las sesiones se crean bajo demanda hasta `max_size`, se verifican al entregarlas si estuvieron
+    inactivas más de `ping_interval` segundos y se cierran tras `idle_timeout` segundos sin uso,
+    conservando siempre al menos `min_size` sesiones abiertas.
+    """
+
+    DEFAULT_MIN_SIZE = 1
+    DEFAULT_MAX_SIZE = 4
+    DEFAULT_IDLE_TIMEOUT = 300  # Segundos que una sesión puede quedar inactiva antes de cerrarse
+    DEFAULT_PING_INTERVAL = 60  # Segundos de inactividad a partir de los cuales se verifica la sesión
+    DEFAULT_ACQUIRE_TIMEOUT = 30  # Segundos de espera por una sesión libre cuando el pool está lleno
+
+    def __init__(self, connection_info, min_size=DEFAULT_MIN_SIZE, max_size=DEFAULT_MAX_SIZE,
+                 idle_timeout=DEFAULT_IDLE_TIMEOUT, ping_interval=DEFAULT_PING_INTERVAL):
+        """
+        Inicializa el pool sin abrir sesiones.
+        :param connection_info: Diccionario con user, password, host, port y service_name.
+        :param min_size: Sesiones que se conservan abiertas aunque estén inactivas.
+        :param max_size: Máximo de sesiones simultáneas.
+        :param idle_timeout: Segundos de inactividad tras los cuales se cierra una sesión.
+        :param ping_interval: Segundos de inactividad tras los cuales se verifica la sesión al entregarla.
+        """
+        self.connection_info = connection_info
+        self.min_size = min_size
+        self.max_size = max(1, max_size)
+        self.idle_timeout = idle_timeout
+        self.ping_interval = ping_interval
+        self._idle = []       # Sesiones libres como (sesión, momento de devolución)
+        self._in_use = 0      # Sesiones entregadas y aún no devueltas
+        self._condition = threading.Condition()
+
+    def acquire(self, timeout=DEFAULT_ACQUIRE_TIMEOUT):
+        """
+        Entrega una sesión del pool, creándola si no hay ninguna libre y no se alcanzó el máximo.
+        :param timeout: Segundos de espera si todas las sesiones están en uso.
+        :return: Sesión de base de datos activa.
+        :raises RuntimeError: Si no se libera ninguna sesión en el tiempo indicado.
+        """
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            self._evict_idle()
+            while True:
+                while self._idle:
+                    # La sesión devuelta más recientemente es la que tiene más probabilidades de seguir activa
+                    session, released_at = self._idle.pop()
+                    if self._is_healthy(session, released_at):
+                        self._in_use += 1
+                        return session
+                    self._close_session(session)
+
+                if self._in_use < self.max_size:
+                    self._in_use += 1
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._condition.wait(remaining):
+                    raise RuntimeError("No hay sesiones libres en el pool de conexiones.")
+
+        # La sesión nueva se abre fuera del bloqueo para no detener a los demás hilos
+        try:
+            return self._create_session()
+        except Exception:
+            with self._condition:
+                self._in_use -= 1
+                self._condition.notify()
+            raise
+
+    def release(self, session, discard=False):
+        """
+        Devuelve una sesión al pool.
+        :param session: Sesión obtenida con `acquire`.
+        :param discard: Si es True, la sesión se cierra en lugar de reutilizarse (por ejemplo, tras un error de red).
+        """
+        if not discard:
+            # Una transacción sin confirmar no debe pasar a quien tome la sesión después
+            try:
+                if getattr(session, "transaction_in_progress", True):
+                    session.rollback()
+            except Exception:
+                discard = True
+        with self._condition:
+            self._in_use -= 1
+            if discard:
+                self._close_session(session)
+            else:
+                self._idle.append((session, time.monotonic()))
+            self._evict_idle()
+            self._condition.notify()
+
+    def close(self):
+        """
+        Cierra todas las sesiones libres del pool.
+        """
+        with self._condition:
+            for session, _ in self._idle:
+                self._close_session(session)
+            self._idle = []
+
+    def _create_session(self):
+        """
+        Abre una sesión nueva con los datos de la conexión.
+        """
+        info = self.connection_info
+        dsn = f"{info.get('host')}:{info.get('port')}/{info.get('service_name')}"
+        return oracledb.connect(user=info.get("user"), password=info.get("password"), dsn=dsn)
+
+    def _is_healthy(self, session, released_at):
+        """
+        Verifica la sesión antes de entregarla; solo hace un ping si estuvo inactiva más de `ping_interval`.
+        """
+        if time.monotonic() - released_at < self.ping_interval:
+            return True
+        try:
+            session.ping()
+            return True
+        except Exception:
+            return False
+
+    def _evict_idle(self):
+        """
+        Cierra las sesiones inactivas por más de `idle_timeout`, conservando `min_size` sesiones abiertas.
+        """
+        now = time.monotonic()
+        kept = []
+        # Se recorren de la más reciente a la más antigua para conservar las más nuevas
+        for session, released_at in reversed(self._idle):
+            if now - released_at > self.idle_timeout and len(kept) + self._in_use >= self.min_size:
+                self._close_session(session)
+            else:
+                kept.append((session, released_at))
+        self._idle = list(reversed(kept))
+
+    @staticmethod
+    def _close_session(session):
+        """
+        Cierra una sesión ignorando los errores (la sesión puede estar ya caída).
+        """
+        try:
+            session.close()
+        except Exception:
+            pass
@@ -1,8 +1,17 @@
 # core/db_connection.py
 import json
 import os
+import threading
+from contextlib import contextmanager
+from core.config_store import ConfigStore
+from core.connection_pool import ConnectionPool
 
 class DatabaseConnection:
+    # Pools de sesiones por nombre de conexión, compartidos por toda la aplicación
+    _pools = {}
+    _pools_lock = threading.Lock()
+    _active_connection_name = None
+
     def __init__(self):
         self.connection = None
         self.config = self.load_config()
@@ -13,45 +22,91 @@ class DatabaseConnection:
         if not os.path.exists(config_path):
             # Si el archivo no existe, devolver una configuración vacía
             return {}
-        with open(config_path, "r") as file:
-            config = json.load(file)
-        return config
+        # Se interpreta una sola vez y se vuelve a leer solo si el archivo cambió
+        return ConfigStore.get(config_path, ConfigStore.load_json)
 
     @staticmethod
     def _save_config_plain(config, config_path="config/db_config.json"):
         """Guarda la configuración en un archivo JSON sin encriptar."""
         with open(config_path, "w") as file:
             json.dump(config, file, indent=4)
+        ConfigStore.invalidate(config_path)
+
+    @staticmethod
+    def _connections(config):
+        """Devuelve el diccionario de conexiones (agrupadas bajo la clave 'connections')."""
+        return config.get("connections", config)
 
     def load_config(self):
         """Carga la configuración desde el archivo JSON."""
         return self._load_config_plain()
 
     def set_connection(self, connection_name):
-        """Configura la conexión a la base de datos."""
+        """Configura la conexión a la base de datos y la marca como activa."""
         config = self.load_config()
-        connection_info = config.get(connection_name, {})
+        connection_info = self._connections(config).get(connection_name, {})
         self.connection = connection_info
+        DatabaseConnection._activate(connection_name, connection_info)
+
+    @staticmethod
+    def _activate(connection_name, connection_info):
+        """Activa el pool de la conexión indicada, creándolo la primera vez (sin abrir sesiones)."""
+        with DatabaseConnection._pools_lock:
+            pool = DatabaseConnection._pools.get(connection_name)
+            if pool is None or pool.connection_info != connection_info:
+                if pool is not None:
+                    pool.close()
+                pool = ConnectionPool(
+                    connection_info,
+                    min_size=int(connection_info.get("pool_min", ConnectionPool.DEFAULT_MIN_SIZE)),
+                    max_size=int(connection_info.get("pool_max", ConnectionPool.DEFAULT_MAX_SIZE)),
+                )
+                DatabaseConnection._pools[connection_name] = pool
+            DatabaseConnection._active_connection_name = connection_name
 
     @staticmethod
     def close_connection():
-        """Cierra la conexión actual."""
-        pass
+        """Desactiva la conexión actual y cierra las sesiones libres de todos los pools."""
+        with DatabaseConnection._pools_lock:
+            for pool in DatabaseConnection._pools.values():
+                pool.close()
+            DatabaseConnection._active_connection_name = None
 
     @staticmethod
     def get_connection():
-        """Obtiene la conexión actual."""
-        return DatabaseConnection().connection
+        """Obtiene el pool de la conexión activa, o None si no hay conexión activa."""
+        return DatabaseConnection._pools.get(DatabaseConnection._active_connection_name)
+
+    @staticmethod
+    def get_active_connection_name():
+        """Obtiene el nombre de la conexión activa."""
+        return DatabaseConnection._active_connection_name
+
+    @staticmethod
+    @contextmanager
+    def session():
+        """
+        Contexto que toma prestada una sesión del pool activo y la devuelve al salir.
+        Uso: `with DatabaseConnection.session() as connection: ...`
+        """
+        pool = DatabaseConnection.get_connection()
+        if not pool:
+            raise ValueError("No hay conexión establecida.")
+        connection = pool.acquire()
+        try:
+            yield connection
+        finally:
+            pool.release(connection)
 
     @staticmethod
     def _load_connection_names():
         """Carga los nombres de las conexiones desde la configuración."""
         config = DatabaseConnection._load_config_plain()
-        return list(config.keys())
+        return list(DatabaseConnection._connections(config).keys())
 
     @staticmethod
     def save_connection(connection_name, connection_info):
         """Guarda una nueva conexión o actualiza una existente."""
         config = DatabaseConnection._load_config_plain()
-        config[connection_name] = connection_info
+        DatabaseConnection._connections(config)[connection_name] = connection_info
         DatabaseConnection._save_config_plain(config)
\ No newline at end of file
@@ -1,6 +1,7 @@
 import os
 import sys
 import json
+from core.config_store import ConfigStore
 
 class JSONManager:
     """
@@ -31,8 +32,8 @@ class JSONManager:
             config_path = JSONManager.get_config_path()
 
         try:
-            with open(config_path, "r") as file:
-                data = json.load(file)
+            # Se interpreta una sola vez y se vuelve a leer solo si el archivo cambió
+            data = ConfigStore.get(config_path, ConfigStore.load_json)
             return data.get("connections", {})
         except FileNotFoundError:
             print(f"Error: El archivo de configuración no se encontró en {config_path}.")
@@ -73,6 +74,7 @@ class JSONManager:
 
             with open(file_path, "w") as file:
                 json.dump({"connections": connections}, file, indent=4)
+            ConfigStore.invalidate(file_path)
             print(f"Conexión '{connection_name}' agregada correctamente.")
         except Exception as e:
             print(f"Error al agregar la conexión: {e}")
@@ -95,6 +97,7 @@ class JSONManager:
 
             with open(file_path, "w") as file:
                 json.dump({"connections": connections}, file, indent=4)
+            ConfigStore.invalidate(file_path)
             print(f"Conexión '{connection_name}' eliminada correctamente.")
         except Exception as e:
             print(f"Error al eliminar la conexión: {e}")
@@ -118,6 +121,7 @@ class JSONManager:
 
             with open(file_path, "w") as file:
                 json.dump({"connections": connections}, file, indent=4)
+            ConfigStore.invalidate(file_path)
             print(f"Conexión '{connection_name}' actualizada correctamente.")
         except Exception as e:
             print(f"Error al actualizar la conexión: {e}")
@@ -0,0 +1,162 @@
+import math
+from decimal import Decimal, InvalidOperation
+import numpy as np
+import pandas as pd
+import oracledb
+
+# Tipos de Oracle que se enlazan como números y tipos que se enlazan como cadenas de largo fijo
+NUMBER_TYPES = {"NUMBER", "FLOAT", "INTEGER", "BINARY_FLOAT", "BINARY_DOUBLE"}
+STRING_TYPES = {"VARCHAR2", "CHAR", "NVARCHAR2", "NCHAR"}
+
+
+class InsertStatement:
+    """
+    Sentencia INSERT preparada una sola vez por (tabla, lista de columnas).
+    Mantiene un único cursor durante toda la importación y declara el tipo y largo de cada
+    variable de enlace con `setinputsizes`, de modo que cada fila o lote solo enlaza y ejecuta.
+    """
+
+    def __init__(self, connection, table_name, columns, structure=None):
+        """
+        Prepara la sentencia.
+        :param connection: Conexión de la base de datos.
+        :param table_name: Nombre de la tabla.
+        :param columns: Columnas a insertar, en el orden en que llegan los valores de cada fila.
+        :param structure: Estructura de `TableModel.get_table_structure_for_validation` para tipar los enlaces.
+        """
+        self.connection = connection
+        self.table_name = table_name
+        self.columns = list(columns)
+
+        columns_str = ", ".join([f'"{col}"' for col in self.columns])
+        values_str = ", ".join([f":{position}" for position in range(1, len(self.columns) + 1)])
+        self.sql = f"INSERT INTO {table_name} ({columns_str}) VALUES ({values_str})"
+
+        structure_by_name = {col["column_name"]: col for col in (structure or [])}
+        self.input_sizes = [self._input_size(structure_by_name.get(col)) for col in self.columns]
+        self.number_positions = [
+            position for position, col in enumerate(self.columns)
+            if structure_by_name.get(col, {}).get("data_type") in NUMBER_TYPES
+        ]
+        self.string_positions = [
+            position for position, col in enumerate(self.columns)
+            if structure_by_name.get(col, {}).get("data_type") in STRING_TYPES
+        ]
+
+        self.cursor = connection.cursor()
+        self.cursor.prepare(self.sql)
+        # Cursor aparte para SAVEPOINT/ROLLBACK, así el cursor del INSERT conserva su sentencia y enlaces
+        self.control_cursor = connection.cursor()
+
+    @staticmethod
+    def _input_size(column):
+        """
+        Traduce la descripción de una columna al tipo de enlace para `setinputsizes`.
+        :return: Tipo de la base de datos, largo máximo de cadena o None para dejar que el driver lo infiera.
+        """
+        if not column:
+            return None
+        data_type = column["data_type"]
+        if data_type in NUMBER_TYPES:
+            return oracledb.DB_TYPE_NUMBER
+        if data_type in STRING_TYPES and column.get("length"):
+            return int(column["length"])
+        return None
+
+    def bind_rows(self, rows):
+        """
+        Convierte las filas a valores enlazables (tipos nativos de Python, None para nulos,
+        Decimal para textos numéricos en columnas NUMBER y texto para cualquier valor en columnas
+        de caracteres, que `setinputsizes` declara como cadenas).
+        :param rows: Lista de secuencias de valores en el orden de `columns`.
+        :return: Tupla (filas convertidas, posiciones originales de esas filas, errores [(posición, mensaje)]).
+        """
+        bound_rows = []
+        positions = []
+        errors = []
+        for position, row in enumerate(rows):
+            values = [self._to_bind_value(value) for value in row]
+            for column_position in self.string_positions:
+                values[column_position] = self._to_text(values[column_position])
+            try:
+                for column_position in self.number_positions:
+                    values[column_position] = self._to_number(values[column_position])
+            except (InvalidOperation, ValueError):
+                errors.append((position, f"Valor no numérico para la columna {self.columns[column_position]}: "
+                                         f"{values[column_position]}"))
+                continue
+            bound_rows.append(values)
+            positions.append(position)
+        return bound_rows, positions, errors
+
+    @staticmethod
+    def _to_bind_value(value):
+        """
+        Convierte un valor del DataFrame a un tipo aceptado por el driver.
+        """
+        if value is None or value is pd.NA or value is pd.NaT:
+            return None
+        if isinstance(value, np.generic) and not isinstance(value, np.datetime64):
+            value = value.item()
+        if isinstance(value, float) and math.isnan(value):
+            return None
+        return value
+
+    @staticmethod
+    def _to_number(value):
+        """
+        Convierte los textos numéricos a Decimal para enlazarlos como NUMBER.
+        """
+        if isinstance(value, str):
+            return Decimal(value.strip())
+        return value
+
+    @staticmethod
+    def _to_text(value):
+        """
+        Convierte los valores no textuales (por ejemplo, números leídos de Excel) a su `str`, el mismo
+        texto cuya longitud mide la validación de las columnas de caracteres.
+        """
+        if value is None or isinstance(value, str):
+            return value
+        return str(value)
+
+    def execute(self, row):
+        """
+        Ejecuta la sentencia para una sola fila ya convertida.
+        """
+        self.cursor.setinputsizes(*self.input_sizes)
+        self.cursor.execute(None, row)
+
+    def executemany(self, rows, batcherrors=False):
+        """
+        Ejecuta la sentencia para un lote de filas ya convertidas en un solo viaje a la base de datos.
+        :return: Lista de tuplas (posición dentro de `rows`, mensaje) si `batcherrors` es True.
+        """
+        self.cursor.setinputsizes(*self.input_sizes)
+        self.cursor.executemany(None, rows, batcherrors=batcherrors)
+        if batcherrors:
+            return [(error.offset, error.message) for error in self.cursor.getbatcherrors()]
+        return []
+
+    def savepoint(self, name):
+        """
+        Marca un savepoint en la transacción en curso.
+        """
+        self.control_cursor.execute(f"SAVEPOINT {name}")
+
+    def rollback_to_savepoint(self, name):
+        """
+        Deshace la transacción hasta el savepoint indicado.
+        """
+        self.control_cursor.execute(f"ROLLBACK TO SAVEPOINT {name}")
+
+    def close(self):
+        """
+        Cierra los cursores de la sentencia.
+        """
+        for cursor in (self.cursor, self.control_cursor):
+            try:
+                cursor.close()
+            except Exception:
+                pass
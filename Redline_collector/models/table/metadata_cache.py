@@ -0,0 +1,169 @@
+import json
+import os
+import re
+import sys
+import threading
+import time
+
+
+class MetadataCache:
+    """
+    Caché de metadatos del diccionario de datos (lista de tablas y estructuras) por conexión y esquema.
+    Se persiste en disco para que reabrir la aplicación no vuelva a consultar el diccionario.
+    Mientras no venza el TTL se sirve sin consultar la base de datos; al vencer, una sola consulta a
+    `user_objects.last_ddl_time` descarta solo las tablas cuya definición cambió.
+    """
+
+    DEFAULT_TTL = 3600  # Segundos durante los cuales la caché se usa sin revalidar
+    VERSION = 4  # Se incrementa cuando cambia la forma de las estructuras almacenadas
+
+    _instances = {}  # (conexión, esquema) -> MetadataCache compartida por todo el proceso
+    _instances_lock = threading.Lock()
+
+    def __init__(self, connection_name, schema, ttl=DEFAULT_TTL):
+        """
+        Inicializa la caché y carga su contenido persistido, si existe.
+        :param connection_name: Nombre de la conexión.
+        :param schema: Esquema (usuario) de la conexión.
+        :param ttl: Segundos durante los cuales la caché se considera vigente.
+        """
+        self.connection_name = connection_name
+        self.schema = schema
+        self.ttl = ttl
+        self.file_path = self.get_cache_path(connection_name, schema)
+        self._lock = threading.RLock()
+        self.checked_at = 0         # Momento (epoch) de la última revalidación contra la base de datos
+        self.tables = None          # Lista de tablas del esquema
+        self.ddl_times = {}         # Tabla -> last_ddl_time de la última revalidación
+        self.structures = {}        # Tabla -> {tipo de estructura: filas}
+        self.load()
+
+    @classmethod
+    def for_connection(cls, connection_name, schema):
+        """
+        Obtiene la caché compartida de una conexión y esquema.
+        """
+        key = (connection_name, schema)
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(connection_name, schema)
+            return cls._instances[key]
+
+    @staticmethod
+    def get_cache_path(connection_name, schema):
+        """
+        Devuelve la ruta del archivo de caché según el entorno (desarrollo o ejecutable).
+        """
+        if getattr(sys, 'frozen', False):  # Si está en un ejecutable
+            base_path = os.path.dirname(os.path.abspath(sys.executable))
+        else:  # Si está en desarrollo
+            base_path = os.path.abspath(".")
+        file_name = re.sub(r"[^A-Za-z0-9_.-]", "_", f"{connection_name}_{schema}") + ".json"
+        return os.path.join(base_path, "cache", "metadata", file_name)
+
+    def is_fresh(self):
+        """
+        Indica si la caché está dentro de su TTL.
+        """
+        return self.tables is not None and time.time() - self.checked_at < self.ttl
+
+    def revalidate(self, ddl_times):
+        """
+        Actualiza la caché con los `last_ddl_time` actuales del esquema, descartando las
+        estructuras de las tablas modificadas o eliminadas.
+        :param ddl_times: Diccionario {tabla: last_ddl_time} obtenido de la base de datos.
+        """
+        with self._lock:
+            for table_name in list(self.structures):
+                if ddl_times.get(table_name) != self.ddl_times.get(table_name):
+                    del self.structures[table_name]
+            self.ddl_times = dict(ddl_times)
+            self.tables = sorted(ddl_times)
+            self.checked_at = time.time()
+            self.save()
+
+    def update_ddl_time(self, table_name, ddl_time):
+        """
+        Actualiza el `last_ddl_time` de una sola tabla, leído fuera de la revalidación completa;
+        si cambió, se descartan las estructuras almacenadas de la tabla.
+        :param table_name: Nombre de la tabla.
+        :param ddl_time: `last_ddl_time` actual, o None si la tabla ya no existe.
+        """
+        with self._lock:
+            if self.ddl_times.get(table_name) == ddl_time:
+                return
+            self.structures.pop(table_name, None)
+            if ddl_time is None:
+                self.ddl_times.pop(table_name, None)
+            else:
+                self.ddl_times[table_name] = ddl_time
+            self.save()
+
+    def get_structure(self, table_name, kind):
+        """
+        Obtiene una estructura almacenada.
+        :param table_name: Nombre de la tabla.
+        :param kind: Tipo de estructura ("structure" o "validation").
+        :return: Estructura almacenada o None si no está en la caché.
+        """
+        with self._lock:
+            return self.structures.get(table_name, {}).get(kind)
+
+    def put_structures(self, metadata):
+        """
+        Almacena las estructuras de varias tablas y persiste la caché una sola vez.
+        :param metadata: Diccionario {tabla: {tipo de estructura: filas}}.
+        """
+        with self._lock:
+            for table_name, structures in metadata.items():
+                self.structures.setdefault(table_name, {}).update(structures)
+            self.save()
+
+    def clear(self):
+        """
+        Descarta todo el contenido para forzar una recarga completa.
+        """
+        with self._lock:
+            self.checked_at = 0
+            self.tables = None
+            self.ddl_times = {}
+            self.structures = {}
+            self.save()
+
+    def load(self):
+        """
+        Carga el contenido persistido en disco; si no existe o está dañado, la caché queda vacía.
+        """
+        try:
+            with open(self.file_path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            if data.get("version") != self.VERSION:
+                return
+            self.checked_at = data.get("checked_at", 0)
+            self.tables = data.get("tables")
+            self.ddl_times = data.get("ddl_times", {})
+            self.structures = data.get("structures", {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error al leer la caché de metadatos {self.file_path}: {e}")
+
+    def save(self):
+        """
+        Persiste la caché en disco (escritura atómica mediante un archivo temporal).
+        """
+        data = {
+            "version": self.VERSION,
+            "checked_at": self.checked_at,
+            "tables": self.tables,
+            "ddl_times": self.ddl_times,
+            "structures": self.structures,
+        }
+        try:
+            os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+            temp_path = f"{self.file_path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(data, file)
+            os.replace(temp_path, self.file_path)
+        except Exception as e:
+            print(f"Error al guardar la caché de metadatos {self.file_path}: {e}")
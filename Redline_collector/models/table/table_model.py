@@ -1,109 +1,213 @@
-import pandas as pd
 from core.db_connection import DatabaseConnection
+from models.table.insert_statement import InsertStatement
+from models.table.metadata_cache import MetadataCache
 
 class TableModel:
+    SAVEPOINT_NAME = "REDLINE_BATCH"  # Savepoint que protege cada lote dentro de una transacción
+    METADATA_ARRAYSIZE = 1000  # Filas por viaje al leer el diccionario de datos
+    METADATA_IN_LIST_LIMIT = 1000  # Máximo de tablas enumeradas en una consulta de metadatos
+    KEY_FETCH_ARRAYSIZE = 10000  # Filas por viaje al traer las claves existentes de una tabla
+    KEY_IN_LIST_LIMIT = 1000  # Claves por consulta al sondear con IN (límite de elementos de Oracle)
+
     def __init__(self):
         """
         Inicializa el modelo de tabla.
         """
-        pass
+        self.insert_statements = {}  # Sentencias INSERT preparadas por (tabla, columnas)
+        self.transaction_connection = None  # Sesión tomada del pool durante una importación
+        self.transaction_pool = None
 
-    def get_all_tables(self):
+    def get_all_tables(self, refresh=False):
         """
         Recupera todas las tablas disponibles en la base de datos.
+        :param refresh: Si es True, ignora el TTL de la caché de metadatos y la revalida.
         :return: Lista de nombres de tablas.
         """
-        connection = DatabaseConnection.get_connection()
-        if not connection:
+        return list(self._get_metadata_cache(refresh).tables)
+
+    def refresh_metadata(self):
+        """
+        Descarta la caché de metadatos de la conexión activa y vuelve a cargar la lista de tablas.
+        """
+        self._get_metadata_cache().clear()
+        return self.get_all_tables(refresh=True)
+
+    def _get_metadata_cache(self, refresh=False):
+        """
+        Obtiene la caché de metadatos de la conexión activa, revalidándola contra
+        `user_objects.last_ddl_time` si venció su TTL o si se solicita explícitamente.
+        """
+        pool = DatabaseConnection.get_connection()
+        if not pool:
             raise ValueError("No hay conexión establecida.")
 
-        query = "SELECT table_name FROM user_tables ORDER BY table_name"
-        with connection.cursor() as cursor:
-            cursor.execute(query)
-            tables = [row[0] for row in cursor.fetchall()]
-        return tables
+        cache = MetadataCache.for_connection(
+            DatabaseConnection.get_active_connection_name(), pool.connection_info.get("user")
+        )
+        if refresh or not cache.is_fresh():
+            query = """
+                SELECT t.table_name, TO_CHAR(o.last_ddl_time, 'YYYY-MM-DD HH24:MI:SS')
+                FROM user_tables t
+                JOIN user_objects o
+                  ON o.object_name = t.table_name
+                 AND o.object_type = 'TABLE'
+            """
+            with DatabaseConnection.session() as connection, connection.cursor() as cursor:
+                cursor.execute(query)
+                ddl_times = dict(cursor.fetchall())
+            cache.revalidate(ddl_times)
+        return cache
+
+    def get_ddl_time(self, table_name, fresh=False):
+        """
+        Obtiene el `last_ddl_time` de una tabla según la caché de metadatos (revalidada si venció su TTL).
+        :param table_name: Nombre de la tabla.
+        :param fresh: Si es True, se lee de `user_objects` con una consulta de una fila; si cambió,
+                      la caché de metadatos descarta la estructura almacenada de la tabla.
+        :return: Fecha de la última modificación de la definición como texto, o None si no se conoce.
+        """
+        cache = self._get_metadata_cache()
+        if not fresh:
+            return cache.ddl_times.get(table_name)
+
+        query = """
+            SELECT TO_CHAR(last_ddl_time, 'YYYY-MM-DD HH24:MI:SS')
+            FROM user_objects
+            WHERE object_name = :table_name
+              AND object_type = 'TABLE'
+        """
+        with DatabaseConnection.session() as connection, connection.cursor() as cursor:
+            cursor.execute(query, table_name=table_name)
+            row = cursor.fetchone()
+        ddl_time = row[0] if row else None
+        cache.update_ddl_time(table_name, ddl_time)
+        return ddl_time
 
     def get_table_structure(self, table_name):
         """
-        Recupera la estructura de una tabla específica.
+        Recupera la estructura de una tabla específica (desde la caché de metadatos si está vigente).
         :param table_name: Nombre de la tabla.
         :return: Estructura de la tabla como una lista de columnas y sus detalles.
         """
-        connection = DatabaseConnection.get_connection()
-        if not connection:
-            raise ValueError("No hay conexión establecida.")
+        cache = self._get_metadata_cache()
+        cached = cache.get_structure(table_name, "structure")
+        if cached is None:
+            metadata = self.load_table_metadata([table_name])
+            cache.put_structures(metadata)
+            cached = metadata.get(table_name, {}).get("structure", [])
+        return [tuple(col) for col in cached]
+
+    def prefetch_table_structures(self):
+        """
+        Carga en la caché de metadatos la estructura de todas las tablas que aún no estén en ella,
+        con una sola consulta al diccionario de datos.
+        """
+        cache = self._get_metadata_cache()
+        missing = [table for table in cache.tables if cache.get_structure(table, "validation") is None]
+        if not missing:
+            return
+        # Con muchas tablas faltantes es más barato traer el esquema completo que enumerarlas
+        table_names = None if len(missing) > self.METADATA_IN_LIST_LIMIT else missing
+        cache.put_structures(self.load_table_metadata(table_names))
+
+    def load_table_metadata(self, table_names=None):
+        """
+        Obtiene columnas, PK, NOT NULL, constraints de chequeo y FK de una o varias tablas
+        en una sola consulta con variables de enlace.
+        :param table_names: Lista de tablas; None para todas las tablas del esquema.
+        :return: Diccionario {tabla: {"structure": [...], "validation": [...]}} con las mismas formas
+                 que devuelven `get_table_structure` y `get_table_structure_for_validation`.
+        """
+        binds = {}
+        if table_names is None:
+            table_filter = "AND utc.table_name IN (SELECT table_name FROM user_tables)"
+            constraint_filter = ""
+        else:
+            binds = {f"t{position}": name for position, name in enumerate(table_names)}
+            placeholders = ", ".join(f":{bind}" for bind in binds)
+            table_filter = f"AND utc.table_name IN ({placeholders})"
+            constraint_filter = f"AND ucc.table_name IN ({placeholders})"
 
         query = f"""
-            SELECT 
-                column_name, 
-                DATA_TYPE || 
-                CASE 
-                    WHEN DATA_TYPE = 'VARCHAR2' THEN 
-                        ' (' || DATA_LENGTH || ' ' || 
-                        CASE 
-                            WHEN CHAR_USED = 'B' THEN 'Byte'
-                            WHEN CHAR_USED = 'C' THEN 'Char'
-                            ELSE 'Unknown' 
-                        END || ')'
-                    WHEN DATA_TYPE = 'NUMBER' THEN 
-                        ' (' || DATA_PRECISION || 
-                        CASE 
-                            WHEN DATA_SCALE != 0 THEN ',' || DATA_SCALE 
-                            ELSE '' 
-                        END || ')'
-                    ELSE ''
-                END AS data_type, 
-                CASE 
-                    WHEN column_name IN (
-                        SELECT column_name 
-                        FROM user_cons_columns 
-                        WHERE table_name = '{table_name}' 
-                        AND constraint_name IN (
-                            SELECT constraint_name 
-                            FROM user_constraints 
-                            WHERE constraint_type = 'P'
-                        )
-                    ) THEN 'Si' 
-                    ELSE NULL 
-                END AS is_pk,
-                CASE 
-                    WHEN nullable = 'Y' THEN NULL
-                    ELSE 'No' 
-                END AS allows_null,                
-                (
-                    SELECT COUNT(*) 
-                    FROM USER_CONS_COLUMNS ucc
-                    JOIN USER_CONSTRAINTS uc 
-                    ON ucc.CONSTRAINT_NAME = uc.CONSTRAINT_NAME
-                    AND ucc.OWNER = uc.OWNER
-                    WHERE ucc.TABLE_NAME = '{table_name}'
-                    AND ucc.COLUMN_NAME = utc.column_name
-                    AND uc.CONSTRAINT_TYPE = 'C'
-                ) AS "Constraints?",
-                (
-                    SELECT CASE 
-                            WHEN COUNT(*) > 0 THEN 'Si'
-                            ELSE NULL
-                        END
-                    FROM USER_CONS_COLUMNS ucc
-                    JOIN USER_CONSTRAINTS uc 
-                    ON ucc.CONSTRAINT_NAME = uc.CONSTRAINT_NAME
-                    AND ucc.OWNER = uc.OWNER
-                    WHERE ucc.TABLE_NAME = '{table_name}'
-                    AND ucc.COLUMN_NAME = utc.column_name
-                    AND uc.CONSTRAINT_TYPE = 'R'
-                ) AS "Referencial?"
+            WITH column_constraints AS (
+                SELECT ucc.table_name,
+                       ucc.column_name,
+                       MAX(CASE WHEN uc.constraint_type = 'P' THEN 'Si' END) AS is_pk,
+                       COUNT(CASE WHEN uc.constraint_type = 'C' THEN 1 END) AS check_count,
+                       MAX(CASE WHEN uc.constraint_type = 'R' THEN 'Si' END) AS is_fk
+                FROM user_cons_columns ucc
+                JOIN user_constraints uc
+                  ON uc.constraint_name = ucc.constraint_name
+                 AND uc.owner = ucc.owner
+                WHERE uc.constraint_type IN ('P', 'C', 'R')
+                {constraint_filter}
+                GROUP BY ucc.table_name, ucc.column_name
+            )
+            SELECT utc.table_name,
+                   utc.column_name,
+                   utc.data_type,
+                   utc.data_length,
+                   utc.char_length,
+                   utc.char_used,
+                   utc.data_precision,
+                   utc.data_scale,
+                   utc.nullable,
+                   cc.is_pk,
+                   NVL(cc.check_count, 0),
+                   cc.is_fk
             FROM user_tab_columns utc
-            WHERE table_name = '{table_name}'
-            ORDER BY column_id
+            LEFT JOIN column_constraints cc
+              ON cc.table_name = utc.table_name
+             AND cc.column_name = utc.column_name
+            WHERE 1 = 1
+            {table_filter}
+            ORDER BY utc.table_name, utc.column_id
         """
-        with connection.cursor() as cursor:
-            cursor.execute(query)
-            structure = cursor.fetchall()
-
-        return [(col[0], col[1], col[2], col[3], col[4], col[5]) for col in structure]
+        with DatabaseConnection.session() as connection, connection.cursor() as cursor:
+            cursor.arraysize = self.METADATA_ARRAYSIZE
+            cursor.prefetchrows = self.METADATA_ARRAYSIZE + 1
+            cursor.execute(query, binds)
+            rows = cursor.fetchall()
 
+        metadata = {name: {"structure": [], "validation": []} for name in (table_names or [])}
+        for (table_name, column_name, data_type, data_length, char_length, char_used,
+             precision, scale, nullable, is_pk, check_count, is_fk) in rows:
+            table = metadata.setdefault(table_name, {"structure": [], "validation": []})
+            table["structure"].append((
+                column_name,
+                self._format_data_type(data_type, data_length, char_used, precision, scale),
+                is_pk,
+                None if nullable == "Y" else "No",
+                check_count,
+                is_fk,
+            ))
+            table["validation"].append({
+                'column_name': column_name,
+                'data_type': data_type,
+                'data_type_formatted': self._format_data_type(data_type, char_length, char_used, precision, scale),
+                'precision': precision if precision else None,
+                'length': char_length if char_length else None,
+                'byte_length': data_length if data_length else None,
+                'char_used': char_used,
+                'scale': scale,
+                'nullable': nullable == "Y",
+            })
+        return metadata
 
+    @staticmethod
+    def _format_data_type(data_type, length, char_used, precision, scale):
+        """
+        Arma la descripción del tipo de dato, por ejemplo "VARCHAR2 (50 Char)" o "NUMBER (10,2)".
+        """
+        if data_type in ("VARCHAR2", "CHAR"):
+            semantics = {"B": "Byte", "C": "Char"}.get(char_used, "Unknown")
+            return f"{data_type} ({length} {semantics})"
+        if data_type == "NUMBER" and precision is None and scale == 0:
+            return "INTEGER"
+        if data_type == "NUMBER":
+            scale_str = f",{scale}" if scale not in (None, 0) else ""
+            return f"{data_type} ({precision if precision is not None else ''}{scale_str})"
+        return data_type
 
     def insert_data(self, table_name, dataframe, columns_to_insert, batch_size=1):
         """
@@ -114,75 +218,207 @@ class TableModel:
         :param batch_size: Tamaño del lote para la inserción (1 para fila por fila).
         :return: Diccionario con detalles de registros insertados y errores.
         """
-        connection = DatabaseConnection.get_connection()
-        if not connection:
-            raise ValueError("No hay conexión establecida.")
-
-        cursor = connection.cursor()
+        connection = self._get_transaction_connection()
+        statement = self.prepare_insert(table_name, columns_to_insert)
         success = []  # Índices de registros insertados correctamente
         errors = []   # Detalles de los errores: índice y mensaje
 
-        # Construcción de la query de inserción
-        columns_str = ", ".join([f'"{col}"' for col in columns_to_insert])
-        values_str = ", ".join([f":{col}" for col in columns_to_insert])
-        insert_query = f"INSERT INTO {table_name} ({columns_str}) VALUES ({values_str})"
-
         try:
             # Inserción por lotes o fila por fila
             for i in range(0, len(dataframe), batch_size):
                 batch = dataframe.iloc[i:i + batch_size]
-                data_list = []
+                batch_indices = batch.index.tolist()
+                rows = list(batch[columns_to_insert].itertuples(index=False, name=None))
 
-                for index, row in batch.iterrows():
-                    data_dict = {col: (row[col] if pd.notna(row[col]) else None) for col in columns_to_insert}
-                    data_list.append(data_dict)
+                data_list, positions, conversion_errors = statement.bind_rows(rows)
+                errors.extend({"index": batch_indices[position], "error": message}
+                              for position, message in conversion_errors)
+                if not data_list:
+                    continue
 
+                indices = [batch_indices[position] for position in positions]
                 try:
+                    statement.savepoint(self.SAVEPOINT_NAME)
                     if batch_size > 1:
-                        cursor.executemany(insert_query, data_list)  # Inserción por lotes
+                        statement.executemany(data_list)  # Inserción por lotes
                     else:
-                        cursor.execute(insert_query, data_list[0])  # Inserción fila por fila
-                    success.extend(batch.index.tolist())
+                        statement.execute(data_list[0])  # Inserción fila por fila
+                    success.extend(indices)
                 except Exception as batch_error:
-                    # Procesar errores de lote o fila
-                    for index, row in batch.iterrows():
-                        try:
-                            data_dict = {col: (row[col] if pd.notna(row[col]) else None) for col in columns_to_insert}
-                            cursor.execute(insert_query, data_dict)
-                            success.append(index)
-                        except Exception as row_error:
-                            errors.append({"index": index, "error": str(row_error)})
+                    # Deshacer las filas que el lote alcanzó a aplicar antes del error
+                    statement.rollback_to_savepoint(self.SAVEPOINT_NAME)
+                    if len(data_list) == 1:
+                        errors.append({"index": indices[0], "error": str(batch_error)})
+                    else:
+                        # Aislar las filas con error dividiendo el lote por la mitad
+                        self._insert_bisecting(statement, data_list, indices, success, errors)
 
             connection.commit()
         except Exception as e:
             connection.rollback()
             raise e
-        finally:
-            cursor.close()
 
         return {"success": success, "errors": errors}
 
+    def _insert_bisecting(self, statement, data_list, indices, success, errors):
+        """
+        Reintenta un lote fallido dividiéndolo en mitades que se envían con `executemany`.
+        Solo las mitades que vuelven a fallar se siguen dividiendo, por lo que k filas con error
+        en un lote de n filas cuestan del orden de k·log(n) sentencias en lugar de n.
+        :param statement: InsertStatement de la transacción en curso.
+        :param data_list: Filas del lote fallido.
+        :param indices: Índices del DataFrame correspondientes a `data_list`.
+        :param success: Lista donde se agregan los índices insertados (en el orden del lote).
+        :param errors: Lista donde se agregan los errores por índice.
+        """
+        middle = len(data_list) // 2
+        halves = ((data_list[:middle], indices[:middle]), (data_list[middle:], indices[middle:]))
+
+        for rows, row_indices in halves:
+            try:
+                statement.savepoint(self.SAVEPOINT_NAME)
+                if len(rows) > 1:
+                    statement.executemany(rows)
+                else:
+                    statement.execute(rows[0])
+                success.extend(row_indices)
+            except Exception as half_error:
+                statement.rollback_to_savepoint(self.SAVEPOINT_NAME)
+                if len(rows) == 1:
+                    errors.append({"index": row_indices[0], "error": str(half_error)})
+                else:
+                    self._insert_bisecting(statement, rows, row_indices, success, errors)
+
     def get_table_columns(self, table_name):
         """
         Obtiene las columnas de una tabla específica.
         :param table_name: Nombre de la tabla.
         :return: Lista de columnas de la tabla en forma de diccionarios.
         """
-        connection = DatabaseConnection.get_connection()
-        if not connection:
-            raise ValueError("No hay conexión establecida.")
-
         query = """
             SELECT column_name
             FROM user_tab_columns
             WHERE table_name = :table_name
         """
-        with connection.cursor() as cursor:
+        with DatabaseConnection.session() as connection, connection.cursor() as cursor:
             cursor.execute(query, {"table_name": table_name.upper()})
             # Retornar diccionarios con las columnas
             columns = [{"column_name": row[0]} for row in cursor.fetchall()]
         return columns
 
+    def get_primary_key_columns(self, table_name):
+        """
+        Obtiene las columnas de la clave primaria de una tabla a partir de su estructura.
+        :param table_name: Nombre de la tabla.
+        :return: Lista de nombres de columna (vacía si la tabla no tiene clave primaria).
+        """
+        return [column[0] for column in self.get_table_structure(table_name) if column[2] == "Si"]
+
+    def get_foreign_keys(self, table_name):
+        """
+        Obtiene las claves foráneas habilitadas de una tabla con las columnas de la tabla padre.
+        :param table_name: Nombre de la tabla.
+        :return: Lista de diccionarios con "name", "columns", "parent_owner", "parent_table" y
+                 "parent_columns" (columnas en el orden de la restricción).
+        """
+        query = """
+            SELECT c.constraint_name,
+                   cc.column_name,
+                   p.owner,
+                   p.table_name,
+                   pc.column_name
+            FROM user_constraints c
+            JOIN user_cons_columns cc
+              ON cc.constraint_name = c.constraint_name
+             AND cc.owner = c.owner
+            JOIN all_constraints p
+              ON p.owner = c.r_owner
+             AND p.constraint_name = c.r_constraint_name
+            JOIN all_cons_columns pc
+              ON pc.owner = p.owner
+             AND pc.constraint_name = p.constraint_name
+             AND pc.position = cc.position
+            WHERE c.constraint_type = 'R'
+              AND c.status = 'ENABLED'
+              AND c.table_name = :table_name
+            ORDER BY c.constraint_name, cc.position
+        """
+        foreign_keys = {}
+        with DatabaseConnection.session() as connection, connection.cursor() as cursor:
+            cursor.execute(query, {"table_name": table_name.upper()})
+            for name, column, parent_owner, parent_table, parent_column in cursor.fetchall():
+                foreign_key = foreign_keys.setdefault(name, {
+                    "name": name,
+                    "columns": [],
+                    "parent_owner": parent_owner,
+                    "parent_table": parent_table,
+                    "parent_columns": [],
+                })
+                foreign_key["columns"].append(column)
+                foreign_key["parent_columns"].append(parent_column)
+        return list(foreign_keys.values())
+
+    def get_row_estimate(self, table_name):
+        """
+        Obtiene la cantidad de filas estimada por las estadísticas del optimizador.
+        :param table_name: Nombre de la tabla.
+        :return: Cantidad de filas, o None si la tabla no tiene estadísticas.
+        """
+        query = "SELECT num_rows FROM user_tables WHERE table_name = :table_name"
+        with DatabaseConnection.session() as connection, connection.cursor() as cursor:
+            cursor.execute(query, {"table_name": table_name.upper()})
+            row = cursor.fetchone()
+        return row[0] if row else None
+
+    def fetch_all_keys(self, table_name, key_columns):
+        """
+        Trae todas las claves de una tabla con lecturas de `KEY_FETCH_ARRAYSIZE` filas por viaje.
+        :param table_name: Nombre de la tabla.
+        :param key_columns: Columnas de la clave.
+        :return: Lista de tuplas con los valores de la clave.
+        """
+        columns_str = ", ".join(f'"{col}"' for col in key_columns)
+        with DatabaseConnection.session() as connection, connection.cursor() as cursor:
+            cursor.arraysize = self.KEY_FETCH_ARRAYSIZE
+            cursor.prefetchrows = self.KEY_FETCH_ARRAYSIZE + 1
+            cursor.execute(f"SELECT {columns_str} FROM {table_name}")
+            return cursor.fetchall()
+
+    def fetch_existing_keys(self, table_name, key_columns, keys):
+        """
+        Busca en la tabla las claves indicadas con consultas IN de hasta `KEY_IN_LIST_LIMIT` claves.
+        El último grupo se completa repitiendo su última clave para reutilizar siempre la misma sentencia.
+        :param table_name: Nombre de la tabla.
+        :param key_columns: Columnas de la clave.
+        :param keys: Lista de tuplas con los valores a buscar, en el orden de `key_columns`.
+        :return: Lista de tuplas con las claves que existen en la tabla.
+        """
+        if not keys:
+            return []
+
+        width = len(key_columns)
+        size = min(self.KEY_IN_LIST_LIMIT, len(keys))
+        columns_str = ", ".join(f'"{col}"' for col in key_columns)
+        if width == 1:
+            in_list = ", ".join(f":{position}" for position in range(1, size + 1))
+            query = f"SELECT {columns_str} FROM {table_name} WHERE {columns_str} IN ({in_list})"
+        else:
+            in_list = ", ".join(
+                "(" + ", ".join(f":{row * width + offset}" for offset in range(1, width + 1)) + ")"
+                for row in range(size)
+            )
+            query = f"SELECT {columns_str} FROM {table_name} WHERE ({columns_str}) IN ({in_list})"
+
+        found = []
+        with DatabaseConnection.session() as connection, connection.cursor() as cursor:
+            cursor.arraysize = self.KEY_IN_LIST_LIMIT
+            for start in range(0, len(keys), size):
+                chunk = list(keys[start:start + size])
+                chunk += [chunk[-1]] * (size - len(chunk))
+                cursor.execute(query, [value for key in chunk for value in key])
+                found.extend(cursor.fetchall())
+        return found
+
     def filter_tables(self, text):
         """
         Filtra las tablas que coincidan con el texto de búsqueda.
@@ -194,96 +430,139 @@ class TableModel:
     
     def get_table_structure_for_validation(self, table_name):
         """
-        Recupera la estructura de una tabla para validación.
+        Recupera la estructura de una tabla para validación (desde la caché de metadatos si está vigente).
         :param table_name: Nombre de la tabla.
         :return: Lista de columnas con detalles relevantes para la validación.
         """
-        connection = DatabaseConnection.get_connection()
-        if not connection:
-            raise ValueError("No hay conexión establecida.")
-
-        query = f"""
-        SELECT utc.COLUMN_NAME AS column_name,
-               utc.DATA_TYPE || 
-               CASE 
-                   WHEN utc.DATA_TYPE = 'VARCHAR2' THEN 
-                       ' (' || utc.CHAR_LENGTH || ' ' || 
-                       CASE 
-                           WHEN utc.CHAR_USED = 'B' THEN 'Byte'
-                           WHEN utc.CHAR_USED = 'C' THEN 'Char'
-                           ELSE 'Unknown' 
-                       END || ')'
-                   WHEN utc.DATA_TYPE = 'NUMBER' THEN 
-                       ' (' || utc.DATA_PRECISION || 
-                       CASE 
-                           WHEN utc.DATA_SCALE != 0 THEN ',' || utc.DATA_SCALE 
-                           ELSE '' 
-                       END || ')'
-                   ELSE ''
-               END AS data_type_formatted,
-               utc.DATA_TYPE,
-               utc.COLUMN_ID,
-               utc.DATA_PRECISION,
-               utc.CHAR_LENGTH AS DATA_LENGTH,
-               utc.DATA_SCALE
-        FROM USER_TAB_COLUMNS utc
-        WHERE utc.TABLE_NAME = :table_name
-        ORDER BY utc.COLUMN_ID
-        """
-        
         try:
-            with connection.cursor() as cursor:
-                cursor.execute(query, {"table_name": table_name})
-                structure = cursor.fetchall()
+            cache = self._get_metadata_cache()
+            cached = cache.get_structure(table_name, "validation")
+            if cached is None:
+                metadata = self.load_table_metadata([table_name])
+                cache.put_structures(metadata)
+                cached = metadata.get(table_name, {}).get("validation", [])
         except Exception as e:
             print(f"Error al obtener la estructura de la tabla {table_name}: {e}")
             return []
 
-        # Procesar los datos obtenidos
-        columns = []
-        for col in structure:
-            column_name = col[0]
-            data_type_formatted = col[1]
-            data_type = col[2]
-            column_id = col[3]
-            precision = col[4] if col[4] else None
-            length = col[5] if col[5] else None
-            scale = col[6] if col[6] else None
-
-            # Construir el diccionario con la información relevante
-            column_info = {
-                'column_name': column_name,
-                'data_type': data_type,
-                'data_type_formatted': data_type_formatted,
-                'precision': precision,
-                'length': length,
-                'scale': scale,
-            }
-            columns.append(column_info)
+        return cached
 
-        return columns
+    def prepare_insert(self, table_name, columns):
+        """
+        Obtiene la sentencia INSERT preparada para (tabla, columnas), creándola la primera vez.
+        La sentencia conserva su cursor y sus enlaces tipados hasta `close_insert_statements`.
+        :param table_name: Nombre de la tabla.
+        :param columns: Columnas a insertar.
+        :return: InsertStatement reutilizable.
+        """
+        key = (table_name, tuple(columns))
+        statement = self.insert_statements.get(key)
+        if statement is None:
+            connection = self._get_transaction_connection()
+            structure = self.get_table_structure_for_validation(table_name)
+            statement = InsertStatement(connection, table_name, columns, structure)
+            self.insert_statements[key] = statement
+        return statement
+
+    def close_insert_statements(self):
+        """
+        Cierra los cursores de las sentencias INSERT preparadas y devuelve al pool la sesión de la transacción.
+        Las filas no confirmadas deben confirmarse antes de llamar a este método: las que queden
+        pendientes se deshacen para que la sesión vuelva al pool sin una transacción abierta.
+        """
+        for statement in self.insert_statements.values():
+            statement.close()
+        self.insert_statements = {}
+        if self.transaction_connection is not None:
+            discard = False
+            try:
+                self.transaction_connection.rollback()
+            except Exception as e:
+                print(f"Error al deshacer la transacción pendiente: {e}")
+                discard = True  # Una sesión que no puede deshacer su transacción no se reutiliza
+            self.transaction_pool.release(self.transaction_connection, discard=discard)
+            self.transaction_connection = None
+            self.transaction_pool = None
+
+    def _get_transaction_connection(self):
+        """
+        Obtiene la sesión que se conserva durante una importación: las sentencias preparadas,
+        los savepoints y los commits deben ejecutarse siempre sobre la misma sesión.
+        """
+        if self.transaction_connection is None:
+            pool = DatabaseConnection.get_connection()
+            if not pool:
+                raise ValueError("No hay conexión establecida.")
+            self.transaction_connection = pool.acquire()
+            self.transaction_pool = pool
+        return self.transaction_connection
 
-    def insert_row(self, table_name, row_data):
+    def insert_row(self, table_name, row_data, commit=True):
         """
         Inserta una sola fila en la tabla especificada.
         :param table_name: Nombre de la tabla.
         :param row_data: Diccionario con los datos de la fila.
+        :param commit: Si es False, la fila queda en la transacción en curso protegida por un savepoint.
         :raises: Excepción si ocurre un error durante la inserción.
         """
-        connection = DatabaseConnection.get_connection()
-        if not connection:
-            raise ValueError("No hay conexión establecida.")
+        batch_errors = self.insert_batch(table_name, [tuple(row_data.values())], list(row_data.keys()), commit)
+        if batch_errors:
+            raise ValueError(f"Error al insertar fila: {batch_errors[0][1]}")
 
-        cursor = connection.cursor()
-        columns_str = ", ".join([f'"{col}"' for col in row_data.keys()])
-        values_str = ", ".join([f":{col}" for col in row_data.keys()])
-        insert_query = f"INSERT INTO {table_name} ({columns_str}) VALUES ({values_str})"
+    def insert_batch(self, table_name, rows, columns, commit=True):
+        """
+        Inserta un lote de filas con una sola llamada a `executemany` (un viaje de ida y vuelta por lote).
+        Usa `batcherrors` para que las filas rechazadas no detengan el resto del lote.
+        :param table_name: Nombre de la tabla.
+        :param rows: Lista de secuencias de valores en el orden de `columns`.
+        :param columns: Columnas a insertar.
+        :param commit: Si es False, el lote queda en la transacción en curso protegido por un savepoint;
+                       si el driver rechaza el lote completo, se deshace este lote y las filas con error
+                       se aíslan dividiéndolo por la mitad (`_insert_bisecting`).
+        :return: Lista de tuplas (posición dentro del lote, mensaje de error) de las filas rechazadas.
+        :raises: Excepción si falla el lote completo con `commit` o si no se pueden aislar sus filas
+                 (por ejemplo, porque se perdió la sesión).
+        """
+        connection = self._get_transaction_connection()
+        statement = self.prepare_insert(table_name, columns)
+        bound_rows, positions, batch_errors = statement.bind_rows(rows)
+        if not bound_rows:
+            return batch_errors
 
         try:
-            cursor.execute(insert_query, row_data)
-            connection.commit()
+            if not commit:
+                statement.savepoint(self.SAVEPOINT_NAME)
+            # Las posiciones del driver se traducen a posiciones dentro de `rows`
+            batch_errors += [(positions[offset], message)
+                             for offset, message in statement.executemany(bound_rows, batcherrors=True)]
+            if commit:
+                connection.commit()
         except Exception as e:
-            connection.rollback()
-            raise ValueError(f"Error al insertar fila: {e}")
-        finally:
-            cursor.close()
+            if commit:
+                connection.rollback()
+                raise ValueError(f"Error al insertar lote: {e}")
+            # Un error que no es de una fila (por ejemplo, un valor que no se puede enlazar) rechaza el lote
+            # completo: se deshace y se reintenta por mitades para que solo se omitan las filas con error
+            failed = []
+            try:
+                statement.rollback_to_savepoint(self.SAVEPOINT_NAME)
+                self._insert_bisecting(statement, bound_rows, positions, [], failed)
+            except Exception as bisect_error:
+                raise ValueError(f"Error al insertar lote: {bisect_error}")
+            batch_errors += [(error["index"], error["error"]) for error in failed]
+
+        return sorted(batch_errors)
+
+    def commit(self):
+        """
+        Confirma la transacción en curso.
+        """
+        if self.transaction_connection is not None:
+            self.transaction_connection.commit()
+
+    def rollback(self):
+        """
+        Deshace la transacción en curso completa.
+        """
+        if self.transaction_connection is not None:
+            self.transaction_connection.rollback()
@@ -0,0 +1,15 @@
+import os
+import sys
+import types
+
+# Las pruebas importan los módulos como la aplicación, desde la raíz de Redline_collector
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.module_utils import is_available  # noqa: E402
+
+if not is_available("oracledb"):
+    # Las pruebas usan conexiones simuladas: de python-oracledb solo se necesitan las constantes
+    # que se leen al preparar las sentencias, para poder importar los modelos sin el driver
+    oracledb = types.ModuleType("oracledb")
+    oracledb.DB_TYPE_NUMBER = "DB_TYPE_NUMBER"
+    sys.modules["oracledb"] = oracledb
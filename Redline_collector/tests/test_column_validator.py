@@ -0,0 +1,130 @@
+import datetime
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from controllers.management.column_validator import ColumnValidator
+
+
+def legacy_number_errors(column_data, precision, scale):
+    """
+    Regla fila a fila de `ImportController.validate_number_column` antes de vectorizarla.
+    """
+    scale = scale or 0
+    error_rows = []
+    for idx, value in enumerate(column_data):
+        try:
+            if isinstance(value, (int, float)):
+                if scale > 0 and '.' in str(value) and len(str(value).split('.')[1]) > scale:
+                    error_rows.append(idx + 1)
+                if precision is not None and len(str(int(abs(value)))) > precision:
+                    error_rows.append(idx + 1)
+            else:
+                float_value = float(value)
+                if precision is not None and len(str(int(abs(float_value)))) > precision:
+                    error_rows.append(idx + 1)
+        except (ValueError, TypeError, OverflowError):
+            error_rows.append(idx + 1)
+    return sorted(set(error_rows))
+
+
+def legacy_varchar_errors(column_data, length):
+    """
+    Regla fila a fila de `ImportController.validate_varchar_column` antes de vectorizarla.
+    """
+    return [idx + 1 for idx, value in enumerate(column_data) if len(str(value)) > length]
+
+
+NUMBER_VALUES = [
+    None, 0, -0.0, 1, 12, 123, 1234, -1234, 10 ** 20, 1.5, 1.25, 1.255, -99.99, 1e5, 1e-7,
+    float("nan"), float("inf"), "12", " 12 ", "1.234", "1e5", "abc", "", "1_000", "nan", "inf",
+    Decimal("12.5"), np.int64(99999), True, pd.Timestamp("2020-01-01"),
+]
+
+
+@pytest.mark.parametrize("precision, scale", [(None, None), (3, 0), (5, 2), (4, 1), (1, None), (20, 3)])
+def test_number_errors_match_legacy_rule(precision, scale):
+    column = pd.Series(NUMBER_VALUES, dtype=object)
+    errors = ColumnValidator.number_errors(column, precision, scale)
+    assert ColumnValidator.error_positions(errors).tolist() == legacy_number_errors(NUMBER_VALUES, precision, scale)
+
+
+@pytest.mark.parametrize("dtype", ["int64", "uint64", "float64"])
+def test_number_errors_match_legacy_rule_for_numeric_columns(dtype):
+    column = pd.Series([0, 7, 99, 100, 12345, 18000000000000000000], dtype="float64")
+    column = column.astype(dtype) if dtype != "int64" else column.clip(upper=9e18).astype(dtype)
+    for precision, scale in ((2, 0), (3, 1), (19, None), (5, 2)):
+        errors = ColumnValidator.number_errors(column, precision, scale)
+        assert ColumnValidator.error_positions(errors).tolist() == legacy_number_errors(column, precision, scale)
+
+
+def test_number_errors_flag_none_and_nan_like_legacy_rule():
+    # La regla heredada convierte None con float() (error); NaN solo falla al contar dígitos enteros
+    column = pd.Series([None, float("nan"), 1], dtype=object)
+    assert ColumnValidator.number_errors(column, None, 0).tolist() == [True, False, False]
+    assert ColumnValidator.number_errors(column, 5, 0).tolist() == [True, True, False]
+
+
+def test_varchar_char_semantics_match_legacy_rule_for_non_null_values():
+    values = ["", "a", "abc", "abcd", "ñandú", 5, 12345, 1.5, "  x  "]
+    for length in (1, 3, 4, 5):
+        errors = ColumnValidator.varchar_errors(pd.Series(values, dtype=object), length, "C", length * 4)
+        assert ColumnValidator.error_positions(errors).tolist() == legacy_varchar_errors(values, length)
+
+
+def test_varchar_nulls_are_not_validated():
+    # La regla heredada medía "None" (4 caracteres); los nulos los informa la validación NOT NULL
+    column = pd.Series([None, float("nan"), "ab"], dtype=object)
+    assert not ColumnValidator.varchar_errors(column, 2, "C", 8).any()
+
+
+def test_varchar_byte_semantics_count_utf8_bytes():
+    values = ["abc", "ñab", "ññ", "€", "€a", "😀", None]
+    errors = ColumnValidator.varchar_errors(pd.Series(values, dtype=object), 3, "B", 3)
+    expected = [len(value.encode("utf-8")) > 3 if value is not None else False for value in values]
+    assert errors.tolist() == expected
+
+
+def test_varchar_char_semantics_also_limit_bytes():
+    # VARCHAR2(2 CHAR) con un máximo de 4 bytes: "😀😀" tiene 2 caracteres pero 8 bytes
+    errors = ColumnValidator.varchar_errors(pd.Series(["ññ", "😀😀", "abc"], dtype=object), 2, "C", 4)
+    assert errors.tolist() == [False, True, True]
+
+
+def test_compact_columns_validate_like_object_columns():
+    compact = pd.Series(pd.array([1, None, 300], dtype="Int16"))
+    plain = pd.Series([1, None, 300], dtype=object)
+    assert (ColumnValidator.number_errors(compact, 2, 0) == ColumnValidator.number_errors(plain, 2, 0)).all()
+
+
+def test_datetime_parsing_accepts_iso_day_first_and_spanish_months():
+    values = ["2024-01-05", "05/01/2024", "31-ENE-24", "15-ago-2023", "0001-01-12", None, "  ",
+              datetime.datetime(2020, 1, 1), "not a date", 5]
+    parsed, errors = ColumnValidator.parse_datetimes(pd.Series(values, dtype=object))
+    assert errors.tolist() == [False] * 8 + [True, True]
+    assert list(parsed[:5]) == [datetime.datetime(2024, 1, 5), datetime.datetime(2024, 1, 5),
+                                datetime.datetime(2024, 1, 31), datetime.datetime(2023, 8, 15),
+                                datetime.datetime(1, 1, 12)]
+    # Las posiciones no interpretadas conservan el valor original
+    assert parsed[5] is None and parsed[8] == "not a date"
+
+
+def test_datetime_errors_use_the_same_parser():
+    column = pd.Series(["2024-02-30", "2024-02-29", "2024-13-01"], dtype=object)
+    assert ColumnValidator.datetime_errors(column).tolist() == ColumnValidator.parse_datetimes(column)[1].tolist()
+    assert ColumnValidator.datetime_errors(column).tolist() == [True, False, True]
+
+
+def test_datetime_parsing_keeps_wall_clock_time_of_offset_timestamps():
+    values = ["2024-01-05T10:00:00+03:00", "2024-01-05 10:00:00-0500", "2024-01-05T10:00:00Z", "05/01/2024 10:00 UTC"]
+    parsed, errors = ColumnValidator.parse_datetimes(pd.Series(values, dtype=object))
+    assert not errors.any()
+    assert list(parsed) == [datetime.datetime(2024, 1, 5, 10, 0)] * 4
+
+
+def test_datetime_parsing_does_not_take_a_date_for_an_offset():
+    parsed, errors = ColumnValidator.parse_datetimes(pd.Series(["05-01-2024", "2024-01-05"], dtype=object))
+    assert not errors.any()
+    assert list(parsed) == [datetime.datetime(2024, 1, 5)] * 2
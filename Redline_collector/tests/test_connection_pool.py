@@ -0,0 +1,65 @@
+import pytest
+
+from core.connection_pool import ConnectionPool
+from models.table.table_model import TableModel
+
+
+class FakeSession:
+    def __init__(self, fail_rollback=False):
+        self.fail_rollback = fail_rollback
+        self.transaction_in_progress = True
+        self.rollbacks = 0
+        self.closed = False
+
+    def rollback(self):
+        if self.fail_rollback:
+            raise RuntimeError("ORA-03113")
+        self.rollbacks += 1
+        self.transaction_in_progress = False
+
+    def ping(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = ConnectionPool({}, min_size=0, max_size=2)
+    monkeypatch.setattr(pool, "_create_session", FakeSession)
+    return pool
+
+
+def test_release_rolls_back_an_open_transaction_and_reuses_the_session(pool):
+    session = pool.acquire()
+    pool.release(session)
+    assert session.rollbacks == 1
+    assert pool.acquire() is session
+
+
+def test_release_skips_the_rollback_without_an_open_transaction(pool):
+    session = pool.acquire()
+    session.transaction_in_progress = False
+    pool.release(session)
+    assert session.rollbacks == 0
+
+
+def test_release_discards_a_session_that_cannot_roll_back(pool):
+    session = pool.acquire()
+    session.fail_rollback = True
+    pool.release(session)
+    assert session.closed
+    assert pool.acquire() is not session
+
+
+def test_close_insert_statements_rolls_back_before_releasing_the_session(pool):
+    model = TableModel()
+    model.transaction_connection = session = pool.acquire()
+    model.transaction_pool = pool
+
+    model.close_insert_statements()
+
+    assert session.rollbacks == 1
+    assert model.transaction_connection is None
+    assert pool.acquire() is session
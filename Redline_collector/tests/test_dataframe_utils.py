@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from controllers.management.column_validator import ColumnValidator
+from utils.dataframe_utils import compact_dataframe, memory_usage, prepare_dataframe
+
+
+def loaded_frame(rows=200):
+    # Tipos con que pandas lee un archivo: enteros y decimales de NumPy, textos de pandas y objetos mezclados
+    return pd.DataFrame({
+        "ID": np.arange(rows, dtype=np.int64),
+        "MONTO": np.where(np.arange(rows) % 10 == 0, np.nan, np.arange(rows) / 4),
+        "ESTADO": pd.Series(["A", "B"] * (rows // 2), dtype="str"),
+        "MIXTO": pd.Series([1, "x"] * (rows // 2), dtype=object),
+        "FECHA": pd.to_datetime(["2024-01-05", None] * (rows // 2)),
+    })
+
+
+def test_compact_dataframe_keeps_values_of_native_columns():
+    frame = loaded_frame()
+    compact = compact_dataframe(frame)
+    prepared = prepare_dataframe(frame)
+    assert compact["ID"].dtype == np.int16
+    assert compact["MONTO"].dtype == "Float32"
+    assert compact["ESTADO"].dtype == "category"
+    assert compact["FECHA"].dtype.kind == "M"
+    for name in frame.columns:
+        assert list(ColumnValidator.to_values(compact[name])) == list(ColumnValidator.to_values(prepared[name]))
+
+
+def test_compact_dataframe_drops_empty_rows_without_boxing_the_frame():
+    frame = pd.DataFrame({"ID": [1.0, np.nan, 3.0], "NOMBRE": pd.Series(["a", None, "c"], dtype="str")})
+    compact = compact_dataframe(frame)
+    assert list(compact.index) == [0, 2]
+    assert compact["ID"].dtype == "float32"
+    assert list(ColumnValidator.to_values(compact["NOMBRE"])) == ["a", "c"]
+
+
+def test_compact_dataframe_keeps_unsigned_integers_outside_int64():
+    frame = pd.DataFrame({"ID": np.array([1, 2 ** 64 - 1], dtype=np.uint64)})
+    compact = compact_dataframe(frame)
+    assert compact["ID"].dtype == np.uint64
+    assert list(compact["ID"]) == [1, 2 ** 64 - 1]
+
+
+def test_compact_dataframe_uses_less_memory_than_loaded_frame():
+    frame = loaded_frame(10000)
+    assert memory_usage(compact_dataframe(frame)) < memory_usage(frame)
+
+
+def test_datetime_nulls_are_none_for_validation():
+    column = pd.Series(pd.to_datetime(["2024-01-05", None]))
+    values, errors = ColumnValidator.parse_datetimes(column)
+    assert values[1] is None
+    assert not errors.any()
+
+
+def test_compact_dataframe_keeps_arrow_columns():
+    pa = pytest.importorskip("pyarrow")
+    frame = pd.DataFrame({
+        "ID": pd.Series([1, 2, None, 4], dtype="int64[pyarrow]"),
+        "MONTO": pd.Series([1.5, 2.25, 3.0, 4.0], dtype="double[pyarrow]"),
+        "ESTADO": pd.Series(["A", "A", "B", "A"], dtype=pd.ArrowDtype(pa.string())),
+    })
+    compact = compact_dataframe(frame)
+    assert compact["ID"].dtype == frame["ID"].dtype
+    assert compact["MONTO"].dtype == frame["MONTO"].dtype
+    assert compact["ESTADO"].dtype == "category"
+    prepared = prepare_dataframe(frame)
+    for name in frame.columns:
+        assert list(ColumnValidator.to_values(compact[name])) == list(ColumnValidator.to_values(prepared[name]))
+    for precision, scale in ((1, 0), (2, 1), (3, 2)):
+        assert (ColumnValidator.number_errors(compact["MONTO"], precision, scale)
+                == ColumnValidator.number_errors(prepared["MONTO"], precision, scale)).all()
+        assert (ColumnValidator.number_errors(compact["ID"], precision, scale)
+                == ColumnValidator.number_errors(prepared["ID"], precision, scale)).all()
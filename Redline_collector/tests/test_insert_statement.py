@@ -0,0 +1,64 @@
+import datetime
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+
+from controllers.management.column_validator import ColumnValidator
+from models.table.insert_statement import InsertStatement
+
+STRUCTURE = [
+    {"column_name": "CODE", "data_type": "VARCHAR2", "length": 10},
+    {"column_name": "FLAG", "data_type": "CHAR", "length": 1},
+    {"column_name": "AMOUNT", "data_type": "NUMBER"},
+    {"column_name": "CREATED", "data_type": "DATE"},
+]
+
+
+class FakeCursor:
+    def prepare(self, sql):
+        self.sql = sql
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def cursor(self):
+        return FakeCursor()
+
+
+def make_statement():
+    return InsertStatement(FakeConnection(), "T", [column["column_name"] for column in STRUCTURE], STRUCTURE)
+
+
+def test_bind_rows_converts_non_text_values_in_character_columns():
+    statement = make_statement()
+    rows = [
+        (12345, 1, "10", None),
+        (np.int64(7), True, 2.5, None),
+        (1.5, "S", np.float64(3.0), None),
+        ("A-1", None, None, None),
+    ]
+
+    bound_rows, positions, errors = statement.bind_rows(rows)
+
+    assert errors == [] and positions == [0, 1, 2, 3]
+    assert [row[:2] for row in bound_rows] == [["12345", "1"], ["7", "True"], ["1.5", "S"], ["A-1", None]]
+    # Las columnas NUMBER conservan su conversión
+    assert [row[2] for row in bound_rows] == [Decimal("10"), 2.5, 3.0, None]
+    assert all(isinstance(row[0], str) for row in bound_rows)
+
+
+def test_bind_rows_leaves_other_columns_untouched():
+    created = datetime.datetime(2024, 1, 5)
+    bound_rows, _, _ = make_statement().bind_rows([("A", "S", 1, created), ("B", "N", 2, pd.NaT)])
+    assert [row[3] for row in bound_rows] == [created, None]
+
+
+def test_character_text_matches_the_text_validated():
+    # La validación mide el `str` de cada valor; se enlaza exactamente ese texto
+    values = [12345, 1.5, True, np.int64(7)]
+    bound_rows, _, _ = make_statement().bind_rows([(value, None, None, None) for value in values])
+    validated = ColumnValidator.to_text(ColumnValidator.to_values(pd.Series(values, dtype=object))).tolist()
+    assert [row[0] for row in bound_rows] == validated
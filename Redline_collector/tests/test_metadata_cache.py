@@ -0,0 +1,71 @@
+import pytest
+
+from models.table.metadata_cache import MetadataCache
+
+
+@pytest.fixture(autouse=True)
+def cache_directory(tmp_path, monkeypatch):
+    # La caché se guarda bajo ./cache del directorio de trabajo
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_metadata_revalidate_drops_only_changed_and_removed_tables():
+    cache = MetadataCache("dev", "APP")
+    cache.revalidate({"A": "2024-01-01", "B": "2024-01-01", "C": "2024-01-01"})
+    cache.put_structures({name: {"validation": [name]} for name in ("A", "B", "C")})
+
+    cache.revalidate({"A": "2024-01-01", "B": "2024-02-01"})
+
+    assert cache.get_structure("A", "validation") == ["A"]
+    assert cache.get_structure("B", "validation") is None
+    assert cache.get_structure("C", "validation") is None
+    assert cache.tables == ["A", "B"]
+
+
+def test_metadata_cache_persists_and_ignores_other_versions(monkeypatch):
+    cache = MetadataCache("dev", "APP")
+    cache.revalidate({"A": "2024-01-01"})
+    cache.put_structures({"A": {"structure": [["ID", "NUMBER"]]}})
+    assert MetadataCache("dev", "APP").get_structure("A", "structure") == [["ID", "NUMBER"]]
+
+    monkeypatch.setattr(MetadataCache, "VERSION", MetadataCache.VERSION + 1)
+    assert MetadataCache("dev", "APP").tables is None
+
+
+def test_metadata_cache_expires_after_ttl():
+    cache = MetadataCache("dev", "APP", ttl=60)
+    assert not cache.is_fresh()
+    cache.revalidate({"A": "2024-01-01"})
+    assert cache.is_fresh()
+    cache.checked_at -= 61
+    assert not cache.is_fresh()
+
+
+def test_for_connection_shares_one_cache_per_connection_and_schema(monkeypatch):
+    monkeypatch.setattr(MetadataCache, "_instances", {})
+    assert MetadataCache.for_connection("dev", "APP") is MetadataCache.for_connection("dev", "APP")
+    assert MetadataCache.for_connection("dev", "APP") is not MetadataCache.for_connection("dev", "OTHER")
+
+
+def test_clear_discards_everything():
+    cache = MetadataCache("dev", "APP")
+    cache.revalidate({"A": "2024-01-01"})
+    cache.put_structures({"A": {"structure": []}})
+    cache.clear()
+    reopened = MetadataCache("dev", "APP")
+    assert reopened.tables is None
+    assert reopened.get_structure("A", "structure") is None
+
+
+def test_update_ddl_time_drops_the_structure_only_when_the_table_changed():
+    cache = MetadataCache("dev", "APP")
+    cache.revalidate({"A": "2024-01-01", "B": "2024-01-01"})
+    cache.put_structures({name: {"validation": [name]} for name in ("A", "B")})
+
+    cache.update_ddl_time("A", "2024-01-01")
+    cache.update_ddl_time("B", "2024-02-01")
+
+    assert cache.get_structure("A", "validation") == ["A"]
+    assert cache.get_structure("B", "validation") is None
+    assert MetadataCache("dev", "APP").ddl_times["B"] == "2024-02-01"
@@ -0,0 +1,121 @@
+import os
+
+import pandas as pd
+import pytest
+
+from controllers.file.sheet_cache import SheetCache
+
+
+@pytest.fixture(autouse=True)
+def cache_directory(tmp_path, monkeypatch):
+    # La caché se guarda bajo ./cache del directorio de trabajo
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_sheet_cache_key_changes_when_the_file_changes(cache_directory):
+    path = cache_directory / "book.xlsx"
+    path.write_bytes(b"first version")
+    cache = SheetCache()
+    cache.enabled = True  # La clave no necesita pyarrow
+
+    key = cache.key(str(path), "Hoja1")
+    assert key == cache.key(str(path), "Hoja1")
+    assert key != cache.key(str(path), "Hoja2")
+
+    stat = os.stat(path)
+    path.write_bytes(b"other version")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))  # Mismo tamaño y fecha: cambia el hash
+    assert key != cache.key(str(path), "Hoja1")
+
+
+def test_disabled_sheet_cache_neither_reads_nor_writes(cache_directory):
+    path = cache_directory / "book.xlsx"
+    path.write_bytes(b"data")
+    cache = SheetCache()
+    cache.enabled = False
+
+    key = cache.key(str(path), "Hoja1")
+    cache.put(key, pd.DataFrame({"A": [1, 2]}))
+    assert key is None
+    assert cache.get(key) is None
+    assert not os.path.exists(cache.directory)
+
+
+def test_sheet_cache_misses_keys_without_a_file():
+    cache = SheetCache()
+    cache.enabled = True
+    assert cache.get("missing") is None
+
+
+def test_sheet_cache_does_not_write_sheets_with_mixed_columns(cache_directory):
+    # Se descarta antes de convertir a Arrow, por lo que no necesita pyarrow
+    cache = SheetCache()
+    cache.enabled = True
+    cache.put("mixed", pd.DataFrame({"A": pd.Series([1, "a"], dtype=object)}))
+    cache.put("numbers", pd.DataFrame({0: [1, 2]}))  # Encabezados que no son texto
+    assert not os.path.exists(cache.directory)
+
+
+def test_sheet_cache_evicts_least_recently_used_files():
+    cache = SheetCache(max_bytes=250)
+    os.makedirs(cache.directory)
+    for age, name in enumerate(("old", "middle", "new")):
+        path = cache.get_path(name)
+        with open(path, "wb") as file:
+            file.write(b"x" * 100)
+        os.utime(path, (1000 + age, 1000 + age))
+
+    cache.evict()
+
+    remaining = sorted(entry.name for entry in os.scandir(cache.directory))
+    assert remaining == ["middle.arrow", "new.arrow"]
+
+
+def test_sheet_cache_eviction_skips_files_in_use(monkeypatch):
+    cache = SheetCache(max_bytes=200)
+    os.makedirs(cache.directory)
+    for age, name in enumerate(("in_use", "old", "new")):
+        path = cache.get_path(name)
+        with open(path, "wb") as file:
+            file.write(b"x" * 100)
+        os.utime(path, (1000 + age, 1000 + age))
+    remove = os.remove
+
+    def remove_unless_in_use(path):
+        if path == cache.get_path("in_use"):
+            raise PermissionError(path)  # Como en Windows con un archivo mapeado en memoria
+        remove(path)
+
+    monkeypatch.setattr("controllers.file.sheet_cache.os.remove", remove_unless_in_use)
+    cache.evict()
+
+    remaining = sorted(entry.name for entry in os.scandir(cache.directory))
+    assert remaining == ["in_use.arrow", "new.arrow"]
+
+
+@pytest.mark.parametrize("values, cacheable", [
+    (["a", None], True),
+    ([1.5, None], True),
+    ([1, 2], True),
+    ([1, 2.5], False),                   # Arrow las convertiría a decimales: 1 volvería como 1.0
+    ([1, None], False),
+    ([1, "a"], False),
+])
+def test_sheet_cache_skips_columns_arrow_would_retype(values, cacheable):
+    assert SheetCache.is_cacheable(pd.Series(values, dtype=object)) is cacheable
+
+
+def test_sheet_cache_round_trip_keeps_values(cache_directory):
+    pytest.importorskip("pyarrow")
+    cache = SheetCache()
+    path = cache_directory / "book.xlsx"
+    path.write_bytes(b"data")
+    dataframe = pd.DataFrame({"A": [1, 2], "B": ["x", None], "C": [1.5, 2.0]})
+
+    key = cache.key(str(path), "Hoja1")
+    cache.put(key, dataframe)
+    cached = cache.get(key)
+    pd.testing.assert_frame_equal(cached, dataframe, check_dtype=False)
+    assert cached["A"].dtype == dataframe["A"].dtype  # Los números vuelven como columnas NumPy
+    assert cached["B"].dtype == "str"
@@ -0,0 +1,193 @@
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from controllers.management.import_controller import ImportController
+from models.table.insert_statement import InsertStatement
+from models.table.table_model import TableModel
+
+DUPLICATE = "ORA-00001: restricción única violada"
+UNBINDABLE = "DPY-3013: tipo de enlace no soportado"
+LOST = "DPI-1080: se perdió la conexión"
+
+
+class FakeConnection:
+    """
+    Sesión de Oracle simulada: una tabla en memoria con savepoints, commit y rollback.
+    Las filas cuyo primer valor está en `failing_values` se rechazan como claves duplicadas; las de
+    `unbindable_values` hacen fallar el `executemany` completo antes de aplicar ninguna fila, como un
+    error de enlace del driver. Con `lost` toda sentencia falla.
+    """
+
+    def __init__(self, failing_values=(), unbindable_values=()):
+        self.failing_values = set(failing_values)
+        self.unbindable_values = set(unbindable_values)
+        self.lost = False
+        self.rows = []           # Filas aplicadas en la transacción en curso
+        self.committed = []      # Filas confirmadas
+        self.savepoints = {}
+        self.statements = 0      # Viajes a la base de datos con INSERT
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.committed += self.rows
+        self.rows = []
+        self.savepoints = {}
+
+    def rollback(self):
+        self.rows = []
+        self.savepoints = {}
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.batch_errors = []
+
+    def prepare(self, sql):
+        self.sql = sql
+
+    def setinputsizes(self, *sizes):
+        pass
+
+    def execute(self, sql, row=None):
+        connection = self.connection
+        if connection.lost:
+            raise RuntimeError(LOST)
+        if sql is not None and sql.startswith("SAVEPOINT "):
+            connection.savepoints[sql.split()[-1]] = len(connection.rows)
+        elif sql is not None and sql.startswith("ROLLBACK TO SAVEPOINT "):
+            del connection.rows[connection.savepoints[sql.split()[-1]]:]
+        else:
+            self.executemany(None, [row])
+
+    def executemany(self, sql, rows, batcherrors=False):
+        # Como Oracle: sin batcherrors, las filas previas al error quedan aplicadas hasta el rollback
+        if self.connection.lost:
+            raise RuntimeError(LOST)
+        self.connection.statements += 1
+        self.batch_errors = []
+        if any(row[0] in self.connection.unbindable_values for row in rows):
+            raise TypeError(UNBINDABLE)
+        for offset, row in enumerate(rows):
+            if row[0] in self.connection.failing_values:
+                if not batcherrors:
+                    raise RuntimeError(DUPLICATE)
+                self.batch_errors.append(SimpleNamespace(offset=offset, message=DUPLICATE))
+            else:
+                self.connection.rows.append(tuple(row))
+
+    def getbatcherrors(self):
+        return self.batch_errors
+
+    def close(self):
+        pass
+
+
+def make_model(connection, columns, structure):
+    model = TableModel()
+    model.transaction_connection = connection
+    model.insert_statements[("T", tuple(columns))] = InsertStatement(connection, "T", columns, structure)
+    return model
+
+
+@pytest.mark.parametrize("failing_values", [set(), {0}, {7}, {3, 4, 5}, {0, 15, 31}, set(range(0, 32, 3))])
+def test_insert_data_bisects_failed_batches_down_to_the_rejected_rows(failing_values):
+    connection = FakeConnection(failing_values=failing_values)
+    model = make_model(connection, ["ID"], [])
+    dataframe = pd.DataFrame({"ID": list(range(32))}, index=range(100, 132))
+
+    result = model.insert_data("T", dataframe, ["ID"], batch_size=16)
+
+    expected_success = [100 + value for value in range(32) if value not in failing_values]
+    assert sorted(result["success"]) == expected_success
+    assert sorted(error["index"] for error in result["errors"]) == [100 + value for value in sorted(failing_values)]
+    assert all(error["error"] == DUPLICATE for error in result["errors"])
+    # Cada fila aceptada se aplica exactamente una vez y se confirma al final
+    assert connection.committed == [(value,) for value in range(32) if value not in failing_values]
+
+
+def test_bisection_sends_fewer_statements_than_row_by_row():
+    connection = FakeConnection(failing_values={5})
+    model = make_model(connection, ["ID"], [])
+    model.insert_data("T", pd.DataFrame({"ID": list(range(64))}), ["ID"], batch_size=64)
+    # Un lote fallido y dos mitades por nivel hasta aislar la fila: 1 + 2·log2(64)
+    assert connection.statements <= 1 + 2 * 6
+
+
+class ModelTableController:
+    """
+    Controlador de tablas que delega en un TableModel sobre una sesión simulada.
+    """
+
+    def __init__(self, model):
+        self.model = model
+
+    def ensure_connection_active(self):
+        pass
+
+    def get_table_structure_for_validation(self, table_name):
+        return []
+
+    def insert_batch(self, table_name, rows, columns, commit=True):
+        return self.model.insert_batch(table_name, rows, columns, commit)
+
+    def commit(self):
+        self.model.commit()
+
+    def rollback(self):
+        self.model.rollback()
+
+    def close_insert_statements(self):
+        pass
+
+
+def test_insert_batch_maps_driver_offsets_back_to_row_positions():
+    connection = FakeConnection(failing_values={20})
+    model = make_model(connection, ["ID", "NAME"], [{"column_name": "ID", "data_type": "NUMBER"}])
+    rows = [(10, "a"), ("x", "b"), (20, "c"), ("30", "d"), (20, "e")]
+
+    errors = model.insert_batch("T", rows, ["ID", "NAME"], commit=False)
+
+    # "x" no se convierte y no llega al driver: los offsets del driver (1 y 3) corresponden a las filas 2 y 4
+    assert [position for position, _ in errors] == [1, 2, 4]
+    assert errors[0][1].startswith("Valor no numérico")
+    assert errors[1][1] == errors[2][1] == DUPLICATE
+    assert [row[1] for row in connection.rows] == ["a", "d"]
+    assert connection.committed == []
+
+
+def test_insert_batch_isolates_a_row_that_fails_the_whole_batch():
+    connection = FakeConnection(unbindable_values={5})
+    model = make_model(connection, ["ID"], [])
+    model.insert_batch("T", [(100,)], ["ID"], commit=False)
+
+    errors = model.insert_batch("T", [(value,) for value in range(10)], ["ID"], commit=False)
+
+    assert errors == [(5, UNBINDABLE)]
+    assert connection.rows == [(100,)] + [(value,) for value in range(10) if value != 5]
+
+
+def test_insert_batch_raises_when_the_rows_cannot_be_isolated():
+    connection = FakeConnection()
+    model = make_model(connection, ["ID"], [])
+    model.insert_batch("T", [(1,), (2,)], ["ID"], commit=False)
+    connection.lost = True
+
+    with pytest.raises(ValueError, match="DPI-1080"):
+        model.insert_batch("T", [(3,), (4,)], ["ID"], commit=False)
+
+
+def test_import_keeps_the_good_rows_of_a_batch_the_driver_rejects():
+    connection = FakeConnection(unbindable_values={"bad"})
+    model = make_model(connection, ["ID"], [])
+    dataframe = pd.DataFrame({"ID": [1, 2, 3, "bad", 5, 6, 7, 8]}, dtype=object)
+
+    summary = ImportController(ModelTableController(model), dataframe).import_data("T", ["ID"], batch_size=8)
+
+    assert summary["inserted"] == summary["committed"] == 7
+    assert [(record["ID"], record["Errores"]) for record in summary["details"]] == [("bad", UNBINDABLE)]
+    assert connection.committed == [(value,) for value in (1, 2, 3, 5, 6, 7, 8)]
@@ -0,0 +1,115 @@
+import pandas as pd
+import pytest
+
+from controllers.management.import_controller import ImportController
+from controllers.management.transaction_policy import TransactionPolicy
+
+
+class FakeTableController:
+    """
+    Controlador de tablas que registra las llamadas de la importación en lugar de usar Oracle.
+    """
+
+    def __init__(self, failing_values=()):
+        self.failing_values = set(failing_values)
+        self.calls = []
+        self.pending_rows = 0
+        self.committed_rows = 0
+
+    def ensure_connection_active(self):
+        pass
+
+    def insert_batch(self, table_name, rows, columns, commit=True):
+        errors = [(offset, "ORA-00001") for offset, row in enumerate(rows) if row[0] in self.failing_values]
+        self.pending_rows += len(rows) - len(errors)
+        self.calls.append(("insert", len(rows)))
+        return errors
+
+    def commit(self):
+        self.committed_rows += self.pending_rows
+        self.pending_rows = 0
+        self.calls.append("commit")
+
+    def rollback(self):
+        self.pending_rows = 0
+        self.calls.append("rollback")
+
+    def close_insert_statements(self):
+        self.calls.append("close")
+
+    def get_table_structure_for_validation(self, table_name):
+        return []
+
+
+def run_import(table_controller, rows, policy, batch_size):
+    dataframe = pd.DataFrame({"ID": list(range(rows))}, dtype=object)
+    controller = ImportController(table_controller, dataframe)
+    return controller.import_data("T", ["ID"], batch_size=batch_size, transaction_policy=policy)
+
+
+def test_every_rows_commits_when_interval_is_reached():
+    policy = TransactionPolicy(TransactionPolicy.EVERY_ROWS, 5)
+    policy.start()
+    commits = []
+    for inserted in (3, 3, 1, 4, 1):
+        policy.register(inserted)
+        if policy.should_commit():
+            commits.append(policy.pending_rows)
+            policy.mark_committed()
+    assert commits == [6, 5]
+    assert policy.committed_rows == 11
+    assert policy.pending_rows == 1
+
+
+def test_every_seconds_commits_when_interval_elapses(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("controllers.management.transaction_policy.time.monotonic", lambda: now[0])
+    policy = TransactionPolicy(TransactionPolicy.EVERY_SECONDS, 30)
+    policy.start()
+    policy.register(10)
+    assert not policy.should_commit()
+    now[0] += 30
+    assert policy.should_commit()
+    policy.mark_committed()
+    now[0] += 60
+    assert not policy.should_commit()  # Sin filas pendientes no hay nada que confirmar
+
+
+def test_at_end_never_commits_during_import():
+    policy = TransactionPolicy(TransactionPolicy.AT_END)
+    policy.start()
+    policy.register(10 ** 6)
+    assert not policy.should_commit()
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        TransactionPolicy("weekly")
+
+
+def test_import_commits_at_interval_and_at_end_before_close():
+    table_controller = FakeTableController()
+    summary = run_import(table_controller, 7, TransactionPolicy(TransactionPolicy.EVERY_ROWS, 4), batch_size=2)
+    assert table_controller.calls == [("insert", 2), ("insert", 2), "commit", ("insert", 2), ("insert", 1),
+                                      "commit", "close"]
+    assert summary["committed"] == table_controller.committed_rows == 7
+
+
+def test_import_at_end_commits_once_and_skips_rejected_rows():
+    table_controller = FakeTableController(failing_values={3})
+    summary = run_import(table_controller, 5, TransactionPolicy(TransactionPolicy.AT_END), batch_size=2)
+    assert table_controller.calls[-2:] == ["commit", "close"]
+    assert table_controller.calls.count("commit") == 1
+    assert summary["inserted"] == summary["committed"] == 4
+    assert [record["ID"] for record in summary["details"]] == [3]
+
+
+def test_import_rolls_back_before_close_on_failure():
+    class BrokenTableController(FakeTableController):
+        def commit(self):
+            raise RuntimeError("ORA-03113")
+
+    table_controller = BrokenTableController()
+    with pytest.raises(RuntimeError):
+        run_import(table_controller, 3, TransactionPolicy(TransactionPolicy.AT_END), batch_size=2)
+    assert table_controller.calls[-2:] == ["rollback", "close"]
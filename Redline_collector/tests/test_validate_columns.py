@@ -0,0 +1,54 @@
+import pandas as pd
+
+from controllers.management.import_controller import ImportController
+
+STRUCTURE = [
+    {"column_name": "ID", "data_type": "NUMBER", "precision": 2, "scale": 0, "data_type_formatted": "NUMBER(2)"},
+    {"column_name": "NOMBRE", "data_type": "VARCHAR2", "length": 3, "char_used": "C",
+     "data_type_formatted": "VARCHAR2(3)"},
+    {"column_name": "EXTRA", "data_type": "VARCHAR2", "length": 3, "char_used": "C",
+     "data_type_formatted": "VARCHAR2(3)"},
+]
+
+
+class FakeTableController:
+    """
+    Controlador de tablas con una estructura fija y sin `last_ddl_time` (sin caché de validación).
+    """
+
+    def ensure_connection_active(self):
+        pass
+
+    def get_table_structure_for_validation(self, table_name):
+        return STRUCTURE
+
+    def get_ddl_time(self, table_name, fresh=False):
+        return None
+
+
+def make_controller():
+    dataframe = pd.DataFrame({"ID": [1, 200, 3], "NOMBRE": ["ab", "abc", "abcd"]}, dtype=object)
+    controller = ImportController(FakeTableController(), dataframe)
+    visible_columns = [{"column_name": name, "data": dataframe[name]} for name in dataframe.columns]
+    return controller, visible_columns
+
+
+def test_validate_columns_reports_columns_in_table_order():
+    controller, visible_columns = make_controller()
+    results = controller.validate_columns(visible_columns, "T")
+    assert [result["column_name"] for result in results] == ["ID", "NOMBRE", "EXTRA"]
+    assert [result["status"] for result in results] == ["Incorrecto", "Incorrecto", "No disponible en el dataframe"]
+    assert controller.row_failures.failed_count == 2
+
+
+def test_cancel_stops_validation_between_columns():
+    controller, visible_columns = make_controller()
+    validated = []
+
+    def on_column_validated(result):
+        validated.append(result["column_name"])
+        controller.cancel()
+
+    assert controller.validate_columns(visible_columns, "T", on_column_validated) is None
+    assert validated == ["ID"]
+    assert controller.row_failures is None  # No se guarda una validación incompleta
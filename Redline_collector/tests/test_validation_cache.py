@@ -0,0 +1,148 @@
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from controllers.management.import_controller import ImportController
+from controllers.management.validation_cache import ValidationCache
+from core.db_connection import DatabaseConnection
+from models.table.metadata_cache import MetadataCache
+from models.table.table_model import TableModel
+
+
+@pytest.fixture(autouse=True)
+def cache_directory(tmp_path, monkeypatch):
+    # Las cachés se guardan bajo ./cache del directorio de trabajo
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_validation_cache_hits_only_for_same_data_and_ddl_time():
+    column = pd.Series(["a", "bb", None], dtype=object)
+    key = ValidationCache.column_key(column)
+    cache = ValidationCache("dev", "T", "2024-01-01")
+    cache.put("NAME", key, None, [2])
+    cache.save()
+
+    reopened = ValidationCache("dev", "T", "2024-01-01")
+    assert list(reopened.get("NAME", key)["error_rows"]) == [2]
+    assert reopened.get("NAME", ValidationCache.column_key(pd.Series(["a", "bb", "c"], dtype=object))) is None
+    assert ValidationCache("dev", "T", "2024-03-01").get("NAME", key) is None
+
+
+def test_validation_cache_stores_error_rows_as_ranges():
+    error_rows = np.r_[np.arange(1, 100001), [200000, 200002], np.arange(300000, 300011)]
+    cache = ValidationCache("dev", "T", "2024-01-01")
+    cache.put("NAME", "key", None, error_rows)
+    cache.save()
+
+    assert cache.columns["NAME"]["error_ranges"] == [[1, 100000], [200000, 200000], [200002, 200002],
+                                                     [300000, 300010]]
+    reopened = ValidationCache("dev", "T", "2024-01-01")
+    assert np.array_equal(reopened.get("NAME", "key")["error_rows"], error_rows)
+
+
+@pytest.mark.parametrize("positions", [[], [7], [3, 1, 2, 2, 9]])
+def test_ranges_round_trip(positions):
+    ranges = ValidationCache.to_ranges(positions)
+    assert list(ValidationCache.from_ranges(ranges)) == sorted(set(positions))
+
+
+@pytest.mark.parametrize("first, second", [
+    ([1, 2], ["1", "2"]),                # Mismo texto, distinto tipo
+    ([1, 2], [1.0, 2.0]),
+    ([None, 1], [np.nan, 1]),            # La regla NUMBER trata distinto None y NaN
+    (["a", "b"], ["b", "a"]),
+])
+def test_validation_cache_key_distinguishes_values_the_rules_distinguish(first, second):
+    key = ValidationCache.column_key
+    assert key(pd.Series(first, dtype=object)) != key(pd.Series(second, dtype=object))
+
+
+def test_validation_cache_key_depends_on_row_labels():
+    # Las filas con error se informan con el número de fila del archivo, que sale del índice
+    column = pd.Series(["a", "b"], dtype=object)
+    assert ValidationCache.column_key(column) != ValidationCache.column_key(column.set_axis([5, 6]))
+
+
+class FakeCursor:
+    def __init__(self, row):
+        self.row = row
+        self.executed = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def execute(self, query, **binds):
+        self.executed.append(binds)
+
+    def fetchone(self):
+        return self.row
+
+
+class FakeSession:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def cursor(self):
+        return self._cursor
+
+
+def test_fresh_ddl_time_is_read_from_the_database_and_invalidates_the_structure(monkeypatch):
+    metadata_cache = MetadataCache("dev", "APP")
+    metadata_cache.revalidate({"T": "2024-01-01"})
+    metadata_cache.put_structures({"T": {"validation": [["ID"]]}})
+    cursor = FakeCursor(("2024-02-01",))
+
+    @contextmanager
+    def session():
+        yield FakeSession(cursor)
+
+    model = TableModel()
+    monkeypatch.setattr(model, "_get_metadata_cache", lambda refresh=False: metadata_cache)
+    monkeypatch.setattr(DatabaseConnection, "session", session)
+
+    assert model.get_ddl_time("T") == "2024-01-01"  # Sin `fresh`, el valor de la caché de metadatos
+    assert model.get_ddl_time("T", fresh=True) == "2024-02-01"
+    assert cursor.executed == [{"table_name": "T"}]
+    assert metadata_cache.get_structure("T", "validation") is None
+
+
+class FakeTableController:
+    """
+    Controlador de tablas con un `last_ddl_time` fijo y una columna VARCHAR2(1).
+    """
+
+    def __init__(self):
+        self.ddl_requests = []
+
+    def ensure_connection_active(self):
+        pass
+
+    def get_table_structure_for_validation(self, table_name):
+        return [{"column_name": "CODE", "data_type": "VARCHAR2", "length": 1, "char_used": "C",
+                 "data_type_formatted": "VARCHAR2(1)"}]
+
+    def get_ddl_time(self, table_name, fresh=False):
+        self.ddl_requests.append(fresh)
+        return "2024-01-01"
+
+
+def test_cached_columns_rebuild_the_same_result(monkeypatch):
+    monkeypatch.setattr(DatabaseConnection, "get_active_connection_name", staticmethod(lambda: "dev"))
+    dataframe = pd.DataFrame({"CODE": ["a", "bb", "c", "dd"]}, dtype=object)
+    visible_columns = [{"column_name": "CODE", "data": dataframe["CODE"]}]
+    table_controller = FakeTableController()
+
+    first = ImportController(table_controller, dataframe).validate_columns(visible_columns, "T")
+    controller = ImportController(table_controller, dataframe)
+    monkeypatch.setattr(controller, "validate_column", lambda *args: pytest.fail("La columna no debía revalidarse"))
+    second = controller.validate_columns(visible_columns, "T")
+
+    assert first == second == [{"column_name": "CODE", "status": "Incorrecto", "errores": "3, 5"}]
+    assert table_controller.ddl_requests == [True, True]
+    assert controller.row_failures.failed_count == 2
@@ -0,0 +1,165 @@
+import numpy as np
+import pandas as pd
+
+from utils.module_utils import is_available
+
+CATEGORY_MAX_RATIO = 0.5  # Máxima proporción de valores distintos para guardar un texto como categoría
+MEMORY_SAMPLE_ROWS = 100000  # Filas muestreadas para estimar la memoria de las columnas object
+
+
+def prepare_dataframe(dataframe):
+    """
+    Normaliza un DataFrame cargado para su validación e importación:
+    convierte los valores a objetos de Python, reemplaza los nulos (NaN, NaT o NA) por None y
+    elimina las filas vacías. La conversión a objetos va primero para que también las columnas
+    respaldadas por Arrow (`pd.ArrowDtype`) reciban None y no `pd.NA`.
+    Se usa con los bloques acotados de `CsvChunkReader`; los DataFrames completos se normalizan
+    columna por columna con `compact_dataframe`, sin pasar todo el DataFrame a objetos.
+    """
+    dataframe = dataframe.astype(object)
+    dataframe = dataframe.where(pd.notnull(dataframe), None)
+    return dataframe.dropna(how="all")
+
+
+def compact_dataframe(dataframe):
+    """
+    Normaliza y reduce la memoria de un DataFrame recién leído sin cambiar sus valores, columna por
+    columna y partiendo de los tipos con que se leyó (nunca se convierte el DataFrame completo a objetos):
+    se eliminan las filas vacías, los nulos de las columnas object pasan a None, los textos con pocos
+    valores distintos pasan a categorías, el resto de los textos a cadenas Arrow (si pyarrow está
+    instalado), y los enteros y decimales a su tipo numérico más chico que los represente exactamente.
+    Las columnas respaldadas por Arrow (`pd.ArrowDtype`, de `CsvReader`) conservan su tipo, salvo los
+    textos con pocos valores distintos, que también pasan a categorías. Las columnas con tipos
+    mezclados quedan como objetos.
+    Los valores vuelven a ser objetos de Python al validarlos (`ColumnValidator.to_values`) y al
+    enlazarlos en la base de datos (`InsertStatement._to_bind_value`).
+    :param dataframe: DataFrame leído del archivo o normalizado con `prepare_dataframe`.
+    :return: DataFrame compacto con las filas no vacías, su índice y las mismas columnas.
+    """
+    # La máscara de filas con datos se acumula columna por columna para no crear otro DataFrame
+    filled = np.zeros(len(dataframe), dtype=bool)
+    for _, column in dataframe.items():
+        filled |= column.notna().to_numpy(dtype=bool)
+    keep_all = filled.all()
+    return pd.DataFrame(
+        {name: compact_column(column if keep_all else column[filled]) for name, column in dataframe.items()},
+        index=dataframe.index if keep_all else dataframe.index[filled], columns=dataframe.columns
+    )
+
+
+def compact_column(column):
+    """
+    Convierte una columna al tipo compacto que corresponde a sus valores.
+    :param column: Serie con los tipos de la lectura (NumPy, textos de pandas, Arrow u object).
+    :return: Serie compacta, o la columna con None en los nulos si no hay un tipo compacto sin pérdida.
+    """
+    dtype = column.dtype
+    if isinstance(dtype, pd.ArrowDtype):
+        if pd.api.types.is_string_dtype(dtype) and column.nunique(dropna=True) <= len(column) * CATEGORY_MAX_RATIO:
+            return column.astype("category")
+        return column
+    if isinstance(dtype, np.dtype) and dtype.kind in "iu":
+        return _compact_integers(column)
+    if isinstance(dtype, np.dtype) and dtype.kind == "f":
+        return _compact_floats(column)
+    if isinstance(dtype, pd.StringDtype):
+        return _compact_strings(column)
+    if dtype != object:
+        # Booleanos, fechas, categorías y enteros con nulos ya tienen una representación compacta
+        return column
+
+    column = column.where(column.notna(), None)
+    kind = pd.api.types.infer_dtype(column, skipna=True)
+    if kind == "integer":
+        return _compact_integers(column)
+    if kind == "floating":
+        return _compact_floats(column)
+    if kind == "string":
+        return _compact_strings(column)
+    return column
+
+
+def _compact_strings(column):
+    """
+    Convierte una columna de textos a categoría si tiene pocos valores distintos, o a cadenas Arrow
+    si pyarrow está instalado. Sin pyarrow, los textos de muchos valores distintos quedan como están.
+    """
+    if column.nunique(dropna=True) <= len(column) * CATEGORY_MAX_RATIO:
+        return column.astype("category")
+    stored_in_arrow = isinstance(column.dtype, pd.StringDtype) and column.dtype.storage == "pyarrow"
+    if is_available("pyarrow") and not stored_in_arrow:
+        return column.astype(pd.StringDtype("pyarrow"))
+    return column
+
+
+def _compact_integers(column):
+    """
+    Convierte una columna de enteros al entero más chico que contenga su rango; si tiene nulos se usa
+    el entero con nulos de pandas (Int8, Int16, ...). Los enteros fuera del rango de 64 bits quedan como objetos.
+    """
+    nulls = column.isna().to_numpy()
+    if column.dtype.kind == "u" and len(column) and column.max() > np.iinfo(np.int64).max:
+        return column  # Convertido a int64 cambiaría de signo
+    try:
+        values = column[~nulls].to_numpy(dtype=np.int64)
+    except (OverflowError, ValueError):
+        return column
+    low, high = (int(values.min()), int(values.max())) if len(values) else (0, 0)
+    dtype = next(np.dtype(candidate) for candidate in (np.int8, np.int16, np.int32, np.int64)
+                 if np.iinfo(candidate).min <= low and high <= np.iinfo(candidate).max)
+    if not nulls.any():
+        return pd.Series(values.astype(dtype), index=column.index, name=column.name)
+    nullable = pd.array(column.to_numpy(dtype=object), dtype="Int64").astype(f"Int{dtype.itemsize * 8}")
+    return pd.Series(nullable, index=column.index, name=column.name)
+
+
+def _compact_floats(column):
+    """
+    Convierte una columna de decimales a float32 si todos sus valores se representan exactamente,
+    o a float64 en caso contrario. Si tiene nulos se usa el decimal con nulos de pandas (Float32, Float64),
+    para que los nulos sigan siendo nulos (None) y no NaN, que la validación trata distinto.
+    """
+    nulls = column.isna().to_numpy()
+    values = column.to_numpy(dtype=np.float64, na_value=0.0)
+    dtype = np.dtype(np.float64)
+    if np.array_equal(values.astype(np.float32).astype(np.float64), values, equal_nan=True):
+        dtype = np.dtype(np.float32)
+    if not nulls.any():
+        return pd.Series(values.astype(dtype), index=column.index, name=column.name)
+    nullable = pd.arrays.FloatingArray(values.astype(dtype), nulls)
+    return pd.Series(nullable, index=column.index, name=column.name)
+
+
+def memory_usage(dataframe, sample_rows=MEMORY_SAMPLE_ROWS):
+    """
+    Calcula la memoria ocupada por un DataFrame, incluidos los objetos de Python de sus celdas.
+    En las columnas object (y de textos guardados como objetos de Python) de los DataFrames grandes
+    se estima a partir de una muestra de filas, porque medir cada objeto de millones de celdas tarda
+    más que la propia carga.
+    :param dataframe: DataFrame a medir.
+    :param sample_rows: Filas de la muestra para las columnas object.
+    :return: Cantidad de bytes (aproximada si se usó una muestra).
+    """
+    usage = dataframe.memory_usage(index=True, deep=False)
+    object_columns = [name for name, dtype in dataframe.dtypes.items()
+                      if dtype == object or (isinstance(dtype, pd.StringDtype) and dtype.storage == "python")]
+    if object_columns:
+        sample = dataframe[object_columns]
+        if len(sample) > sample_rows:
+            sample = sample.sample(sample_rows, random_state=0)
+        factor = len(dataframe) / max(len(sample), 1)
+        deep = sample.memory_usage(index=False, deep=True)
+        for name in object_columns:
+            usage[name] = deep[name] * factor
+    return int(usage.sum())
+
+
+def format_bytes(size):
+    """
+    Expresa una cantidad de bytes en la unidad más legible.
+    """
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}" if unit != "B" else f"{size} B"
+        size /= 1024
+    return f"{size:.1f} GB"
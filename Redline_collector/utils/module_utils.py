@@ -0,0 +1,10 @@
+import importlib.util
+
+
+def is_available(module_name):
+    """
+    Indica si un módulo opcional (pyarrow, python_calamine, ...) está instalado, sin importarlo.
+    :param module_name: Nombre del módulo.
+    :return: True si el módulo se puede importar.
+    """
+    return importlib.util.find_spec(module_name) is not None
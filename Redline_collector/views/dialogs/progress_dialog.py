@@ -24,13 +24,37 @@ class ProgressDialog(QDialog):
         layout.addWidget(self.cancel_button)
         self.setLayout(layout)
 
-    def update_progress(self, processed_records):
+    def update_progress(self, processed_records, committed_records=None):
         """
         Actualiza el progreso en la barra y la etiqueta.
+        :param processed_records: Registros procesados hasta el momento.
+        :param committed_records: Registros confirmados en la base de datos (opcional).
         """
-        self.label.setText(self.message_template.format(processed=processed_records, total=self.total_records))
+        message = self.message_template.format(processed=processed_records, total=self.total_records)
+        if committed_records is not None:
+            message += f"\nRegistros confirmados: {committed_records}"
+        self.label.setText(message)
         self.progress_bar.setValue(processed_records)
 
+    def update_stream_progress(self, bytes_read, total_bytes, processed_records, committed_records=None):
+        """
+        Actualiza el progreso de una importación por bloques, medido en bytes leídos del archivo.
+        :param bytes_read: Bytes del archivo leídos hasta el momento.
+        :param total_bytes: Tamaño total del archivo en bytes.
+        :param processed_records: Registros procesados hasta el momento.
+        :param committed_records: Registros confirmados en la base de datos (opcional).
+        """
+        message = (
+            f"Leídos: {bytes_read / 1048576:.1f} MB de {total_bytes / 1048576:.1f} MB\n"
+            f"Registros procesados: {processed_records}"
+        )
+        if committed_records is not None:
+            message += f"\nRegistros confirmados: {committed_records}"
+        self.label.setText(message)
+        # La barra se expresa en porcentaje para no desbordar el rango entero con archivos grandes
+        self.progress_bar.setMaximum(100)
+        self.progress_bar.setValue(int(bytes_read * 100 / total_bytes) if total_bytes else 0)
+
     def emit_cancel_signal(self):
         """
         Emite la señal de cancelación cuando se presiona el botón "Cancelar".
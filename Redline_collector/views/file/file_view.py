@@ -1,7 +1,8 @@
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLineEdit, QPushButton, QFileDialog, QHBoxLayout, QMessageBox
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLineEdit, QPushButton, QFileDialog, QHBoxLayout, QMessageBox, QCheckBox, QLabel
 from PyQt5.QtCore import Qt
 from views.file.file_content_view import FileContentView
 from controllers.file.file_controller import FileController
+from utils.dataframe_utils import format_bytes
 from utils.ui_styles import apply_style
 
 
@@ -36,12 +37,21 @@ class FileView(QWidget):
         self.view_data_button.clicked.connect(self.view_file_data)  # Conectar al método
         buttons_layout.addWidget(self.view_data_button)
 
+        # Opción para leer los CSV grandes por bloques en lugar de cargarlos completos en memoria
+        self.streaming_checkbox = QCheckBox("Leer CSV por bloques", self)
+        buttons_layout.addWidget(self.streaming_checkbox)
+
         # Centrar los botones en el layout horizontal
         buttons_layout.setAlignment(Qt.AlignCenter)
 
         # Añadir el layout horizontal de botones al layout principal
         main_layout.addLayout(buttons_layout)
 
+        # Memoria del archivo cargado antes y después de compactar sus columnas
+        self.memory_label = QLabel("", self)
+        self.memory_label.setAlignment(Qt.AlignCenter)
+        main_layout.addWidget(self.memory_label)
+
         # Establecer el layout principal
         self.setLayout(main_layout)
 
@@ -81,7 +91,7 @@ class FileView(QWidget):
         self.file_path_label.setText(file_name)
 
         # Intentar cargar el archivo utilizando el controlador
-        self.controller.load_file(file_name)
+        self.controller.load_file(file_name, streaming=self.streaming_checkbox.isChecked())
 
     def view_file_data(self):
         """
@@ -121,9 +131,25 @@ class FileView(QWidget):
         """
         if success:
             self.enable_view_data_button()
+            self.update_memory_label()
         else:
             self.disable_view_data_button()
             self.file_path_label.setText("")  # Limpiar la ruta del archivo
+            self.memory_label.setText("")
+
+    def update_memory_label(self):
+        """
+        Muestra la memoria del DataFrame tal como se leyó y ya compactado.
+        """
+        self.controller.get_dataframe()  # Normaliza y compacta una sola vez por carga
+        if not self.controller.memory_report:
+            self.memory_label.setText("")
+            return
+        before, after = self.controller.memory_report
+        saved = 100 * (1 - after / before) if before else 0
+        self.memory_label.setText(
+            f"Memoria: {format_bytes(before)} al leer, {format_bytes(after)} compacto ({saved:.0f}% menos)"
+        )
 
     def handle_error(self, message):
         """
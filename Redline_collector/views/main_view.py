@@ -174,22 +174,21 @@ class MainView(QWidget):
     def update_import_button_status(self):
         """Actualiza el estado del botón 'Importar Archivo'."""
         table_selected = self.table_view.combo_box.currentText()
-        dataframe = self.file_view.controller.get_dataframe()
 
-        self.import_button.setEnabled(dataframe is not None and not dataframe.empty and bool(table_selected))
+        self.import_button.setEnabled(bool(table_selected) and self.file_view.controller.has_data())
 
     def on_import_button_clicked(self):
         """Maneja el clic en el botón 'Importar Archivo'."""
         table_selected = self.table_view.combo_box.currentText()
-        dataframe = self.file_view.controller.get_dataframe()
 
-        if not dataframe.empty and table_selected:
-            self.show_import_view(table_selected, dataframe)
+        if table_selected and self.file_view.controller.has_data():
+            self.show_import_view(table_selected, self.file_view.controller.get_dataframe())
 
     def show_import_view(self, table_selected, dataframe):
         """Muestra la vista de importación."""
         table_view = self.table_view
-        self.import_view = ImportView(table_view, table_view, dataframe)
+        chunk_reader = self.file_view.controller.get_chunk_reader()
+        self.import_view = ImportView(table_view, table_selected, dataframe, chunk_reader)
         self.import_view.show()
 
     def update_table_view(self):
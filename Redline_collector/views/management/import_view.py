@@ -1,21 +1,34 @@
 from views.dialogs.progress_dialog import ProgressDialog
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QPushButton, QMessageBox, QAbstractItemView
+    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, QPushButton, QMessageBox,
+    QAbstractItemView, QLabel, QSpinBox, QComboBox
 )
-from PyQt5.QtCore import QTimer, QCoreApplication, Qt
-from controllers.management.import_controller import ImportController
+from PyQt5.QtCore import QTimer, QThread, Qt
+from controllers.management.import_controller import ImportController, DEFAULT_BATCH_SIZE
+from controllers.management.import_worker import ImportWorker
+from controllers.management.transaction_policy import TransactionPolicy
+from controllers.management.validation_worker import ValidationWorker
 from utils.ui_styles import apply_style
 
+PRECHECK_ROWS_SHOWN = 20  # Filas listadas por cada conflicto detectado antes de importar
+
+
 class ImportView(QWidget):
-    def __init__(self, table_view, table_name, dataframe):
+    def __init__(self, table_view, table_name, dataframe, chunk_reader=None):
         super().__init__()
         self.table_name = table_name
         self.dataframe = dataframe
         self.table_view = table_view
+        self.chunk_reader = chunk_reader  # Lector por bloques si el CSV se carga en modo streaming
 
         # Instanciar el controlador de la tabla
         table_controller = self.table_view.controller
-        self.import_controller = ImportController(table_controller, dataframe)
+        self.import_controller = ImportController(table_controller, dataframe, chunk_reader)
+        self.import_thread = None  # Hilo de la importación en curso
+        self.validation_thread = None  # Hilo de la validación de columnas
+        self.validation_results = []  # Resultados de validación por columna
+        self.precheck_messages = {}  # Líneas del resumen de verificaciones previas, por verificación
+        self.stream_bytes = (0, 0)  # Bytes leídos y totales en la lectura por bloques
 
         self.setWindowTitle("Importación de Archivos")
         self.init_ui()
@@ -36,6 +49,12 @@ class ImportView(QWidget):
         self.table_widget.setSortingEnabled(True)
         layout.addWidget(self.table_widget, stretch=2)
 
+        # Resumen de claves duplicadas y restricciones, informado antes de importar
+        self.precheck_label = QLabel(self)
+        self.precheck_label.setWordWrap(True)
+        self.precheck_label.hide()
+        layout.addWidget(self.precheck_label)
+
         # Crear la grilla para registros omitidos
         self.omitted_grid = QTableWidget()
         self.omitted_grid.setEditTriggers(QAbstractItemView.NoEditTriggers)
@@ -45,6 +64,31 @@ class ImportView(QWidget):
         # Cargar la estructura de la tabla y validaciones
         self.load_table_structure()
 
+        # Opciones de importación
+        options_layout = QHBoxLayout()
+        options_layout.addStretch()
+        options_layout.addWidget(QLabel("Filas por lote:"))
+        self.batch_size_spin = QSpinBox(self)
+        self.batch_size_spin.setRange(1, 50000)
+        self.batch_size_spin.setValue(DEFAULT_BATCH_SIZE)
+        options_layout.addWidget(self.batch_size_spin)
+
+        options_layout.addWidget(QLabel("Confirmar:"))
+        self.commit_mode_combo = QComboBox(self)
+        for mode, description in TransactionPolicy.MODES.items():
+            self.commit_mode_combo.addItem(description, mode)
+        self.commit_mode_combo.currentIndexChanged.connect(self.on_commit_mode_changed)
+        options_layout.addWidget(self.commit_mode_combo)
+
+        self.commit_interval_label = QLabel(self)
+        options_layout.addWidget(self.commit_interval_label)
+        self.commit_interval_spin = QSpinBox(self)
+        self.commit_interval_spin.setRange(1, 10000000)
+        options_layout.addWidget(self.commit_interval_spin)
+        self.on_commit_mode_changed()
+        options_layout.addStretch()
+        layout.addLayout(options_layout)
+
         # Botón para iniciar la importación
         self.import_button = QPushButton("Importar Datos", self)
         self.import_button.clicked.connect(self.import_data)
@@ -52,6 +96,9 @@ class ImportView(QWidget):
 
         self.setLayout(layout)
 
+        # Validar las columnas fuera del hilo de la interfaz
+        self.start_validation()
+
         # Ajustar tamaño de columnas y filas
         QTimer.singleShot(0, self.table_widget.resizeColumnsToContents)
         QTimer.singleShot(0, self.omitted_grid.resizeColumnsToContents)
@@ -64,9 +111,10 @@ class ImportView(QWidget):
 
     def load_table_structure(self):
         """
-        Carga la estructura de la tabla en la grilla principal y realiza las validaciones.
+        Carga la estructura de la tabla en la grilla principal y prepara las columnas a validar.
         """
         self.table_widget.setUpdatesEnabled(False)
+        self.table_widget.setSortingEnabled(False)
 
         # Obtener la estructura de las columnas desde el controlador
         columns = self.import_controller.load_table_structure(self.table_name)
@@ -80,41 +128,140 @@ class ImportView(QWidget):
             ["Nombre de Columna", "Tipo de Dato", "En Planilla", "Validación", "Errores"]
         )
 
-        # Crear lista con columnas coincidentes y datos únicos
+        # Crear lista con columnas coincidentes; el validador agrupa los valores repetidos
         dataframe_columns = set(self.dataframe.columns)
         visible_columns = [
-            {"column_name": col["column_name"], "data": self.dataframe[col["column_name"]].drop_duplicates()}
+            {"column_name": col["column_name"], "data": self.dataframe[col["column_name"]]}
             for col in columns if col["column_name"] in dataframe_columns
         ]
 
-        # Validar columnas y obtener resultados
-        validation_results = self.import_controller.validate_columns(visible_columns, self.table_name)
-
-        # Llenar la grilla principal con los resultados de validación
+        # Llenar la grilla principal; la validación se completa en segundo plano por columna
         for i, column in enumerate(columns):
             column_name = column["column_name"]
             column_type = column["data_type_formatted"]
+            in_dataframe = column_name in dataframe_columns
 
             self.table_widget.setItem(i, 0, QTableWidgetItem(column_name))
             self.table_widget.setItem(i, 1, QTableWidgetItem(column_type))
-            self.table_widget.setItem(i, 2, QTableWidgetItem("En Planilla" if column_name in dataframe_columns else "No Disponible"))
+            self.table_widget.setItem(i, 2, QTableWidgetItem("En Planilla" if in_dataframe else "No Disponible"))
+            self.table_widget.setItem(i, 3, QTableWidgetItem("Validando..." if in_dataframe else "No Validado"))
+            self.table_widget.setItem(i, 4, QTableWidgetItem(""))
 
-            validation_status = next(
-                (result["status"] for result in validation_results if result["column_name"] == column_name), "No Validado"
-            )
-            error_rows = next(
-                (result["errores"] for result in validation_results if result["column_name"] == column_name), "Ningún error"
-            )
-            self.table_widget.setItem(i, 3, QTableWidgetItem(validation_status))
-            self.table_widget.setItem(i, 4, QTableWidgetItem(str(error_rows)))
+        self.visible_columns = visible_columns
 
         # Configurar la grilla de omitidos
         matching_columns = [col["column_name"] for col in columns if col["column_name"] in dataframe_columns]
         self.setup_omitted_grid(matching_columns)
 
+        self.table_widget.setSortingEnabled(True)
         self.table_widget.setUpdatesEnabled(True)
         QTimer.singleShot(0, self.table_widget.resizeColumnsToContents)
 
+    def start_validation(self):
+        """
+        Inicia la validación de las columnas en un hilo secundario. La importación se habilita al terminar.
+        """
+        self.validation_thread = QThread(self)
+        self.validation_worker = ValidationWorker(self.import_controller, self.visible_columns, self.table_name)
+        self.validation_worker.moveToThread(self.validation_thread)
+
+        self.validation_thread.started.connect(self.validation_worker.run)
+        self.validation_worker.column_validated.connect(self.on_column_validated, Qt.QueuedConnection)
+        self.validation_worker.keys_checked.connect(self.on_keys_checked, Qt.QueuedConnection)
+        self.validation_worker.constraints_checked.connect(self.on_constraints_checked, Qt.QueuedConnection)
+        self.validation_worker.completed.connect(self.on_validation_completed, Qt.QueuedConnection)
+        self.validation_worker.failed.connect(self.on_validation_failed, Qt.QueuedConnection)
+        self.validation_worker.completed.connect(self.validation_thread.quit)
+        self.validation_worker.failed.connect(self.validation_thread.quit)
+        self.validation_thread.finished.connect(self.validation_worker.deleteLater)
+
+        self.import_button.setEnabled(False)
+        self.import_controller.is_cancelled = False
+        self.validation_thread.start()
+
+    def on_column_validated(self, result):
+        """
+        Muestra el resultado de una columna en cuanto el worker termina de validarla.
+        """
+        items = [item for item in self.table_widget.findItems(result["column_name"], Qt.MatchExactly)
+                 if item.column() == 0]
+        if not items:
+            return
+
+        # Sin ordenamiento mientras se actualiza, para que la fila no cambie de posición
+        self.table_widget.setSortingEnabled(False)
+        row = items[0].row()
+        self.table_widget.setItem(row, 3, QTableWidgetItem(result["status"]))
+        self.table_widget.setItem(row, 4, QTableWidgetItem(str(result["errores"])))
+        self.table_widget.setSortingEnabled(True)
+
+    @staticmethod
+    def rows_text(rows):
+        """
+        Lista los primeros números de fila de un conflicto para mostrarlos en el resumen.
+        """
+        shown = ", ".join(map(str, rows[:PRECHECK_ROWS_SHOWN]))
+        return shown + (", ..." if len(rows) > PRECHECK_ROWS_SHOWN else "")
+
+    def show_precheck_messages(self):
+        """
+        Muestra el resumen de las verificaciones previas a la importación (claves y restricciones).
+        """
+        lines = [line for messages in self.precheck_messages.values() for line in messages]
+        if not lines:
+            self.precheck_label.hide()
+            return
+        lines.append("Estas filas se omitirán al importar.")
+        self.precheck_label.setText("\n".join(lines))
+        self.precheck_label.show()
+
+    def on_keys_checked(self, summary):
+        """
+        Muestra las filas con clave primaria repetida en el archivo o ya existente en la tabla.
+        """
+        lines = []
+        if summary and (len(summary["in_file"]) or len(summary["in_table"])):
+            lines.append(f"Clave primaria ({', '.join(summary['key_columns'])}):")
+            if len(summary["in_file"]):
+                lines.append(f"{len(summary['in_file'])} filas con clave repetida en el archivo "
+                             f"(filas {self.rows_text(summary['in_file'])}); "
+                             f"se conserva la primera aparición de cada clave.")
+            if len(summary["in_table"]):
+                lines.append(f"{len(summary['in_table'])} filas con clave ya existente en la tabla "
+                             f"(filas {self.rows_text(summary['in_table'])}).")
+        self.precheck_messages["keys"] = lines
+        self.show_precheck_messages()
+
+    def on_constraints_checked(self, summary):
+        """
+        Muestra las filas con nulos en columnas obligatorias o claves foráneas sin registro padre.
+        """
+        lines = []
+        if summary:
+            for column_name, rows in summary["not_null"].items():
+                lines.append(f"{len(rows)} filas con {column_name} vacío (columna obligatoria) "
+                             f"(filas {self.rows_text(rows)}).")
+            for reference, rows in summary["foreign_keys"].items():
+                lines.append(f"{len(rows)} filas sin registro padre en {reference} "
+                             f"(filas {self.rows_text(rows)}).")
+        self.precheck_messages["constraints"] = lines
+        self.show_precheck_messages()
+
+    def on_validation_completed(self, results):
+        """
+        Habilita la importación cuando todas las columnas fueron validadas.
+        """
+        self.validation_results = results
+        self.import_button.setEnabled(True)
+        QTimer.singleShot(0, self.table_widget.resizeColumnsToContents)
+
+    def on_validation_failed(self, message):
+        """
+        Informa un error de la validación; la importación queda habilitada igualmente.
+        """
+        self.import_button.setEnabled(True)
+        QMessageBox.warning(self, "Validación", f"No se pudo completar la validación de columnas: {message}")
+
     def setup_omitted_grid(self, matching_columns):
         """
         Configura la grilla para mostrar registros omitidos.
@@ -123,59 +270,139 @@ class ImportView(QWidget):
         self.omitted_grid.setHorizontalHeaderLabels(matching_columns + ["Errores"])
         QTimer.singleShot(0, self.omitted_grid.resizeColumnsToContents)
 
+    def on_commit_mode_changed(self):
+        """
+        Ajusta el intervalo de confirmación según el modo de transacción elegido.
+        """
+        mode = self.commit_mode_combo.currentData()
+        if mode == TransactionPolicy.EVERY_ROWS:
+            self.commit_interval_label.setText("Filas:")
+            self.commit_interval_spin.setValue(TransactionPolicy.DEFAULT_ROWS)
+        elif mode == TransactionPolicy.EVERY_SECONDS:
+            self.commit_interval_label.setText("Segundos:")
+            self.commit_interval_spin.setValue(TransactionPolicy.DEFAULT_SECONDS)
+        self.commit_interval_label.setVisible(mode != TransactionPolicy.AT_END)
+        self.commit_interval_spin.setVisible(mode != TransactionPolicy.AT_END)
+
+    def get_transaction_policy(self):
+        """
+        Construye la política de transacciones seleccionada por el usuario.
+        """
+        return TransactionPolicy(self.commit_mode_combo.currentData(), self.commit_interval_spin.value())
+
     def import_data(self):
         """
-        Inicia el proceso de importación de datos y gestiona la interacción con la vista.
+        Inicia el proceso de importación de datos en un hilo secundario y gestiona la interacción con la vista.
         """
         try:
+            columns_to_insert = self.get_columns_to_insert(self.import_controller.get_table_columns(self.table_name))
+
             # Crear y mostrar el ProgressDialog
             total_records = len(self.dataframe)
-            progress_dialog = ProgressDialog(total_records, self)
-            progress_dialog.show()
-
-            # Conectar la señal de cancelación
-            progress_dialog.cancel_signal.connect(self.import_controller.cancel)
-
-            # Callback para manejar registros omitidos
-            def on_omitted(omitted_record):
-                self.add_omitted_record(omitted_record)
-
-            # Callback para actualizar la barra de progreso
-            def on_progress_update(processed, total):
-                progress_dialog.update_progress(processed)
-                QCoreApplication.processEvents()  # Mantener la UI responsiva
-
-            # Llamar al controlador para importar datos
-            result = self.import_controller.import_data(
-                table_name=self.table_name,
-                columns_to_insert=self.get_columns_to_insert(self.import_controller.get_table_columns(self.table_name)),
-                on_omitted_callback=on_omitted,
-                progress_callback=on_progress_update
+            self.progress_dialog = ProgressDialog(total_records, self)
+            self.progress_dialog.show()
+
+            # Preparar el worker que ejecuta la importación fuera del hilo de la interfaz
+            self.import_controller.is_cancelled = False
+            self.stream_bytes = (0, self.chunk_reader.total_bytes if self.chunk_reader is not None else 0)
+            self.import_thread = QThread(self)
+            self.import_worker = ImportWorker(
+                self.import_controller,
+                self.table_name,
+                columns_to_insert,
+                batch_size=self.batch_size_spin.value(),
+                transaction_policy=self.get_transaction_policy(),
+                row_failures=self.import_controller.row_failures
             )
+            self.import_worker.moveToThread(self.import_thread)
+
+            # Las señales del worker llegan encoladas al hilo de la interfaz
+            self.import_thread.started.connect(self.import_worker.run)
+            self.import_worker.progress.connect(self.on_import_progress, Qt.QueuedConnection)
+            self.import_worker.bytes_read.connect(self.on_bytes_read, Qt.QueuedConnection)
+            self.import_worker.omitted.connect(self.add_omitted_record, Qt.QueuedConnection)
+            self.import_worker.completed.connect(self.on_import_completed, Qt.QueuedConnection)
+            self.import_worker.failed.connect(self.on_import_failed, Qt.QueuedConnection)
+            self.import_worker.completed.connect(self.import_thread.quit)
+            self.import_worker.failed.connect(self.import_thread.quit)
+            self.import_thread.finished.connect(self.import_worker.deleteLater)
+
+            # La cancelación solo levanta un flag que el worker revisa entre lotes
+            self.progress_dialog.cancel_signal.connect(self.import_worker.cancel, Qt.DirectConnection)
 
-            # Cerrar el diálogo de progreso al finalizar
-            progress_dialog.close_dialog()
-
-            # Mostrar un resumen del proceso
-            if result["cancelled"]:
-                QMessageBox.warning(
-                    self,
-                    "Importación cancelada",
-                    f"El proceso de importación fue cancelado.\n"
-                    f"Registros insertados: {result['inserted']}\n"
-                    f"Registros omitidos: {result['errors']}"
-                )
-            else:
-                QMessageBox.information(
-                    self,
-                    "Importación completada",
-                    f"Registros insertados: {result['inserted']}\n"
-                    f"Registros omitidos: {result['errors']}"
-                )
+            self.import_button.setEnabled(False)
+            self.import_thread.start()
 
         except Exception as e:
             QMessageBox.critical(self, "Error crítico", f"Se produjo un error durante la importación: {e}")
 
+    def on_import_progress(self, processed, total, committed):
+        """
+        Actualiza la barra de progreso con el avance informado por el worker.
+        """
+        if self.chunk_reader is not None:
+            bytes_read, total_bytes = self.stream_bytes
+            self.progress_dialog.update_stream_progress(bytes_read, total_bytes, processed, committed)
+        else:
+            self.progress_dialog.update_progress(processed, committed)
+
+    def on_bytes_read(self, bytes_read, total_bytes):
+        """
+        Registra los bytes leídos del archivo en la lectura por bloques.
+        """
+        self.stream_bytes = (bytes_read, total_bytes)
+
+    def on_import_completed(self, result):
+        """
+        Muestra el resumen del proceso cuando el worker termina la importación.
+        """
+        # Cerrar el diálogo de progreso al finalizar
+        self.progress_dialog.close_dialog()
+        self.import_button.setEnabled(True)
+        QTimer.singleShot(0, self.omitted_grid.resizeColumnsToContents)
+
+        # Mostrar un resumen del proceso
+        if result["cancelled"]:
+            QMessageBox.warning(
+                self,
+                "Importación cancelada",
+                f"El proceso de importación fue cancelado.\n"
+                f"Registros insertados: {result['inserted']}\n"
+                f"Registros confirmados: {result['committed']}\n"
+                f"Registros omitidos: {result['errors']}"
+            )
+        else:
+            QMessageBox.information(
+                self,
+                "Importación completada",
+                f"Registros insertados: {result['inserted']}\n"
+                f"Registros confirmados: {result['committed']}\n"
+                f"Registros omitidos: {result['errors']}"
+            )
+
+    def on_import_failed(self, message):
+        """
+        Informa un error que interrumpió la importación.
+        """
+        self.progress_dialog.close_dialog()
+        self.import_button.setEnabled(True)
+        QMessageBox.critical(self, "Error crítico", f"Se produjo un error durante la importación: {message}")
+
+    def closeEvent(self, event):
+        """
+        Cancela y espera la importación o la validación en curso antes de cerrar la ventana.
+        La cancelación se verifica entre lotes y entre columnas: la espera dura a lo sumo un lote o una columna.
+        """
+        if self.import_thread is not None and self.import_thread.isRunning():
+            self.import_controller.cancel()
+            self.import_thread.quit()
+            self.import_thread.wait()
+        if self.validation_thread is not None and self.validation_thread.isRunning():
+            self.import_controller.cancel()
+            self.validation_thread.quit()
+            self.validation_thread.wait()
+        super().closeEvent(event)
+
     def get_columns_to_insert(self, columns):
         """
         Obtiene las columnas comunes entre la tabla y el DataFrame.
@@ -200,5 +427,3 @@ class ImportView(QWidget):
         self.omitted_grid.insertRow(row_count)
         for col_idx, (key, value) in enumerate(record.items()):
             self.omitted_grid.setItem(row_count, col_idx, QTableWidgetItem(str(value)))
-
-        self.omitted_grid.resizeColumnsToContents()
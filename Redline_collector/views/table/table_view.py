@@ -40,6 +40,12 @@ class TableView(QWidget):
         self.show_table_button.clicked.connect(self.show_table_details)
         right_layout.addWidget(self.show_table_button)
 
+        # Botón para descartar la caché de metadatos y recargar las tablas
+        self.refresh_button = QPushButton("Actualizar Tablas", self)
+        self.refresh_button.setEnabled(False)  # Deshabilitar al inicio
+        self.refresh_button.clicked.connect(self.refresh_tables)
+        right_layout.addWidget(self.refresh_button)
+
         # Centrar el botón verticalmente
         right_layout.setAlignment(self.show_table_button, Qt.AlignVCenter)
 
@@ -73,6 +79,7 @@ class TableView(QWidget):
         self.combo_box.setEnabled(enabled)
         self.search_box.setEnabled(enabled)
         self.show_table_button.setEnabled(enabled)
+        self.refresh_button.setEnabled(enabled)
 
     def populate_combo_box(self, tables):
         """
@@ -91,6 +98,12 @@ class TableView(QWidget):
             self.details_window = TableDetailsView(table_name, table_structure)
             self.details_window.show()
 
+    def refresh_tables(self):
+        """
+        Recarga la lista de tablas ignorando la caché de metadatos.
+        """
+        self.controller.refresh_tables()
+
     def load_tables_for_connection(self, connection):
         try:
             # Llamamos al método correcto para cargar las tablas, sin pasar el argumento de conexión